@@ -0,0 +1,202 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from DriverManager.BrowserManager import BrowserManager
+
+
+def _close_started_browser(future):
+    """
+    Cierra el navegador de un arranque que ya nadie espera. Se ejecuta cuando el arranque termina.
+
+    :param future: Future del arranque en el hilo de la sesión.
+
+    :type future: concurrent.futures.Future
+    """
+    if future.cancelled() or future.exception() is not None:
+        return
+    try:
+        future.result().close_browser()
+    except Exception as error:
+        print(f"\n\t*** = ***\nError: No se pudo cerrar el navegador de un arranque cancelado: {error}")
+
+
+class AsyncBrowserManager:
+    """
+    Versión asyncio de BrowserManager.
+
+    Cada sesión tiene su propio hilo de ejecución (un WebDriver no admite llamadas simultáneas), así que
+    un único event loop puede manejar muchas sesiones a la vez sin bloquearse.
+    Los métodos aceptan 'timeout' y pueden cancelarse: la corrutina termina enseguida, pero la orden ya enviada
+    al navegador sigue hasta acabar y las siguientes llamadas de esa sesión esperan detrás de ella.
+
+    Se crea con 'await AsyncBrowserManager.create(browser_type)' o 'async with AsyncBrowserManager(browser_type)'.
+    """
+    def __init__(self, browser_type, wait_strategy=None, timeout=None, profile=None):
+        """
+        Prepara la sesión sin arrancar el navegador. El navegador se arranca con start().
+
+        :param browser_type: Tipo de navegador a usar. Acepta "chrome" y "firefox".
+        :param wait_strategy: Estrategia de espera tras cada acción. Ver BrowserManager.
+        :param timeout: Segundos máximos por llamada si el método no recibe otro. None no limita.
+        :param profile: Perfil de arranque del navegador. Ver BrowserManager.
+
+        :type browser_type: str
+        :type wait_strategy: WaitStrategy
+        :type timeout: float or None
+        :type profile: str or LaunchProfile
+        """
+        self.browser_type = browser_type
+        self.profile = profile
+        self.wait_strategy = wait_strategy
+        self.timeout = timeout
+        self.browser = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"browser-{browser_type}")
+
+    @classmethod
+    async def create(cls, browser_type, wait_strategy=None, timeout=None, profile=None):
+        """
+        Crea la sesión y arranca el navegador.
+
+        :return: La sesión con el navegador ya arrancado.
+        :rtype: AsyncBrowserManager
+
+        :raises ValueError: Si el tipo de navegador o el perfil no son soportados.
+        """
+        manager = cls(browser_type, wait_strategy, timeout, profile)
+        try:
+            await manager.start()
+        except BaseException:
+            manager.executor.shutdown(wait=False)
+            raise
+        return manager
+
+    async def _run(self, func, *args, timeout=None):
+        """
+        Ejecuta 'func(*args)' en el hilo de la sesión y espera su resultado.
+
+        :raises asyncio.TimeoutError: Si la llamada tarda más de 'timeout' segundos.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        future = asyncio.get_running_loop().run_in_executor(self.executor, partial(func, *args))
+        return await asyncio.wait_for(future, timeout)
+
+    async def start(self, timeout=None):
+        """
+        Arranca el navegador en el hilo de la sesión.
+
+        Si se agota el tiempo o se cancela, el arranque ya empezado no se puede interrumpir: el navegador
+        se cierra en cuanto termina de arrancar, para no dejar procesos huérfanos.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        future = self.executor.submit(BrowserManager, self.browser_type, self.wait_strategy, self.profile)
+        try:
+            self.browser = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            future.add_done_callback(_close_started_browser)
+            raise
+
+    async def open_browser(self, url, timeout=None):
+        """
+        Versión asíncrona de BrowserManager.open_browser().
+        """
+        return await self._run(self.browser.open_browser, url, timeout=timeout)
+
+    async def close_browser(self, timeout=None):
+        """
+        Cierra el navegador y libera el hilo de la sesión.
+        """
+        try:
+            if self.browser is not None:
+                await self._run(self.browser.close_browser, timeout=timeout)
+        finally:
+            self.browser = None
+            self.executor.shutdown(wait=False)
+
+    async def reset_session(self, timeout=None):
+        """
+        Versión asíncrona de BrowserManager.reset_session().
+        """
+        return await self._run(self.browser.reset_session, timeout=timeout)
+
+    async def select_element(self, selector_type, selector, seconds, timeout=None):
+        """
+        Versión asíncrona de BrowserManager.select_element().
+        """
+        return await self._run(self.browser.select_element, selector_type, selector, seconds, timeout=timeout)
+
+    async def select_all_elements(self, selector_type, selector, timeout=None):
+        """
+        Versión asíncrona de BrowserManager.select_all_elements().
+        """
+        return await self._run(self.browser.select_all_elements, selector_type, selector, timeout=timeout)
+
+    async def select_element_by_text(self, text, seconds, timeout=None):
+        """
+        Versión asíncrona de BrowserManager.select_element_by_text().
+        """
+        return await self._run(self.browser.select_element_by_text, text, seconds, timeout=timeout)
+
+    async def write(self, text, selector_type, selector, seconds, timeout=None):
+        """
+        Versión asíncrona de BrowserManager.write().
+        """
+        return await self._run(self.browser.write, text, selector_type, selector, seconds, timeout=timeout)
+
+    async def click(self, selector_type, selector, seconds, timeout=None):
+        """
+        Versión asíncrona de BrowserManager.click().
+        """
+        return await self._run(self.browser.click, selector_type, selector, seconds, timeout=timeout)
+
+    async def fill_form(self, fields, submit_selector=None, selector_type='xpath', seconds=0, mode='script',
+                        timeout=None):
+        """
+        Versión asíncrona de BrowserManager.fill_form().
+        """
+        return await self._run(self.browser.fill_form, fields, submit_selector, selector_type, seconds, mode,
+                               timeout=timeout)
+
+    async def login(self, loginpage, seconds, mode='script', timeout=None):
+        """
+        Versión asíncrona de BrowserManager.login().
+        """
+        return await self._run(self.browser.login, loginpage, seconds, mode, timeout=timeout)
+
+    async def load_table_snapshot(self, selector='table', timeout=None):
+        """
+        Versión asíncrona de BrowserManager.load_table_snapshot().
+        """
+        return await self._run(self.browser.load_table_snapshot, selector, timeout=timeout)
+
+    async def get_row_by_text(self, text, seconds, timeout=None):
+        """
+        Versión asíncrona de BrowserManager.get_row_by_text().
+        """
+        return await self._run(self.browser.get_row_by_text, text, seconds, timeout=timeout)
+
+    async def get_row_children(self, text, seconds, timeout=None):
+        """
+        Versión asíncrona de BrowserManager.get_row_children().
+        """
+        return await self._run(self.browser.get_row_children, text, seconds, timeout=timeout)
+
+    async def get_cell(self, text, column, seconds, timeout=None):
+        """
+        Versión asíncrona de BrowserManager.get_cell().
+        """
+        return await self._run(self.browser.get_cell, text, column, seconds, timeout=timeout)
+
+    async def __aenter__(self):
+        if self.browser is None:
+            try:
+                await self.start()
+            except BaseException:
+                self.executor.shutdown(wait=False)
+                raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close_browser()
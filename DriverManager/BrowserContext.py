@@ -0,0 +1,242 @@
+import time
+
+from selenium.common import WebDriverException
+from selenium.webdriver.common.by import By
+
+from DriverManager.BrowserManager import FILL_FORM_SCRIPT
+from DriverManager.WaitStrategy import MARK_ACTION_SCRIPT, PageSettled
+
+# Marca la ventana actual; la página nueva no la tendrá, así se sabe que la navegación ya ocurrió
+MARK_NAVIGATION_SCRIPT = "window.__dmNavigationPending = true;"
+NAVIGATION_DONE_SCRIPT = "return window.__dmNavigationPending === undefined && document.readyState === 'complete';"
+
+
+class BrowserContext:
+    """
+    Pestaña de un BrowserManager con sus propias cookies y almacenamiento, creada con BrowserManager.new_context().
+
+    Muchas sesiones comparten así un único proceso de navegador. Todas las pestañas usan el mismo driver, que solo
+    atiende una ventana cada vez: cada orden toma el cerrojo del driver y cambia a su ventana, y las esperas
+    (cargas de página, elementos que aparecen) sueltan el cerrojo entre comprobaciones, de modo que mientras una
+    pestaña espera las demás avanzan. Las navegaciones no bloquean el driver: se lanzan con un script y se espera
+    a que terminen comprobando periódicamente.
+
+    En Chrome cada pestaña es un contexto de navegador aislado (Target.createBrowserContext), con sus propias
+    cookies. Firefox no permite crear contextos aislados con WebDriver clásico: las pestañas comparten cookies.
+    """
+    def __init__(self, browser, handle, context_id=None):
+        """
+        :param browser: Navegador al que pertenece la pestaña.
+        :param handle: Identificador de la ventana en WebDriver.
+        :param context_id: Identificador CDP del contexto aislado, o None si es una pestaña normal.
+
+        :type browser: BrowserManager
+        :type handle: str
+        :type context_id: str or None
+        """
+        self.browser = browser
+        self.handle = handle
+        self.context_id = context_id
+
+    def _run(self, func):
+        """
+        Ejecuta 'func(driver)' con el cerrojo del driver tomado y la ventana de esta pestaña activa.
+        """
+        with self.browser.driver_lock:
+            if self.browser.current_handle != self.handle:
+                self.browser.driver.switch_to.window(self.handle)
+                self.browser.current_handle = self.handle
+            return func(self.browser.driver)
+
+    def _wait(self, condition, timeout):
+        """
+        Comprueba 'condition(driver)' en la ventana de la pestaña hasta que devuelva un valor verdadero,
+        soltando el cerrojo del driver entre comprobaciones.
+
+        :return: El valor devuelto por la condición, o None si se agotó el tiempo.
+        """
+        poll_frequency = self.browser.waits.poll_frequency
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                value = self._run(condition)
+                if value:
+                    return value
+            except WebDriverException:
+                # Durante una navegación la comprobación puede fallar; se repite en la siguiente
+                pass
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_frequency)
+
+    def open_browser(self, url, timeout=30):
+        """
+        Abre la URL en la pestaña y espera a que termine de cargar sin bloquear al resto de pestañas.
+
+        :param url: URL que se va a abrir.
+        :param timeout: Segundos máximos de espera de la carga.
+
+        :type url: str
+        :type timeout: float
+
+        :return: True si la página terminó de cargar a tiempo.
+        :rtype: bool
+        """
+        self._run(lambda driver: driver.execute_script(MARK_NAVIGATION_SCRIPT + " window.location.href = arguments[0];",
+                                                       url))
+        return bool(self._wait(lambda driver: driver.execute_script(NAVIGATION_DONE_SCRIPT), timeout))
+
+    def select_element(self, selector_type, selector, seconds, timeout=None):
+        """
+        Espera a que un elemento sea visible en la pestaña y lo desplaza a la vista.
+
+        :param selector_type: Acepta los valores 'xpath', 'id', 'css', 'name' y 'link'.
+        :param selector: El valor del selector.
+        :param seconds: Tiempo en segundos a esperar si el throttling está activado.
+        :param timeout: Segundos máximos de espera. Por defecto el 'timeout' de la política de reintentos.
+
+        :type selector_type: str
+        :type selector: str
+        :type seconds: float
+        :type timeout: float
+
+        :return: El elemento, o None si no apareció. Solo debe usarse a través de los métodos de esta pestaña.
+        :rtype: WebElement
+        """
+        by_mapping = {
+            'xpath': By.XPATH,
+            'id': By.ID,
+            'css': By.CSS_SELECTOR,
+            'name': By.NAME,
+            'link': By.PARTIAL_LINK_TEXT
+        }
+        if selector_type not in by_mapping:
+            print(f"Error: Tipo de selector '{selector_type}' no es válido.")
+            return None
+        if timeout is None:
+            timeout = self.browser.retry_policy.timeout
+
+        def visible(driver):
+            for element in driver.find_elements(by_mapping[selector_type], selector):
+                if element.is_displayed():
+                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                    return element
+            return None
+
+        element = self._wait(visible, timeout)
+        if element is None:
+            print(f"\n\t*** = ***\nTimeout: No se pudo encontrar el elemento con selector: {selector} en la pestaña "
+                  f"{self.handle}.")
+            return None
+        self.browser.waits.pause(seconds)
+        return element
+
+    def write(self, text, selector_type, selector, seconds):
+        """
+        Escribe el texto en un campo de entrada de la pestaña.
+
+        :return: True si se encontró el campo.
+        :rtype: bool
+        """
+        element = self.select_element(selector_type, selector, seconds)
+        if element is None:
+            return False
+
+        def write(driver):
+            element.clear()
+            element.send_keys(text)
+
+        self._run(write)
+        self.browser.waits.pause(seconds)
+        return True
+
+    def click(self, selector_type, selector, seconds, timeout=None):
+        """
+        Hace clic en un elemento de la pestaña y espera a que la página se estabilice: la página nueva si el clic
+        navega, o la misma página si no (formularios de aplicaciones de una sola página). Ver _wait_after_submit().
+
+        :param timeout: Segundos máximos de espera. Por defecto el 'timeout' de WaitStrategy.
+
+        :return: True si se encontró el elemento.
+        :rtype: bool
+        """
+        element = self.select_element(selector_type, selector, seconds)
+        if element is None:
+            return False
+        # Clic por script: no bloquea el driver mientras carga la página siguiente
+        self._run(lambda driver: driver.execute_script(MARK_ACTION_SCRIPT + " arguments[0].click();", element))
+        self._wait_after_submit(timeout)
+        self.browser.waits.pause(seconds)
+        return True
+
+    def _wait_after_submit(self, timeout):
+        """
+        Espera a que la página se estabilice tras un clic o un envío marcado con MARK_ACTION_SCRIPT. Ver PageSettled:
+        mientras la página anterior se descarga se sigue esperando, y si el clic no navega basta con que la misma
+        página se estabilice, sin agotar el tiempo.
+        """
+        waits = self.browser.waits
+        self._wait(PageSettled(waits.idle_time, waits.quiet_timeout, waits.min_wait),
+                   timeout if timeout is not None else waits.timeout)
+
+    def login(self, loginpage, seconds, timeout=30):
+        """
+        Realiza el login del LoginPage en la pestaña: abre la página, rellena usuario y contraseña y pulsa el botón
+        en una sola llamada al navegador (como BrowserManager.fill_form()) y espera a que la página se estabilice,
+        navegue o no el envío. Ver _wait_after_submit().
+
+        :param loginpage: Objeto que contiene la URL y los selectores necesarios para el login.
+        :param seconds: Tiempo en segundos a esperar si el throttling está activado.
+        :param timeout: Segundos máximos de espera de la carga de la página y del envío del formulario.
+
+        :type loginpage: LoginPage
+        :type seconds: float
+        :type timeout: float
+
+        :return: True si se rellenó y envió el formulario.
+        :rtype: bool
+        """
+        if not self.open_browser(loginpage.url, timeout):
+            print(f"\n\t*** = ***\nTimeout: La página {loginpage.url} no terminó de cargar en la pestaña {self.handle}.")
+            return False
+        if self.select_element('xpath', loginpage.username_selector, seconds, timeout) is None:
+            return False
+        fields = [[loginpage.username_selector, loginpage.credentials.username],
+                  [loginpage.pwd_selector, loginpage.credentials.pwd]]
+        missing = self._run(lambda driver: driver.execute_script(
+            MARK_ACTION_SCRIPT + FILL_FORM_SCRIPT, fields, loginpage.login_button_selector, 'xpath'))
+        if missing:
+            print(f"\n\t*** = ***\nError: No se encontraron los campos {missing} del formulario.")
+            return False
+        self._wait_after_submit(timeout)
+        self.browser.waits.pause(seconds)
+        return True
+
+    def get_cookies(self):
+        """
+        Devuelve las cookies de la pestaña.
+
+        :rtype: list[dict]
+        """
+        return self._run(lambda driver: driver.get_cookies())
+
+    def execute_script(self, script, *args):
+        """
+        Ejecuta JavaScript en la pestaña.
+        """
+        return self._run(lambda driver: driver.execute_script(script, *args))
+
+    def close(self):
+        """
+        Cierra la pestaña y vuelve a la ventana principal, para que los métodos de BrowserManager y las órdenes
+        CDP tengan una ventana activa. En Chrome descarta además su contexto aislado con sus cookies.
+        """
+        def close(driver):
+            driver.close()
+            self.browser.current_handle = None
+            driver.switch_to.window(self.browser.main_handle)
+            self.browser.current_handle = self.browser.main_handle
+            if self.context_id is not None:
+                driver.execute_cdp_cmd('Target.disposeBrowserContext', {'browserContextId': self.context_id})
+
+        self._run(close)
@@ -1,38 +1,144 @@
-import os
+import functools
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from selenium import webdriver
-from selenium.common import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common import TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException, \
+    JavascriptException
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from DriverManager.DriverService import find_driver_path, get_shared_service
+from DriverManager.Instrumentation import NULL_INSTRUMENTATION, traced
+from DriverManager.LaunchProfile import get_profile
+from DriverManager.LocatorCache import LocatorCache
+from DriverManager.LocatorTemplate import ELEMENT_BY_TEXT, ELEMENT_BY_EXACT_TEXT, ROW_BY_TEXT
 from DriverManager.LoginPage import LoginPage
+from DriverManager.RetryPolicy import RetryPolicy
+from DriverManager.TableData import TextGrid, grid_to_columns, to_frame
+from DriverManager.TableStream import TableStream
+from DriverManager.TextIndex import TextIndex
+from DriverManager.WaitStrategy import MARK_ACTION_SCRIPT, WaitStrategy
 from selenium.webdriver.remote.webelement import WebElement
 
 
+# Rellena los campos y pulsa el botón en una sola llamada. Devuelve los selectores que no encuentra.
+FILL_FORM_SCRIPT = """
+    var fields = arguments[0], submit = arguments[1], type = arguments[2];
+    function find(selector) {
+        if (type === 'xpath') {
+            return document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        if (type === 'id') return document.getElementById(selector);
+        if (type === 'name') return document.getElementsByName(selector)[0] || null;
+        return document.querySelector(selector);
+    }
+
+    var missing = [], elements = [];
+    for (var i = 0; i < fields.length; i++) {
+        var element = find(fields[i][0]);
+        if (!element) missing.push(fields[i][0]);
+        elements.push(element);
+    }
+    var button = submit ? find(submit) : null;
+    if (submit && !button) missing.push(submit);
+    if (missing.length) return missing;
+
+    // Setter nativo de la clase del elemento (input, textarea, select...): los frameworks que envuelven 'value'
+    // en la instancia también detectan el cambio. Los elementos editables sin 'value' reciben el texto.
+    function setValue(element, value) {
+        if (element.isContentEditable) {
+            element.textContent = value;
+            return;
+        }
+        var proto = Object.getPrototypeOf(element), descriptor;
+        while (proto && !(descriptor = Object.getOwnPropertyDescriptor(proto, 'value'))) {
+            proto = Object.getPrototypeOf(proto);
+        }
+        if (descriptor && descriptor.set) descriptor.set.call(element, value);
+        else element.value = value;
+    }
+
+    for (var i = 0; i < elements.length; i++) {
+        var element = elements[i];
+        element.focus();
+        setValue(element, fields[i][1]);
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+        element.blur();
+    }
+    if (button) button.click();
+    return missing;
+"""
+
+
+def normalize_text(text):
+    """
+    Normaliza el texto de una celda para las claves de la instantánea de tablas: quita los espacios
+    del principio y del final y reduce a uno los espacios interiores, como normalize-space() de XPath.
+
+    :type text: str
+
+    :rtype: str
+    """
+    return ' '.join(text.split())
+
+
+def on_main_window(method):
+    """
+    Decorador para métodos de BrowserManager que usan el driver: toman el cerrojo del driver y activan
+    la ventana principal, por si una pestaña de new_context() dejó activa la suya.
+
+    Mientras dura el método las pestañas esperan su turno; el cerrojo es reentrante, así que un método
+    decorado puede llamar a otros.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.driver_lock:
+            self._use_main_window()
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class BrowserManager:
-    def __init__(self, browser_type):
+    def __init__(self, browser_type, wait_strategy=None, profile=None, shared_service=True, instrumentation=None,
+                 retry_policy=None, lifecycle=None, request_filter=None):
         """
         Inicializa el driver basado en el navegador seleccionado.
 
         :param browser_type: Tipo de navegador a usar. Acepta "chrome" y "firefox".
+        :param wait_strategy: Estrategia de espera tras cada acción. Por defecto WaitStrategy(), que espera
+                              a condiciones reales. Usa WaitStrategy(throttle=True) para dormir además 'seconds'.
+        :param profile: Perfil de arranque ('default', 'headless', 'lean') o un LaunchProfile. Por defecto 'default'.
+        :param shared_service: Si es True, Chrome usa un único chromedriver compartido por todo el proceso en lugar
+                               de arrancar uno por instancia. Firefox siempre usa su propio geckodriver.
+        :param instrumentation: Instrumentation que registra tiempos de órdenes, esperas, pausas, reintentos
+                                y aciertos de caché. Por defecto no se registra nada.
+        :param retry_policy: Política de esperas y reintentos para localizar elementos. Por defecto RetryPolicy(),
+                             que mantiene 2 intentos de 20 segundos.
+        :param lifecycle: SessionLifecycle que mide la memoria del navegador y lo recicla con recycle() al superar
+                          los límites. Debe ser uno por BrowserManager. Por defecto no se recicla.
+        :param request_filter: RequestFilter con las listas de URLs bloqueadas y hosts permitidos y la caché en disco.
+                               Por defecto no se filtra ninguna petición.
 
         :type browser_type: str
-
-        :raises ValueError: Si el tipo de navegador no es soportado.
+        :type wait_strategy: WaitStrategy
+        :type profile: str or LaunchProfile
+        :type shared_service: bool
+        :type instrumentation: Instrumentation
+        :type retry_policy: RetryPolicy
+        :type lifecycle: SessionLifecycle
+        :type request_filter: RequestFilter
+
+        :raises ValueError: Si el tipo de navegador o el perfil no son soportados.
         """
-        # Rutas dinámicas para los webdrivers
-        base_dir = os.path.dirname(os.path.abspath(__file__))  # Obtiene directorio actual del archivo que lo ejecuta
-        chrome_driver_path = os.path.join(base_dir, "webdrivers", "chromedriver.exe")  # Construye la ruta absoluta
-        gecko_driver_path = os.path.join(base_dir, "webdrivers", "geckodriver.exe")  # Construye la ruta absoluta
-
         # Diccionario para mapear el navegador con el servicio y el driver correspondiente
         browser_mapping = {
-            'chrome': (ChromeService, webdriver.Chrome, chrome_driver_path),
-            'firefox': (FirefoxService, webdriver.Firefox, gecko_driver_path)
+            'chrome': (ChromeService, webdriver.Chrome),
+            'firefox': (FirefoxService, webdriver.Firefox)
         }
 
         # Convertir el input a minúsculas para asegurar la correspondencia
@@ -40,37 +146,320 @@ class BrowserManager:
 
         # Verificar si el navegador está soportado
         if browser_type in browser_mapping:
-            service_class, driver_class, driver_path = browser_mapping[browser_type]
-            self.service = service_class(executable_path=driver_path)
-            self.driver = driver_class(service=self.service)
+            self.browser_type = browser_type
+            self.profile = get_profile(profile)
+            self.shared_service = shared_service
+            self._driver_classes = browser_mapping[browser_type]
         else:
             raise ValueError("Navegador no soportado. Usa 'chrome' o 'firefox'.")
 
+        self.instrumentation = instrumentation if instrumentation is not None else NULL_INSTRUMENTATION
+        self.request_filter = request_filter
+        # Filtro de arranque, que reset_session() restablece si login() aplicó el de un LoginPage
+        self._launch_request_filter = request_filter
+        # Las pestañas de new_context() comparten el driver: cada orden toma el cerrojo y cambia de ventana
+        self.driver_lock = threading.RLock()
+        self._start_driver()
+
+        self.waits = wait_strategy if wait_strategy is not None else WaitStrategy()
+        if instrumentation is not None:
+            self.waits.instrumentation = instrumentation
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        # Inicio de la sesión para el plazo máximo de la política, y LoginPage en curso para sus tiempos aprendidos
+        self.session_started = time.monotonic()
+        self.current_page_id = None
+
+        # Elementos ya localizados en la navegación actual
+        self.locator_cache = LocatorCache()
+
+        # Índice de textos de la página, activado con enable_text_index(). None si no se usa.
+        self.text_index = None
+
+        # Instantánea de tablas cargada con load_table_snapshot(). None si no hay ninguna cargada.
+        self.table_snapshot = None
+
+        self.lifecycle = lifecycle
+
+    def _start_driver(self):
+        """
+        Arranca el servicio (o toma el compartido) y el driver con el perfil de arranque de la instancia.
+        """
+        service_class, driver_class = self._driver_classes
+        if self.shared_service and self.browser_type == 'chrome':
+            self.service = get_shared_service(self.browser_type)
+        else:
+            # La ruta del driver se busca una sola vez por proceso
+            self.service = service_class(executable_path=find_driver_path(self.browser_type))
+        options = self.profile.options_for(self.browser_type)
+        # Cada navegador en marcha usa su propio subdirectorio de la caché en disco
+        self._cache_slot = None
+        # Filtro con el que arranca el driver: su PAC y su caché no cambian hasta el siguiente arranque
+        self._started_request_filter = self.request_filter
+        if self.request_filter is not None:
+            self._cache_slot = self.request_filter.acquire_cache_slot()
+            self.request_filter.apply_options(options, self.browser_type, self._cache_slot)
+        try:
+            self.driver = driver_class(service=self.service, options=options)
+        except Exception:
+            self._release_cache_slot()
+            raise
+        self.instrumentation.attach(self.driver)
+        self.main_handle = self.driver.current_window_handle
+        self.current_handle = self.main_handle
+        self._network_enabled = False
+        self._apply_blocked_urls()
+
+    def _use_main_window(self):
+        """
+        Activa la ventana principal si no es la activa. Debe llamarse con el cerrojo del driver tomado.
+        """
+        if self.current_handle != self.main_handle:
+            self.driver.switch_to.window(self.main_handle)
+            self.current_handle = self.main_handle
+
+    def _apply_blocked_urls(self):
+        """
+        Bloquea por CDP las URLs del perfil de arranque y del filtro de peticiones. Solo en Chrome.
+        """
+        if self.browser_type != 'chrome':
+            return
+        # Chrome no permite bloquear fuentes ni CSS con opciones de arranque; se bloquean por CDP
+        blocked_patterns = self.profile.blocked_url_patterns()
+        if self.request_filter is not None:
+            blocked_patterns += self.request_filter.blocked_url_patterns(self.browser_type)
+        if blocked_patterns or self._network_enabled:
+            if not self._network_enabled:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self._network_enabled = True
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_patterns})
+
+    def set_request_filter(self, request_filter):
+        """
+        Cambia el filtro de peticiones con el navegador arrancado.
+
+        En Chrome las URLs bloqueadas ('deny') se aplican al momento. Los hosts permitidos ('allow'), la caché
+        en disco y el filtro de Firefox se fijan al arrancar el navegador, así que se aplican en el siguiente
+        recycle().
+
+        :param request_filter: El nuevo filtro, o None para no filtrar.
+
+        :type request_filter: RequestFilter or None
+        """
+        self.request_filter = request_filter
+        self._apply_blocked_urls()
+
+    def _launch_settings(self, request_filter):
+        """
+        Devuelve la parte del filtro que solo se aplica al arrancar este navegador. Ver RequestFilter.launch_settings().
+        """
+        return request_filter.launch_settings(self.browser_type) if request_filter is not None else (None, None)
+
+    @staticmethod
+    def for_login_page(loginpage, browser_type, wait_strategy=None):
+        """
+        Crea un BrowserManager con el perfil de arranque y el filtro de peticiones indicados en el LoginPage.
+
+        :param loginpage: LoginPage cuyos atributos 'profile' y 'request_filter' deciden el perfil y el filtro.
+                          Si 'profile' es None se usa 'default'.
+        :param browser_type: Tipo de navegador a usar. Acepta "chrome" y "firefox".
+        :param wait_strategy: Estrategia de espera tras cada acción.
+
+        :type loginpage: LoginPage
+        :type browser_type: str
+        :type wait_strategy: WaitStrategy
+
+        :rtype: BrowserManager
+        """
+        return BrowserManager(browser_type, wait_strategy, loginpage.profile,
+                              request_filter=loginpage.request_filter)
+
+    @traced
+    @on_main_window
     def open_browser(self, url):
         """
-        Abre la URL especificada y maximiza la ventana del navegador.
+        Abre la URL especificada y maximiza la ventana del navegador
+        si el perfil de arranque no fija un tamaño de ventana.
 
         :param url: URL que se va a abrir en el navegador.
         :type url: str
         """
         self.driver.get(url)
-        self.driver.maximize_window()
+        if self.profile.window_size is None:
+            self.driver.maximize_window()
+        # La instantánea de tablas y los elementos localizados pertenecen a la página anterior
+        self.table_snapshot = None
+        self.locator_cache.new_navigation()
+        if self.lifecycle is not None:
+            self.lifecycle.after_navigation(self)
+
+    def _release_cache_slot(self):
+        """
+        Libera el subdirectorio de la caché en disco que usaba el navegador, si tenía uno.
+        """
+        if self._cache_slot is not None:
+            self._cache_slot.release()
+            self._cache_slot = None
 
     def close_browser(self):
         """
         Cierra el navegador y libera los recursos asociados.
         """
+        try:
+            self.driver.quit()
+        finally:
+            self._release_cache_slot()
+
+    def new_context(self, isolated=True):
+        """
+        Abre una pestaña nueva en el mismo navegador que se maneja como una sesión independiente.
+
+        En Chrome, con 'isolated=True', la pestaña se crea en un contexto de navegador propio (como una ventana
+        de incógnito), con sus propias cookies y almacenamiento. En Firefox es una pestaña normal que comparte
+        cookies con las demás.
+
+        :param isolated: Si es True, la pestaña tiene sus propias cookies (solo Chrome).
+
+        :type isolated: bool
+
+        :return: La pestaña nueva.
+        :rtype: BrowserContext
+        """
+        from DriverManager.BrowserContext import BrowserContext  # BrowserContext importa este módulo
+
+        with self.driver_lock:
+            if self.current_handle is None:
+                self._use_main_window()
+            if isolated and self.browser_type == 'chrome':
+                context_id = self.driver.execute_cdp_cmd('Target.createBrowserContext', {})['browserContextId']
+                target_id = self.driver.execute_cdp_cmd('Target.createTarget', {
+                    'url': 'about:blank', 'browserContextId': context_id})['targetId']
+                # chromedriver usa el id del target como identificador de la ventana
+                handle = next((handle for handle in self.driver.window_handles if handle.endswith(target_id)),
+                              target_id)
+            else:
+                context_id = None
+                self.driver.switch_to.new_window('tab')
+                handle = self.current_handle = self.driver.current_window_handle
+        return BrowserContext(self, handle, context_id)
+
+    def map_contexts(self, func, items, concurrency=8, isolated=True):
+        """
+        Ejecuta 'func(context, item)' para cada elemento, cada uno en una pestaña nueva de este navegador,
+        con hasta 'concurrency' pestañas a la vez. Cada pestaña se cierra al terminar su elemento.
+
+        :param func: Función que recibe un BrowserContext y un elemento.
+        :param items: Elementos a procesar.
+        :param concurrency: Número máximo de pestañas abiertas a la vez.
+        :param isolated: Si es True, cada pestaña tiene sus propias cookies (solo Chrome). Ver new_context().
+
+        :type func: callable
+        :type items: iterable
+        :type concurrency: int
+        :type isolated: bool
+
+        :return: Lista con los resultados de 'func' en el mismo orden que 'items'.
+        :rtype: list
+        """
+        def run(item):
+            context = self.new_context(isolated)
+            try:
+                return func(context, item)
+            finally:
+                try:
+                    context.close()
+                except WebDriverException:
+                    pass
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(run, items))
+        # Los métodos de BrowserManager vuelven a usar la ventana principal
+        with self.driver_lock:
+            self._use_main_window()
+        return results
+
+    @traced
+    @on_main_window
+    def recycle(self):
+        """
+        Cierra el navegador y arranca uno nuevo conservando la sesión: URL actual, cookies, localStorage
+        y sessionStorage. Libera la memoria que el navegador acumula tras muchas navegaciones.
+
+        Si la sesión no se puede restaurar en el navegador nuevo (por ejemplo, una cookie de otro dominio),
+        se informa del error y se continúa con una sesión limpia.
+        """
+        try:
+            state = self.capture_session_state()
+        except WebDriverException:
+            # Páginas como 'about:blank' no tienen almacenamiento accesible; no hay sesión que conservar
+            state = None
         self.driver.quit()
+        self._release_cache_slot()
+        self._start_driver()
+        self.table_snapshot = None
+        self.locator_cache.new_navigation()
+        if state is None:
+            return
+        try:
+            self.restore_session_state(state)
+        except WebDriverException as error:
+            print(f"\n\t*** = ***\nError: No se pudo restaurar la sesión de {state['url']} tras reiniciar el "
+                  f"navegador; se continúa con una sesión limpia: {error}")
+            try:
+                # Sin las cookies que sí llegaron a inyectarse, para no dejar una sesión a medias
+                self.driver.delete_all_cookies()
+            except WebDriverException:
+                pass
+
+    @traced
+    @on_main_window
+    def reset_session(self):
+        """
+        Deja el navegador limpio para reutilizarlo en otra tarea sin reiniciar el driver.
 
+        Cierra todas las pestañas menos la primera, vacía localStorage y sessionStorage del origen actual,
+        borra las cookies y navega a 'about:blank'.
+        En Chrome las cookies se borran de todos los dominios mediante CDP; en Firefox solo las del dominio actual.
+        """
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+        self.main_handle = self.current_handle = handles[0]
+
+        try:
+            self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            # Páginas como 'about:blank' o 'data:' no tienen almacenamiento accesible
+            pass
+
+        if self.browser_type == 'chrome':
+            self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        else:
+            self.driver.delete_all_cookies()
+
+        self.driver.get('about:blank')
+        if self.request_filter is not self._launch_request_filter:
+            self.set_request_filter(self._launch_request_filter)
+        self.table_snapshot = None
+        self.locator_cache.new_navigation()
+        self.session_started = time.monotonic()
+        self.current_page_id = None
+
+    @traced
+    @on_main_window
     def select_element(self, selector_type, selector, seconds):
         """
         Selecciona un elemento en la página web utilizando diferentes tipos de selectores predefinidos.
 
         Espera a que el elemento sea visible y lo desplaza a la vista.
+        Si el mismo selector ya se resolvió en esta navegación y el elemento sigue siendo válido, se reutiliza
+        desde 'self.locator_cache' sin volver a buscarlo.
 
         :param selector_type: Acepta los valores 'xpath', 'id', 'css', 'name' y 'link'.
         :param selector: El valor del selector, como la expresión XPath o css, el id, el valor del atributo name, o texto parcial de un link.
-        :param seconds: Segundos antes de pasar a la siguiente tarea.
+        :param seconds: Segundos antes de pasar a la siguiente tarea. Solo se duermen si la estrategia de espera
+                        tiene el throttling activado.
 
         :type selector_type: str
         :type selector: str
@@ -79,7 +468,7 @@ class BrowserManager:
         :return: El WebElement seleccionado si se encuentra. Retorna None si no se encuentra el elemento.
         :rtype: WebElement or None
 
-        :raises TimeoutException: Si no se encuentra el elemento en el tiempo permitido, reintentará encontrarlo hasta 'retry_count' veces.
+        :raises TimeoutException: Si no se encuentra el elemento en el tiempo permitido, reintentará encontrarlo según 'self.retry_policy'.
         :raises NoSuchElementException: Si el elemento no se encuentra en el DOM.
         :raises StaleElementReferenceException: Si el elemento ya no es un referente válido en el DOM.
         """
@@ -96,23 +485,42 @@ class BrowserManager:
             print(f"Error: Tipo de selector '{selector_type}' no es válido.")
             return None
 
+        # Reutiliza el elemento si ya se localizó en esta navegación y sigue siendo válido
+        element = self.locator_cache.get(selector_type, selector)
+        self.instrumentation.count('locator_cache.hit' if element is not None else 'locator_cache.miss')
+        if element is not None:
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+            self.waits.after_locate(self.driver, element, seconds)
+            return element
+
+        # Espera de cada intento según la política de reintentos
+        schedule = self.retry_policy.schedule(selector, self.current_page_id, self.session_started)
+        if not schedule:
+            print(f"\n\t*** = ***\nTimeout: Agotado el plazo de la sesión antes de buscar el elemento con selector: {selector}.")
+            return None
+
         attempt = 0  # intentos
-        retry_count = 2  # contador de reintentos
+        retry_count = len(schedule)  # contador de reintentos
+        started = time.monotonic()
         while attempt < retry_count:
             try:
                 # Espera explícita hasta que el elemento sea visible
-                element = WebDriverWait(self.driver, 20).until(
-                    EC.visibility_of_element_located((by_mapping[selector_type], selector))
-                )
+                with self.instrumentation.span('visibility_of_element_located', 'wait', selector=selector):
+                    element = WebDriverWait(self.driver, schedule[attempt]).until(
+                        EC.visibility_of_element_located((by_mapping[selector_type], selector))
+                    )
+                self.retry_policy.record(self.current_page_id, time.monotonic() - started)
+                self.locator_cache.put(selector_type, selector, element)
                 # Scroll hasta el elemento
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                # Espera el tiempo especificado
-                time.sleep(seconds)
+                # Espera el tiempo especificado si el throttling está activado
+                self.waits.after_locate(self.driver, element, seconds)
                 return element
 
             except TimeoutException:
                 # Reintenta localizar el elemento hasta 'retry_count' veces antes de devolver None
                 attempt += 1
+                self.instrumentation.count('retry', selector=selector, attempt=attempt)
                 if attempt == retry_count:
                     print(
                         f"\n\t*** = ***\nTimeout: No se pudo encontrar el elemento con selector: {selector} tras {retry_count} intentos.")
@@ -126,6 +534,8 @@ class BrowserManager:
                 print(f"\n\t*** = ***\nError: El elemento con selector: {selector} ya no es un referente válido en el DOM.")
                 return None
 
+    @traced
+    @on_main_window
     def select_all_elements(self, selector_type, selector):
         """
         Encuentra y devuelve todos los elementos que coincidan con el XPath dado.
@@ -139,7 +549,7 @@ class BrowserManager:
         :return: Lista de WebElement si se encuentran, o una lista vacía [] si no se encuentran.
         :rtype: list[WebElement]
 
-        :raises TimeoutException: Si no se encuentran elementos en el tiempo permitido, reintentará encontrarlos hasta 'retry_count' veces.
+        :raises TimeoutException: Si no se encuentran elementos en el tiempo permitido, reintentará encontrarlos según 'self.retry_policy'.
         :raises NoSuchElementException: Si los elementos no se encuentra en el DOM.
         :raises StaleElementReferenceException: Si el XPath ya no es un referente válido en el DOM.
         """
@@ -154,14 +564,21 @@ class BrowserManager:
             print(f"\n\t*** = ***\nError: Tipo de selector '{selector_type}' no es válido.")
             return None
 
+        # Espera de cada intento según la política de reintentos
+        schedule = self.retry_policy.schedule(selector, self.current_page_id, self.session_started)
+        if not schedule:
+            print(f"\n\t*** = ***\nTimeout: Agotado el plazo de la sesión antes de buscar los elementos con {selector_type} {selector}.")
+            return []
+
         attempt = 0  # intentos
-        retry_count = 2  # contador de reintentos
+        retry_count = len(schedule)  # contador de reintentos
         while attempt < retry_count:
             try:
                 # Espera explícita hasta que los elemento sea visible
-                list_of_elements = WebDriverWait(self.driver, 20).until(
-                    EC.presence_of_all_elements_located((by_mapping[selector_type], selector))
-                )
+                with self.instrumentation.span('presence_of_all_elements_located', 'wait', selector=selector):
+                    list_of_elements = WebDriverWait(self.driver, schedule[attempt]).until(
+                        EC.presence_of_all_elements_located((by_mapping[selector_type], selector))
+                    )
                 # for element in list_of_elements:
                 #     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
                 return list_of_elements
@@ -169,6 +586,7 @@ class BrowserManager:
             except TimeoutException:
                 # Reintenta localizar el elemento hasta 'retry_count' veces antes de devolver None
                 attempt += 1
+                self.instrumentation.count('retry', selector=selector, attempt=attempt)
                 if attempt == retry_count:
                     print(
                         f"\n\t*** = ***\nTimeout: No se pudieron encontrar los elementos con {selector_type} {selector} tras {retry_count} intentos.")
@@ -182,27 +600,130 @@ class BrowserManager:
                 print(f"\n\t*** = ***\nError: {selector_type} {selector} ya no es un referente válido en el DOM.")
                 return []
 
-    def select_element_by_text(self, text, seconds):
+    @traced
+    @on_main_window
+    def is_absent(self, selector_type, selector, timeout=None):
+        """
+        Comprueba rápidamente que un elemento no está visible, por ejemplo un mensaje de error.
+
+        Si el elemento no existe o no es visible devuelve True al momento, sin los reintentos de select_element().
+        Si está visible, espera como mucho 'timeout' segundos a que desaparezca.
+
+        :param selector_type: Acepta los valores 'xpath', 'id', 'css', 'name' y 'link'.
+        :param selector: El valor del selector.
+        :param timeout: Segundos máximos de espera. Por defecto 'absence_timeout' de la política de reintentos.
+
+        :type selector_type: str
+        :type selector: str
+        :type timeout: float
+
+        :return: True si el elemento no está visible, False si sigue visible pasado el tiempo.
+        :rtype: bool
+        """
+        by_mapping = {
+            'xpath': By.XPATH,
+            'id': By.ID,
+            'css': By.CSS_SELECTOR,
+            'name': By.NAME,
+            'link': By.PARTIAL_LINK_TEXT
+        }
+        if selector_type not in by_mapping:
+            print(f"\n\t*** = ***\nError: Tipo de selector '{selector_type}' no es válido.")
+            return None
+        if timeout is None:
+            timeout = self.retry_policy.absence_timeout
+        return self.waits.wait(self.driver, EC.invisibility_of_element_located((by_mapping[selector_type], selector)),
+                               timeout)
+
+    @traced
+    @on_main_window
+    def select_element_by_text(self, text, seconds, scope=None):
         """
         Genera un xpath que contiene 'text' y llama a select_element() con los argumentos
         By.XPATH y el xpath generado.
 
         Selecciona el primer elemento que encuentra que contiene el texto especificado.
+        El texto se escapa con seguridad, así que puede contener comillas.
 
         Espera a que el elemento sea visible y lo desplaza a la vista.
 
         :param text: El texto que debe contener el elemento que se está buscando.
         :param seconds: Tiempo en segundos a esperar entre acciones.
+        :param scope: XPath de un contenedor para limitar la búsqueda, o None para buscar en todo el documento.
 
         :type text: str
         :type seconds: float
+        :type scope: str or None
 
         :return: El WebElement seleccionado si se encuentra. Retorna None si no se encuentra.
         :rtype: WebElement or None
         """
-        xpath = f"//*[contains(text(), '{text}')]"
+        # Con el índice de textos activo se resuelve en una llamada; si no lo encuentra se usa la XPath, que espera
+        if self.text_index is not None and scope is None:
+            element = self.text_index.lookup(text)
+            if element is not None:
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                self.waits.after_locate(self.driver, element, seconds)
+                return element
+
+        xpath = ELEMENT_BY_TEXT.render(scope, text=text)
         return self.select_element('xpath', xpath, seconds)
 
+    def enable_text_index(self, max_mutations=10000):
+        """
+        Activa el índice de textos de la página para select_element_by_text(), get_row_by_text()
+        y select_elements_by_text(). El índice se construye en la primera búsqueda de cada navegación.
+
+        :param max_mutations: Número de mutaciones del DOM a partir del cual el índice se invalida. Ver TextIndex.
+
+        :type max_mutations: int
+
+        :return: El índice activado.
+        :rtype: TextIndex
+        """
+        self.text_index = TextIndex(self, max_mutations)
+        return self.text_index
+
+    def disable_text_index(self):
+        """
+        Desactiva el índice de textos; las búsquedas por texto vuelven a usar XPath.
+        """
+        self.text_index = None
+
+    @traced
+    @on_main_window
+    def select_elements_by_text(self, texts, exact=False):
+        """
+        Busca varios textos a la vez y devuelve el primer elemento visible que contiene cada uno.
+
+        Con el índice de textos activo es una sola llamada al navegador para todo el lote.
+        Sin él (o si el índice se ha invalidado) se busca cada texto por XPath sin esperas.
+
+        :param texts: Textos a buscar.
+        :param exact: Si es True, el texto del elemento debe coincidir entero.
+
+        :type texts: list[str]
+        :type exact: bool
+
+        :return: Lista con el WebElement encontrado para cada texto, o None si no se encuentra.
+        :rtype: list[WebElement or None]
+        """
+        if self.text_index is not None:
+            results = self.text_index.lookup_many(texts, exact)
+            if results is not None:
+                return results
+
+        results = []
+        for text in texts:
+            if exact:
+                xpath = ELEMENT_BY_EXACT_TEXT.render(None, text=' '.join(text.split()))
+            else:
+                xpath = ELEMENT_BY_TEXT.render(None, text=text)
+            elements = [element for element in self.driver.find_elements(By.XPATH, xpath) if element.is_displayed()]
+            results.append(elements[0] if elements else None)
+        return results
+
+    @on_main_window
     def get_xpath_of_element(self, element):
         """
         Devuelve el XPath de un elemento dado en una página web.
@@ -242,6 +763,8 @@ class BrowserManager:
             return getElementXPath(arguments[0]);
         """, element)
 
+    @traced
+    @on_main_window
     def write(self, text, selector_type, selector, seconds):
         """
         Escribe el texto en un campo de entrada identificado por un selector.
@@ -257,10 +780,18 @@ class BrowserManager:
         :type seconds: float
         """
         element = self.select_element(selector_type, selector, seconds)
+        self._write_element(element, text, seconds)
+
+    def _write_element(self, element, text, seconds):
+        """
+        Escribe el texto en un campo ya localizado y espera a que el valor quede escrito.
+        """
         element.clear()
         element.send_keys(text)
-        time.sleep(seconds)
+        self.waits.after_write(self.driver, element, text, seconds)
 
+    @traced
+    @on_main_window
     def click(self, selector_type, selector, seconds):
         """
         Hace clic en un elemento identificado por un selector.
@@ -274,45 +805,264 @@ class BrowserManager:
         :type seconds: float
         """
         element = self.select_element(selector_type, selector, seconds)
+        self._click_element(element, seconds)
+
+    def _click_element(self, element, seconds):
+        """
+        Hace clic en un elemento ya localizado y espera a que la página se estabilice.
+        """
+        self.waits.before_click(self.driver, element)
         element.click()
-        time.sleep(seconds)
+        # El clic puede haber navegado a otra página o cambiado la tabla (paginación, filtros)
+        self.table_snapshot = None
+        self.locator_cache.new_navigation()
+        # Espera a que la página se estabilice tras el clic
+        self.waits.after_click(self.driver, seconds)
+
+    @traced
+    @on_main_window
+    def fill_form(self, fields, submit_selector=None, selector_type='xpath', seconds=0, mode='script'):
+        """
+        Rellena varios campos de un formulario y, opcionalmente, pulsa el botón de envío.
+
+        En modo 'script' todo se hace en una sola llamada a execute_script: se localizan los campos, se asigna
+        el valor con el setter nativo (para que frameworks como React lo detecten), se disparan los eventos
+        'input' y 'change' y se hace clic en el botón. Si algún campo aún no está en el DOM, se espera a que
+        aparezca con select_element() y se repite la llamada una vez.
+        En modo 'keys' se usa write() y click() campo a campo, tecleando como un usuario.
+
+        :param fields: Diccionario selector -> valor a escribir, o lista de pares (selector, valor) si un mismo
+                       campo se rellena más de una vez. Los campos se rellenan en ese orden.
+        :param submit_selector: Selector del botón de envío, o None para no enviar el formulario.
+        :param selector_type: En modo 'script' acepta 'xpath', 'id', 'css' y 'name'. En modo 'keys', los de select_element().
+        :param seconds: Tiempo en segundos a esperar entre acciones si el throttling está activado.
+        :param mode: 'script' para rellenar en una sola llamada o 'keys' para teclear campo a campo.
+
+        :type fields: dict[str, str] or list[tuple[str, str]]
+        :type submit_selector: str or None
+        :type selector_type: str
+        :type seconds: float
+        :type mode: str
+
+        :return: True si se rellenaron todos los campos, False si alguno no se encontró.
+        :rtype: bool
+        """
+        pairs = [[selector, value] for selector, value in (fields.items() if isinstance(fields, dict) else fields)]
+        if mode == 'keys':
+            # Cada campo se localiza una sola vez
+            for selector, value in pairs:
+                element = self.select_element(selector_type, selector, seconds)
+                if element is None:
+                    return False
+                self._write_element(element, value, seconds)
+            if submit_selector:
+                element = self.select_element(selector_type, submit_selector, seconds)
+                if element is None:
+                    return False
+                self._click_element(element, seconds)
+            return True
+
+        if mode != 'script':
+            print(f"\n\t*** = ***\nError: Modo de rellenado '{mode}' no es válido. Usa 'script' o 'keys'.")
+            return False
+        if selector_type not in ('xpath', 'id', 'css', 'name'):
+            print(f"\n\t*** = ***\nError: Tipo de selector '{selector_type}' no es válido para el modo 'script'.")
+            return False
+
+        # Con envío, la acción se marca para que after_click() no dé por estable la página antes de que navegue
+        script = MARK_ACTION_SCRIPT + FILL_FORM_SCRIPT if submit_selector else FILL_FORM_SCRIPT
+        try:
+            missing = self.driver.execute_script(script, pairs, submit_selector, selector_type)
+            if missing:
+                # Algún campo aún no se ha renderizado: se espera a que aparezca y se reintenta una vez
+                for selector in missing:
+                    if self.select_element(selector_type, selector, 0) is None:
+                        return False
+                missing = self.driver.execute_script(script, pairs, submit_selector, selector_type)
+        except JavascriptException as error:
+            # Selector no válido o campo que no admite un valor
+            print(f"\n\t*** = ***\nError: No se pudo rellenar el formulario: {error.msg}")
+            return False
+        if missing:
+            print(f"\n\t*** = ***\nError: No se encontraron los campos {missing} del formulario.")
+            return False
+
+        if submit_selector:
+            # El envío puede haber navegado a otra página
+            self.table_snapshot = None
+            self.locator_cache.new_navigation()
+            self.waits.after_click(self.driver, seconds)
+        else:
+            self.waits.pause(seconds)
+        return True
 
-    def login(self, loginpage, seconds):
+    @traced
+    @on_main_window
+    def login(self, loginpage, seconds, mode='script'):
         """
         Realiza el flujo de login usando los selectores y credenciales de LoginPage.
 
+        Antes cambia al filtro de peticiones del LoginPage, o al del arranque si no tiene. Ver set_request_filter().
+
         :param loginpage: Objeto que contiene la URL y los selectores necesarios para el login.
         :param seconds: Tiempo en segundos a esperar entre acciones.
+        :param mode: 'script' rellena el formulario en una sola llamada; 'keys' teclea campo a campo. Ver fill_form().
 
         :type loginpage: LoginPage
         :type seconds: float
+        :type mode: str
+
+        :return: True si se rellenó y envió el formulario, False si algún campo no se encontró.
+        :rtype: bool
         """
+        # Sin filtro propio, la página usa el del arranque y no el de la página anterior
+        request_filter = loginpage.request_filter if loginpage.request_filter is not None \
+            else self._launch_request_filter
+        if request_filter is not self.request_filter:
+            if self._launch_settings(request_filter) != self._launch_settings(self._started_request_filter):
+                print(f"\n\t*** = ***\nError: El filtro de peticiones de '{loginpage.id}' tiene hosts permitidos, "
+                      f"caché en disco o reglas de Firefox que solo se aplican al arrancar el navegador. Use "
+                      f"BrowserManager.for_login_page() o recycle() para aplicarlos; por ahora solo se bloquean "
+                      f"las URLs de 'deny' en Chrome.")
+            self.set_request_filter(request_filter)
         self.open_browser(loginpage.url)
-        self.write(loginpage.credentials.username, 'xpath', loginpage.username_selector, seconds)
-        self.write(loginpage.credentials.pwd, 'xpath', loginpage.pwd_selector, seconds)
-        self.click('xpath', loginpage.login_button_selector, seconds)
+        # Los tiempos de aparición observados se asocian a este LoginPage
+        self.current_page_id = loginpage.id
+        fields = {
+            loginpage.username_selector: loginpage.credentials.username,
+            loginpage.pwd_selector: loginpage.credentials.pwd
+        }
+        return self.fill_form(fields, loginpage.login_button_selector, 'xpath', seconds, mode)
+
+    @on_main_window
+    def capture_session_state(self):
+        """
+        Captura el estado de sesión de la página actual: URL, cookies, localStorage y sessionStorage.
 
-    def get_row_by_text(self, text, seconds):
+        :return: Diccionario con las claves 'url', 'cookies', 'local_storage' y 'session_storage'.
+        :rtype: dict
+        """
+        storage = self.driver.execute_script("""
+            function dump(storage) {
+                var items = {};
+                for (var i = 0; i < storage.length; i++) {
+                    items[storage.key(i)] = storage.getItem(storage.key(i));
+                }
+                return items;
+            }
+            return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+        """)
+        return {
+            'url': self.driver.current_url,
+            'cookies': self.driver.get_cookies(),
+            'local_storage': storage['local'],
+            'session_storage': storage['session']
+        }
+
+    @on_main_window
+    def restore_session_state(self, state):
+        """
+        Inyecta un estado capturado con capture_session_state() y navega a la URL en la que se capturó.
+
+        Las cookies y el almacenamiento solo se pueden escribir desde su origen, así que primero se abre la URL,
+        se inyecta el estado y se vuelve a cargar.
+
+        :param state: Estado de sesión capturado.
+
+        :type state: dict
+        """
+        self.open_browser(state['url'])
+        for cookie in state['cookies']:
+            self.driver.add_cookie(cookie)
+        self.driver.execute_script("""
+            var local = arguments[0], session = arguments[1];
+            for (var key in local) window.localStorage.setItem(key, local[key]);
+            for (var key in session) window.sessionStorage.setItem(key, session[key]);
+        """, state['local_storage'], state['session_storage'])
+        self.open_browser(state['url'])
+
+    @traced
+    @on_main_window
+    def login_with_session(self, loginpage, store, seconds, mode='script'):
+        """
+        Inicia sesión reutilizando el estado guardado en 'store' para el LoginPage si existe y sigue siendo válido.
+
+        Si no hay estado guardado, ha caducado o el sitio lo rechaza (vuelve a mostrar el formulario de login),
+        se hace un login real con login() y se guarda el nuevo estado.
+
+        :param loginpage: Objeto que contiene la URL y los selectores necesarios para el login.
+        :param store: Almacén de sesiones.
+        :param seconds: Tiempo en segundos a esperar entre acciones.
+        :param mode: Modo de rellenado del formulario si hay que hacer login real. Ver fill_form().
+
+        :type loginpage: LoginPage
+        :type store: SessionStore
+        :type seconds: float
+        :type mode: str
+
+        :return: True si la sesión quedó iniciada, False si el login real falló.
+        :rtype: bool
+        """
+        state = store.load(loginpage.id)
+        if state is not None:
+            try:
+                self.restore_session_state(state)
+                # Sin esperas: si el formulario de login está a la vista, la sesión fue rechazada
+                login_form = self.driver.find_elements(By.XPATH, loginpage.username_selector)
+                if not any(element.is_displayed() for element in login_form):
+                    self.current_page_id = loginpage.id
+                    return True
+            except WebDriverException:
+                pass
+            store.invalidate(loginpage.id)
+            self.reset_session()
+
+        if not self.login(loginpage, seconds, mode):
+            return False
+        store.save(loginpage.id, self.capture_session_state())
+        return True
+
+    @traced
+    @on_main_window
+    def get_row_by_text(self, text, seconds, scope=None):
         """
         Busca un <tr> que contiene un <td> o <th> que contiene el texto proporcionado, ya sea directamente o en sus descendientes.
 
-        :param text: El texto a buscar dentro de las celdas (td o th).
+        :param text: El texto a buscar dentro de las celdas (td o th). Puede contener comillas.
         :param seconds: Tiempo en segundos a esperar entre acciones.
+        :param scope: XPath de la tabla en la que buscar, o None para buscar en todo el documento.
+                      Limitar la búsqueda a una tabla es mucho más barato en páginas grandes.
 
         :type text: str
         :type seconds: float
+        :type scope: str or None
 
         :return: El WebElement correspondiente al <tr> que contiene el texto.
         :rtype: WebElement
         """
+        # Si hay una instantánea cargada y alguna celda tiene exactamente el texto, se responde sin llamar al navegador
+        if self.table_snapshot is not None:
+            row_number = self._find_in_index(self.table_snapshot['row_index'], text)
+            if row_number is not None:
+                return self.table_snapshot['rows'][row_number]
+
+        if self.text_index is not None and scope is None:
+            row_element = self.text_index.lookup(text, closest='tr')
+            if row_element is not None:
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", row_element)
+                self.waits.after_locate(self.driver, row_element, seconds)
+                return row_element
+
         # Construir un XPath que busque un <tr> que tenga un <td> o <th> donde el texto esté presente
-        xpath = f"//tr[td[contains(text(), '{text}') or .//*[contains(text(), '{text}')]] or th[contains(text(), '{text}') or .//*[contains(text(), '{text}')]]]"
+        xpath = ROW_BY_TEXT.render(scope, text=text)
 
         # Usar la función select_element con ese XPath
         row_element = self.select_element('xpath', xpath, seconds)
 
         return row_element
 
+    @traced
+    @on_main_window
     def get_row_children(self, text, seconds):
         """
         Obtiene todos los <td> o <th> de la fila que contiene el texto proporcionado.
@@ -326,11 +1076,17 @@ class BrowserManager:
         :return: Lista de WebElement correspondientes a las celdas (td o th) en la fila.
         :rtype: list[WebElement]
         """
+        if self.table_snapshot is not None:
+            row_number = self._find_in_index(self.table_snapshot['row_index'], text)
+            if row_number is not None:
+                return self.table_snapshot['cells'][row_number]
+
         fila = self.get_row_by_text(text, seconds)
         xpath_fila = self.get_xpath_of_element(fila)
         xpath_children = f"{xpath_fila}/td | {xpath_fila}/th"  # Combina ambos tipos de celdas
         return self.select_all_elements('xpath', xpath_children)
 
+    @on_main_window
     def _get_num_column(self, text_title, seconds):
         """
         Devuelve el número de la columna a la que pertenece 'text_title',
@@ -345,6 +1101,10 @@ class BrowserManager:
         :return: El número de la columna al que pertenece el texto.
         :rtype: int
         """
+        if self.table_snapshot is not None:
+            num_column = self._find_in_index(self.table_snapshot['column_index'], text_title)
+            if num_column is not None:
+                return num_column
 
         titles = self.get_row_children(text_title, seconds)
         n = 0
@@ -354,6 +1114,8 @@ class BrowserManager:
                 return n
         return None
 
+    @traced
+    @on_main_window
     def get_cell(self, text, column, seconds):
         """
         Obtiene el <td> o <th> de una fila específica que contiene el texto proporcionado en la columna indicada.
@@ -389,6 +1151,179 @@ class BrowserManager:
             print(f"\n\t*** = ***\nError: La fila tiene de 1 a {len(elements)} columnas, pero se pidió la {num_column}.")
             return None
 
+    @traced
+    @on_main_window
+    def load_table_snapshot(self, selector='table'):
+        """
+        Lee en una única llamada a execute_script todas las tablas que coinciden con el selector CSS
+        y guarda el resultado en 'self.table_snapshot'.
+
+        Mientras haya una instantánea cargada, get_row_by_text(), get_row_children(), _get_num_column()
+        y get_cell() responden desde ella sin más llamadas al navegador cuando alguna celda tiene exactamente
+        el texto buscado (normalizado con normalize_text()); si no, buscan en el navegador como sin instantánea.
+        open_browser(), click() y el envío de formularios la descartan, porque pueden cambiar la tabla.
+
+        La instantánea es un diccionario con las claves:
+            - 'selector': El selector CSS usado.
+            - 'rows': Lista de WebElement de cada <tr>.
+            - 'cells': Lista (una por fila) de listas de WebElement de sus <td> o <th>.
+            - 'texts': TextGrid con el texto de cada celda: 'texts[fila][columna]'.
+            - 'row_index': Diccionario texto normalizado de celda -> posición de la fila en 'rows'.
+            - 'column_index': Diccionario texto normalizado de celda -> número de columna (1-indexed).
+              Los textos de los <th> tienen prioridad sobre los de los <td>.
+
+        :param selector: Selector CSS de las tablas a leer. Por defecto todas las <table> de la página.
+
+        :type selector: str
+
+        :return: La instantánea cargada.
+        :rtype: dict
+        """
+        data = self.driver.execute_script("""
+            var tables = document.querySelectorAll(arguments[0]);
+            var rows = [], cells = [], texts = [], headers = [];
+            for (var t = 0; t < tables.length; t++) {
+                var trs = tables[t].rows;
+                for (var r = 0; r < trs.length; r++) {
+                    var rowCells = [], rowTexts = [], rowHeaders = [];
+                    for (var c = 0; c < trs[r].cells.length; c++) {
+                        var cell = trs[r].cells[c];
+                        rowCells.push(cell);
+                        rowTexts.push(cell.textContent.trim());
+                        rowHeaders.push(cell.tagName === 'TH');
+                    }
+                    rows.push(trs[r]);
+                    cells.push(rowCells);
+                    texts.push(rowTexts);
+                    headers.push(rowHeaders);
+                }
+            }
+            return {rows: rows, cells: cells, texts: texts, headers: headers};
+        """, selector)
+
+        row_index = {}
+        column_index = {}
+        cell_columns = {}
+        for row_number, (row_texts, row_headers) in enumerate(zip(data['texts'], data['headers'])):
+            for column_number, (cell_text, is_header) in enumerate(zip(row_texts, row_headers), start=1):
+                cell_text = normalize_text(cell_text)
+                if not cell_text:
+                    continue
+                # Se guarda la primera aparición en orden de documento, como haría el XPath
+                row_index.setdefault(cell_text, row_number)
+                if is_header:
+                    column_index.setdefault(cell_text, column_number)
+                else:
+                    cell_columns.setdefault(cell_text, column_number)
+        for cell_text, column_number in cell_columns.items():
+            column_index.setdefault(cell_text, column_number)
+
+        self.table_snapshot = {
+            'selector': selector,
+            'rows': data['rows'],
+            'cells': data['cells'],
+            'texts': TextGrid(data['texts']),
+            'row_index': row_index,
+            'column_index': column_index
+        }
+        return self.table_snapshot
+
+    @traced
+    @on_main_window
+    def extract_table(self, selector='table', header_rows=1, decimal='.', as_frame=None):
+        """
+        Extrae una tabla completa en una única llamada a execute_script y la devuelve en formato columnar.
+
+        En el navegador se despliegan rowspan y colspan, de modo que cada celda combinada repite su texto
+        en todas las posiciones que ocupa. Las columnas numéricas se convierten a array('q') o array('d').
+
+        :param selector: Selector CSS de la tabla. Si coincide con varias, se usa la primera.
+        :param header_rows: Número de filas de títulos al principio de la tabla.
+        :param decimal: Separador decimal usado en la página ('.' o ',').
+        :param as_frame: None para un diccionario de columnas, 'numpy' o 'pandas'. Ver TableData.to_frame().
+
+        :type selector: str
+        :type header_rows: int
+        :type decimal: str
+        :type as_frame: str or None
+
+        :return: Diccionario título -> columna (o su equivalente numpy/pandas), o None si no se encuentra la tabla.
+        :rtype: dict or None
+        """
+        grid = self.driver.execute_script("""
+            var table = document.querySelector(arguments[0]);
+            if (!table) return null;
+            var grid = [], width = 0;
+            for (var r = 0; r < table.rows.length; r++) {
+                grid[r] = grid[r] || [];
+                var c = 0;
+                for (var i = 0; i < table.rows[r].cells.length; i++) {
+                    var cell = table.rows[r].cells[i];
+                    // Salta las posiciones ya ocupadas por un rowspan de filas anteriores
+                    while (grid[r][c] !== undefined) c++;
+                    var text = cell.textContent.trim();
+                    var rowSpan = Math.max(cell.rowSpan, 1), colSpan = Math.max(cell.colSpan, 1);
+                    for (var y = 0; y < rowSpan && r + y < table.rows.length; y++) {
+                        grid[r + y] = grid[r + y] || [];
+                        for (var x = 0; x < colSpan; x++) grid[r + y][c + x] = text;
+                    }
+                    c += colSpan;
+                }
+                width = Math.max(width, grid[r].length);
+            }
+            for (var r = 0; r < grid.length; r++) {
+                for (var c = 0; c < width; c++) {
+                    if (grid[r][c] === undefined) grid[r][c] = '';
+                }
+            }
+            return grid;
+        """, selector)
+        if grid is None:
+            print(f"\n\t*** = ***\nError: No se encontró ninguna tabla con selector: {selector}.")
+            return None
+        return to_frame(grid_to_columns(grid, header_rows, decimal), as_frame)
+
+    def stream_table(self, selector='table', chunk_size=500, **kwargs):
+        """
+        Devuelve un TableStream para leer la tabla por bloques de filas con memoria acotada.
+
+        :param selector: Selector CSS de la tabla.
+        :param chunk_size: Número máximo de filas por bloque.
+        :param kwargs: Resto de opciones de TableStream (paginación, scroll, prune...).
+
+        :type selector: str
+        :type chunk_size: int
+
+        :rtype: TableStream
+        """
+        return TableStream(self, selector, chunk_size, **kwargs)
+
+    def clear_table_snapshot(self):
+        """
+        Descarta la instantánea de tablas para que las búsquedas vuelvan a consultar el navegador.
+        """
+        self.table_snapshot = None
+
+    @staticmethod
+    def _find_in_index(index, text):
+        """
+        Busca 'text' en un índice de la instantánea de tablas.
+
+        Solo acepta coincidencias exactas del texto normalizado (sin espacios al principio y al final y con los
+        espacios interiores reducidos a uno), que se resuelven con una sola consulta al diccionario.
+        Las búsquedas parciales las resuelve el navegador con contains() en los XPath de get_row_by_text().
+
+        :param index: 'row_index' o 'column_index' de la instantánea.
+        :param text: Texto a buscar.
+
+        :type index: dict
+        :type text: str
+
+        :return: El valor asociado al texto, o None si ninguna celda tiene exactamente ese texto.
+        :rtype: int or None
+        """
+        return index.get(normalize_text(text))
+
 
 # El código aquí solo se ejecuta si este archivo es ejecutado directamente
 if __name__ == "__main__":
@@ -0,0 +1,281 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium.common import WebDriverException
+
+from DriverManager.BrowserManager import BrowserManager
+
+
+class BrowserPool:
+    """
+    Conjunto de instancias de BrowserManager ya arrancadas que se prestan a los hilos de trabajo.
+
+    Arrancar un driver es lo más costoso de cada prueba, así que el pool los arranca una sola vez
+    y entre préstamo y préstamo solo limpia su estado con BrowserManager.reset_session().
+    """
+    def __init__(self, browser_types, size=None, profile=None, instrumentation=None, retry_policy=None,
+                 request_filter=None):
+        """
+        Arranca en paralelo los navegadores del pool.
+
+        :param browser_types: Lista de tipos de navegador ("chrome", "firefox"). Si 'size' es mayor que la lista,
+                              los tipos se repiten en orden hasta completar el tamaño.
+        :param size: Número de navegadores del pool. Por defecto, uno por cada elemento de 'browser_types'.
+        :param profile: Perfil de arranque de todos los navegadores del pool. Ver BrowserManager.
+        :param instrumentation: Instrumentation compartida por todos los navegadores del pool. Ver BrowserManager.
+        :param retry_policy: RetryPolicy compartida por todos los navegadores del pool, de modo que los tiempos
+                             aprendidos en un navegador sirven a los demás. Ver BrowserManager.
+        :param request_filter: Filtro de peticiones de todos los navegadores del pool. Ver BrowserManager.
+
+        :type browser_types: list[str]
+        :type size: int
+        :type profile: str or LaunchProfile
+        :type instrumentation: Instrumentation
+        :type retry_policy: RetryPolicy
+        :type request_filter: RequestFilter or None
+
+        :raises ValueError: Si la lista de navegadores está vacía o el tipo de navegador o el perfil no son soportados.
+        :raises WebDriverException: Si algún navegador no arranca. Los que sí arrancaron se cierran.
+        """
+        if not browser_types:
+            raise ValueError("El pool necesita al menos un tipo de navegador.")
+        if size is None:
+            size = len(browser_types)
+
+        self.profile = profile
+        self.instrumentation = instrumentation
+        self.retry_policy = retry_policy
+        self.request_filter = request_filter
+        types = [browser_types[i % len(browser_types)] for i in range(size)]
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(self._new_browser, browser_type) for browser_type in types]
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            # Sin esto los navegadores que sí arrancaron quedarían abiertos sin que nadie pueda cerrarlos
+            for future in futures:
+                if future.exception() is None:
+                    try:
+                        future.result().close_browser()
+                    except Exception:
+                        pass
+            raise errors[0]
+        self.browsers = [future.result() for future in futures]
+
+        self.size = size
+        self._idle = list(self.browsers)
+        # Tipos de los navegadores que no se pudieron reemplazar; acquire() vuelve a intentar arrancarlos
+        self._vacant = []
+        self._condition = threading.Condition()
+
+    def _new_browser(self, browser_type):
+        """
+        Arranca un navegador del pool con el perfil y el filtro de peticiones del pool.
+        """
+        return BrowserManager(browser_type, profile=self.profile, instrumentation=self.instrumentation,
+                              retry_policy=self.retry_policy, request_filter=self.request_filter)
+
+    def _refill(self):
+        """
+        Intenta arrancar los navegadores de los huecos que dejó un reemplazo fallido en release().
+
+        :return: La última excepción de arranque, o None si se arrancaron todos.
+        :rtype: Exception or None
+        """
+        with self._condition:
+            vacant, self._vacant = self._vacant, []
+        last_error = None
+        for browser_type in vacant:
+            try:
+                browser = self._new_browser(browser_type)
+            except Exception as error:
+                print(f"\n\t*** = ***\nError: No se pudo arrancar un navegador '{browser_type}' para el pool: {error}")
+                last_error = error
+                with self._condition:
+                    self._vacant.append(browser_type)
+                continue
+            with self._condition:
+                self.browsers.append(browser)
+                self._idle.append(browser)
+                self._condition.notify()
+        return last_error
+
+    def _take_idle(self, browser_type):
+        """
+        Saca de la lista de libres el primer navegador del tipo pedido. Debe llamarse con el lock tomado.
+
+        :param browser_type: Tipo de navegador buscado, o None para aceptar cualquiera.
+
+        :type browser_type: str or None
+
+        :return: El BrowserManager libre, o None si no hay ninguno.
+        :rtype: BrowserManager or None
+        """
+        for browser in self._idle:
+            if browser_type is None or browser.browser_type == browser_type:
+                self._idle.remove(browser)
+                return browser
+        return None
+
+    def acquire(self, browser_type=None, timeout=None):
+        """
+        Toma un navegador libre del pool, esperando si todos están prestados.
+
+        :param browser_type: Tipo de navegador requerido, o None para aceptar cualquiera.
+        :param timeout: Segundos máximos de espera. None espera indefinidamente.
+
+        :type browser_type: str or None
+        :type timeout: float or None
+
+        :return: El BrowserManager prestado.
+        :rtype: BrowserManager
+
+        :raises ValueError: Si el pool no tiene navegadores del tipo pedido.
+        :raises TimeoutError: Si no queda ninguno libre en el tiempo permitido.
+        :raises WebDriverException: Si el pool se ha quedado sin navegadores del tipo pedido y no se pueden arrancar.
+        """
+        if browser_type is not None:
+            browser_type = browser_type.lower()
+        with self._condition:
+            types = [browser.browser_type for browser in self.browsers] + self._vacant
+        if browser_type is not None and browser_type not in types:
+            raise ValueError(f"El pool no tiene navegadores '{browser_type}'.")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._vacant:
+                error = self._refill()
+                if error is not None and not self._running(browser_type):
+                    # Sin navegadores en marcha la espera no acabaría nunca
+                    raise error
+
+            with self._condition:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                # También se despierta si release() deja el pool sin navegadores en marcha de este tipo
+                self._condition.wait_for(lambda: any(browser_type is None or b.browser_type == browser_type
+                                                     for b in self._idle)
+                                         or (self._vacant and not self._running(browser_type)), remaining)
+                browser = self._take_idle(browser_type)
+            if browser is not None:
+                return browser
+            if not self._vacant or self._running(browser_type):
+                raise TimeoutError(f"No hay navegadores libres en el pool tras {timeout} segundos.")
+
+    def _running(self, browser_type):
+        """
+        Indica si el pool tiene algún navegador en marcha (libre o prestado) del tipo pedido.
+        """
+        with self._condition:
+            return any(browser_type is None or browser.browser_type == browser_type for browser in self.browsers)
+
+    def release(self, browser):
+        """
+        Limpia el estado del navegador y lo devuelve al pool.
+
+        Si la limpieza falla (driver colgado o cerrado), se descarta y se arranca uno nuevo del mismo tipo.
+        Si tampoco se puede arrancar el nuevo, el hueco queda pendiente y acquire() vuelve a intentarlo;
+        release() nunca lanza excepciones, para no ocultar las del bloque que usaba el navegador.
+
+        :param browser: El BrowserManager obtenido con acquire().
+
+        :type browser: BrowserManager
+        """
+        try:
+            browser.reset_session()
+        except Exception:
+            try:
+                browser.close_browser()
+            except Exception:
+                pass
+            try:
+                replacement = self._new_browser(browser.browser_type)
+            except Exception as error:
+                print(f"\n\t*** = ***\nError: No se pudo reemplazar un navegador '{browser.browser_type}' del pool: "
+                      f"{error}")
+                replacement = None
+            with self._condition:
+                self.browsers.remove(browser)
+                if replacement is None:
+                    self._vacant.append(browser.browser_type)
+                    # Los hilos en espera comprueban de nuevo si quedan navegadores en marcha
+                    self._condition.notify_all()
+                    return
+                self.browsers.append(replacement)
+            browser = replacement
+
+        with self._condition:
+            self._idle.append(browser)
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self, browser_type=None, timeout=None):
+        """
+        Presta un navegador durante el bloque 'with' y lo devuelve limpio al salir.
+
+        :param browser_type: Tipo de navegador requerido, o None para aceptar cualquiera.
+        :param timeout: Segundos máximos de espera por un navegador libre.
+
+        :type browser_type: str or None
+        :type timeout: float or None
+        """
+        browser = self.acquire(browser_type, timeout)
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    def map(self, func, items, browser_type=None):
+        """
+        Ejecuta 'func(browser, item)' para cada elemento de 'items', repartiéndolos entre los navegadores del pool.
+
+        :param func: Función que recibe un BrowserManager prestado y un elemento.
+        :param items: Elementos a procesar.
+        :param browser_type: Tipo de navegador requerido, o None para aceptar cualquiera.
+
+        :type func: callable
+        :type items: iterable
+        :type browser_type: str or None
+
+        :return: Lista con los resultados de 'func' en el mismo orden que 'items'.
+        :rtype: list
+        """
+        def run(item):
+            with self.lease(browser_type) as browser:
+                return func(browser, item)
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, items))
+
+    def run_logins(self, loginpages, seconds, browser_type=None):
+        """
+        Ejecuta BrowserManager.login() para cada LoginPage usando los navegadores del pool en paralelo.
+
+        :param loginpages: Lista de LoginPage, por ejemplo la de LoginPage.read_login_data_from_json().
+        :param seconds: Tiempo en segundos a esperar entre acciones.
+        :param browser_type: Tipo de navegador requerido, o None para aceptar cualquiera.
+
+        :type loginpages: list[LoginPage]
+        :type seconds: float
+        :type browser_type: str or None
+        """
+        self.map(lambda browser, loginpage: browser.login(loginpage, seconds), loginpages, browser_type)
+
+    def close(self):
+        """
+        Cierra todos los navegadores del pool.
+        """
+        for browser in self.browsers:
+            try:
+                browser.close_browser()
+            except WebDriverException:
+                pass
+        self.browsers = []
+        self._idle = []
+        self._vacant = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,7 +1,12 @@
 class Credentials:
     """
     Clase que almacena las credenciales de un usuario.
+
+    Es inmutable y usa __slots__: no tiene __dict__ por instancia, lo que reduce su tamaño en memoria
+    cuando se cargan miles de páginas de login.
     """
+    __slots__ = ('username', 'pwd')
+
     def __init__(self, username, pwd):
         """
         Inicializa las credenciales con el nombre de usuario y la contraseña.
@@ -12,5 +17,15 @@ class Credentials:
         :type username: str
         :type pwd: str
         """
-        self.username = username
-        self.pwd = pwd
\ No newline at end of file
+        object.__setattr__(self, 'username', username)
+        object.__setattr__(self, 'pwd', pwd)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Credentials es inmutable: no se puede cambiar '{name}'.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Credentials es inmutable: no se puede borrar '{name}'.")
+
+    def __reduce__(self):
+        # Sin esto pickle restauraría los atributos con __setattr__, que no está permitido
+        return Credentials, (self.username, self.pwd)
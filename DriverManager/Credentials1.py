@@ -1,16 +1,9 @@
-class Credentials1:
-    """
-    Clase que almacena las credenciales de un usuario.
-    """
-    def __init__(self, username, pwd):
-        """
-        Inicializa las credenciales con el nombre de usuario y la contraseña.
+"""
+Nombre antiguo de Credentials, conservado por compatibilidad.
 
-        :param username: El nombre de usuario.
-        :param pwd: La contraseña.
+Antes era una copia de la clase; ahora es la misma, de modo que cargar páginas con LoginPage1 no crea
+un segundo grafo de objetos paralelo.
+"""
+from DriverManager.Credentials import Credentials
 
-        :type username: str
-        :type pwd: str
-        """
-        self.username = username
-        self.pwd = pwd
\ No newline at end of file
+Credentials1 = Credentials
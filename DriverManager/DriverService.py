@@ -0,0 +1,96 @@
+import atexit
+import os
+import shutil
+import threading
+from functools import lru_cache
+
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+# Nombre del ejecutable de cada driver y variable de entorno que permite indicar su ruta
+DRIVER_NAMES = {
+    'chrome': ('chromedriver', 'CHROMEDRIVER_PATH'),
+    'firefox': ('geckodriver', 'GECKODRIVER_PATH')
+}
+
+_shared_services = {}
+_shared_services_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def find_driver_path(browser_type):
+    """
+    Busca el ejecutable del driver una sola vez por proceso.
+
+    Orden de búsqueda: la variable de entorno (CHROMEDRIVER_PATH o GECKODRIVER_PATH), la carpeta
+    'DriverManager/webdrivers' (con o sin '.exe') y el PATH del sistema.
+
+    :param browser_type: "chrome" o "firefox".
+
+    :type browser_type: str
+
+    :return: La ruta absoluta del driver, o None si no se encuentra (Selenium Manager lo resolverá).
+    :rtype: str or None
+    """
+    driver_name, env_var = DRIVER_NAMES[browser_type]
+    if os.environ.get(env_var):
+        return os.environ[env_var]
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))  # Obtiene directorio actual del archivo que lo ejecuta
+    for file_name in (driver_name + '.exe', driver_name):
+        driver_path = os.path.join(base_dir, "webdrivers", file_name)  # Construye la ruta absoluta
+        if os.path.isfile(driver_path) and os.access(driver_path, os.X_OK):
+            return driver_path
+
+    return shutil.which(driver_name)
+
+
+class SharedChromeService(ChromeService):
+    """
+    Servicio de chromedriver compartido por todos los BrowserManager de Chrome del proceso.
+
+    Un mismo chromedriver atiende muchas sesiones, así que solo se arranca la primera vez (o si ha muerto)
+    y driver.quit() no lo detiene: se detiene al terminar el proceso con shutdown().
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        with self._start_lock:
+            process = getattr(self, 'process', None)
+            if process is None or process.poll() is not None:
+                super().start()
+
+    def stop(self):
+        # Las sesiones no detienen el servicio compartido
+        pass
+
+    def shutdown(self):
+        """
+        Detiene el proceso de chromedriver.
+        """
+        super().stop()
+
+
+def get_shared_service(browser_type):
+    """
+    Devuelve el servicio compartido del navegador, creándolo la primera vez.
+
+    Solo Chrome admite servicio compartido: geckodriver atiende una única sesión por proceso.
+
+    :param browser_type: "chrome".
+
+    :type browser_type: str
+
+    :rtype: SharedChromeService
+
+    :raises ValueError: Si el navegador no admite servicio compartido.
+    """
+    if browser_type != 'chrome':
+        raise ValueError(f"El navegador '{browser_type}' no admite servicio compartido.")
+    with _shared_services_lock:
+        if browser_type not in _shared_services:
+            service = SharedChromeService(executable_path=find_driver_path(browser_type))
+            _shared_services[browser_type] = service
+            atexit.register(service.shutdown)
+        return _shared_services[browser_type]
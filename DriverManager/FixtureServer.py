@@ -0,0 +1,118 @@
+import json
+import os
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class FixtureRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Sirve los archivos de 'DriverManager/fixture_site' sin escribir cada petición en la consola.
+
+    Además de los archivos estáticos atiende dos rutas especiales:
+        - '/slow/<archivo>?ms=N': sirve '<archivo>' tras esperar N milisegundos (1000 por defecto).
+        - '/api/rows?n=N&delay=MS': devuelve N filas en JSON tras esperar MS milisegundos, para la página AJAX.
+    """
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+
+        if url.path.startswith('/slow/'):
+            time.sleep(int(query.get('ms', ['1000'])[0]) / 1000)
+            self.path = url.path[len('/slow'):]
+            return super().do_GET()
+
+        if url.path == '/api/rows':
+            time.sleep(int(query.get('delay', ['0'])[0]) / 1000)
+            n = int(query.get('n', ['10'])[0])
+            body = json.dumps([{'id': i, 'name': f"Fila {i}"} for i in range(1, n + 1)]).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        return super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """
+    Servidor HTTP local que sirve el sitio de pruebas de 'DriverManager/fixture_site'.
+
+    Permite ejecutar y medir BrowserManager sin depender de URLs externas.
+    """
+    def __init__(self, port=0, directory=None):
+        """
+        Prepara el servidor sin arrancarlo.
+
+        :param port: Puerto en el que escuchar. Con 0 el sistema elige uno libre.
+        :param directory: Directorio a servir. Por defecto 'DriverManager/fixture_site'.
+
+        :type port: int
+        :type directory: str
+        """
+        if directory is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))  # Obtiene directorio actual del archivo que lo ejecuta
+            directory = os.path.join(base_dir, "fixture_site")  # Construye la ruta absoluta
+        self.port = port
+        self.directory = directory
+        self.httpd = None
+        self.thread = None
+
+    def start(self):
+        """
+        Arranca el servidor en un hilo en segundo plano.
+
+        :return: El propio servidor, para poder encadenar llamadas.
+        :rtype: FixtureServer
+        """
+        handler = partial(FixtureRequestHandler, directory=self.directory)
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', self.port), handler)
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Detiene el servidor y libera el puerto.
+        """
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def url(self, path=''):
+        """
+        Construye la URL absoluta de un recurso del sitio de pruebas.
+
+        :param path: Ruta relativa del recurso, por ejemplo 'login.html'.
+
+        :type path: str
+
+        :return: La URL completa.
+        :rtype: str
+        """
+        return f"http://127.0.0.1:{self.port}/{path.lstrip('/')}"
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+if __name__ == "__main__":
+    with FixtureServer(port=8000) as server:
+        print(f"Sitio de pruebas disponible en {server.url('login.html')} (Ctrl+C para salir)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
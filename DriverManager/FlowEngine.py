@@ -0,0 +1,341 @@
+import json
+import os
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from DriverManager.LoginPageRegistry import default_registry
+
+ACTIONS = ('login', 'navigate', 'fill', 'click', 'wait_for', 'extract')
+SELECTOR_TYPES = ('xpath', 'id', 'css', 'name')
+# Parámetros obligatorios de cada acción; una tupla indica parámetros alternativos
+REQUIRED_PARAMS = {
+    'fill': ('selector', 'value'),
+    'click': ('selector',),
+    'wait_for': (('selector', 'url_contains'),),
+    'extract': ('name', ('selector', 'table')),
+}
+
+# Un único script para un lote de extracciones; devuelve null para los elementos que no encuentra
+EXTRACT_SCRIPT = """
+    var specs = arguments[0], values = {};
+    function findAll(type, selector) {
+        if (type === 'xpath') {
+            var result = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+            return nodes;
+        }
+        if (type === 'id') {
+            var element = document.getElementById(selector);
+            return element ? [element] : [];
+        }
+        if (type === 'name') return Array.prototype.slice.call(document.getElementsByName(selector));
+        return Array.prototype.slice.call(document.querySelectorAll(selector));
+    }
+    function read(element, attribute) {
+        if (attribute) return element.getAttribute(attribute);
+        return (element.innerText !== undefined ? element.innerText : element.textContent).trim();
+    }
+    for (var i = 0; i < specs.length; i++) {
+        var spec = specs[i], elements = findAll(spec.selector_type, spec.selector);
+        if (spec.all) {
+            values[spec.name] = elements.map(function (element) { return read(element, spec.attribute); });
+        } else {
+            values[spec.name] = elements.length ? read(elements[0], spec.attribute) : null;
+        }
+    }
+    return values;
+"""
+
+
+class PlanStep:
+    """
+    Paso del plan de ejecución de un flujo. Puede agrupar varios pasos declarados ('actions') que se ejecutan
+    en una sola llamada al navegador.
+    """
+    def __init__(self, kind, actions, params):
+        """
+        :param kind: 'navigate', 'form' (rellenar campos y opcionalmente hacer clic), 'wait_for', 'extract'
+                     o 'extract_table'.
+        :param actions: Pasos declarados que se ejecutan en este paso del plan.
+        :param params: Parámetros del paso.
+
+        :type kind: str
+        :type actions: list[dict]
+        :type params: dict
+        """
+        self.kind = kind
+        self.actions = actions
+        self.params = params
+
+    @property
+    def name(self):
+        return '+'.join(action['action'] for action in self.actions)
+
+
+def _selector_type(step):
+    selector_type = step.get('selector_type', 'xpath')
+    if selector_type not in SELECTOR_TYPES:
+        raise ValueError(f"Tipo de selector '{selector_type}' no válido en el paso {step}. Use uno de {SELECTOR_TYPES}.")
+    return selector_type
+
+
+def _expand(flow, page):
+    """
+    Sustituye los pasos 'login' por los pasos equivalentes con los selectores del LoginPage,
+    y los valores '{username}' y '{password}' por sus credenciales.
+    """
+    steps = []
+    for step in flow['steps']:
+        step = dict(step)  # Los pasos se completan sin modificar el flujo original
+        if step.get('action') not in ACTIONS:
+            raise ValueError(f"Acción '{step.get('action')}' no soportada en el flujo '{flow['id']}'. "
+                             f"Use una de {ACTIONS}.")
+        if step['action'] == 'login':
+            if page is None or not page.username_selector:
+                raise ValueError(f"El paso 'login' del flujo '{flow['id']}' necesita un LoginPage con formulario.")
+            steps += [
+                {'action': 'navigate'},
+                {'action': 'fill', 'selector': page.username_selector, 'value': '{username}'},
+                {'action': 'fill', 'selector': page.pwd_selector, 'value': '{password}'},
+                {'action': 'click', 'selector': page.login_button_selector}
+            ]
+        else:
+            steps.append(step)
+
+    for step in steps:
+        required = REQUIRED_PARAMS.get(step['action'], ())
+        missing = [' o '.join(keys) for keys in (key if isinstance(key, tuple) else (key,) for key in required)
+                   if not any(key in step for key in keys)]
+        if missing:
+            raise ValueError(f"Al paso '{step['action']}' del flujo '{flow['id']}' le falta {', '.join(missing)}: "
+                             f"{step}.")
+        if step['action'] == 'extract' and 'table' in step and (
+                step.get('selector_type', 'css') != 'css' or step['table'].startswith(('/', '('))):
+            raise ValueError(f"La tabla del paso 'extract' del flujo '{flow['id']}' se indica con un selector CSS: "
+                             f"{step}.")
+        if step['action'] == 'navigate' and not step.get('url'):
+            if page is None:
+                raise ValueError(f"El paso 'navigate' del flujo '{flow['id']}' necesita 'url' o un LoginPage.")
+            step['url'] = page.url
+        if step['action'] == 'fill':
+            step['value'] = str(step['value'])  # Los números del JSON se escriben como texto
+        if step['action'] == 'fill' and page is not None:
+            step['value'] = step['value'].replace('{username}', page.credentials.username) \
+                                         .replace('{password}', page.credentials.pwd)
+    return steps
+
+
+def compile_flow(flow, registry=None):
+    """
+    Convierte un flujo declarado en JSON en un plan de ejecución.
+
+    Los 'fill' seguidos con el mismo tipo de selector, junto con el 'click' que los siga, se ejecutan con una
+    sola llamada a BrowserManager.fill_form(), en el orden declarado y aunque repitan selector. Los 'extract'
+    de texto o atributo seguidos se leen con un solo execute_script. 'navigate', 'wait_for' y las extracciones
+    de tablas son pasos propios.
+
+    :param flow: Flujo con 'id', 'steps' y opcionalmente 'page' ('id' de un LoginPage).
+    :param registry: Registro de LoginPage. Por defecto el de 'data_load/login_data.json'.
+
+    :type flow: dict
+    :type registry: LoginPageRegistry
+
+    :return: Lista de pasos del plan.
+    :rtype: list[PlanStep]
+
+    :raises ValueError: Si el flujo tiene acciones, tipos de selector o LoginPage no válidos, o le faltan
+                        parámetros obligatorios a algún paso.
+    """
+    registry = registry if registry is not None else default_registry
+    page = None
+    if flow.get('page'):
+        page = registry.get(flow['page'])
+        if page is None:
+            raise ValueError(f"LoginPage '{flow['page']}' del flujo '{flow['id']}' no encontrado.")
+
+    plan = []
+    for step in _expand(flow, page):
+        action = step['action']
+        last = plan[-1] if plan else None
+
+        if action in ('fill', 'click'):
+            selector_type = _selector_type(step)
+            # Se añade al formulario anterior si usa el mismo tipo de selector y aún no tiene clic
+            if (last is None or last.kind != 'form' or last.params['selector_type'] != selector_type
+                    or last.params['submit'] is not None):
+                last = PlanStep('form', [], {'fields': [], 'submit': None, 'selector_type': selector_type})
+                plan.append(last)
+            last.actions.append(step)
+            if action == 'fill':
+                last.params['fields'].append((step['selector'], step['value']))
+            else:
+                last.params['submit'] = step['selector']
+
+        elif action == 'extract' and 'table' in step:
+            plan.append(PlanStep('extract_table', [step], {
+                'name': step['name'], 'selector': step['table'], 'header_rows': step.get('header_rows', 1),
+                'decimal': step.get('decimal', '.')}))
+
+        elif action == 'extract':
+            spec = {'name': step['name'], 'selector': step['selector'], 'selector_type': _selector_type(step),
+                    'attribute': step.get('attribute'), 'all': step.get('all', False)}
+            if last is None or last.kind != 'extract':
+                last = PlanStep('extract', [], {'specs': []})
+                plan.append(last)
+            last.actions.append(step)
+            last.params['specs'].append(spec)
+
+        elif action == 'wait_for':
+            params = {'timeout': step.get('timeout'), 'state': step.get('state', 'visible'),
+                      'url_contains': step.get('url_contains')}
+            if params['url_contains'] is None:
+                params['selector'] = step['selector']
+                params['selector_type'] = _selector_type(step)
+            plan.append(PlanStep('wait_for', [step], params))
+
+        else:
+            plan.append(PlanStep('navigate', [step], {'url': step['url']}))
+    return plan
+
+
+class FlowEngine:
+    """
+    Ejecuta flujos de varios pasos (navegar, rellenar, hacer clic, esperar y extraer) declarados en
+    'DriverManager/data_load/flows.json'.
+
+    La estructura del archivo JSON se explica en 'DriverManager/data_load/README.md'.
+    """
+    def __init__(self, path=None, registry=None):
+        """
+        :param path: Ruta del archivo de flujos. Por defecto 'data_load/flows.json'.
+        :param registry: Registro de LoginPage a los que se refieren los flujos. Por defecto el compartido.
+
+        :type path: str or None
+        :type registry: LoginPageRegistry
+        """
+        if path is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))  # Obtiene directorio actual del archivo que lo ejecuta
+            path = os.path.join(base_dir, "data_load", "flows.json")  # Construye la ruta absoluta
+        self.path = path
+        self.registry = registry if registry is not None else default_registry
+        with open(path, encoding='utf-8') as file:
+            self.flows = {flow['id']: flow for flow in json.load(file)}
+        self._plans = {}
+
+    def plan(self, flow_id):
+        """
+        Devuelve el plan de ejecución de un flujo, compilándolo la primera vez.
+
+        :param flow_id: 'id' del flujo.
+
+        :type flow_id: str
+
+        :rtype: list[PlanStep]
+
+        :raises ValueError: Si el flujo no existe o no es válido.
+        """
+        if flow_id not in self._plans:
+            if flow_id not in self.flows:
+                raise ValueError(f"Flujo '{flow_id}' no encontrado en {self.path}.")
+            self._plans[flow_id] = compile_flow(self.flows[flow_id], self.registry)
+        return self._plans[flow_id]
+
+    @staticmethod
+    def _run_step(browser, step, data):
+        """
+        Ejecuta un paso del plan.
+
+        :return: True si el paso se completó.
+        :rtype: bool
+        """
+        params = step.params
+        if step.kind == 'navigate':
+            browser.open_browser(params['url'])
+            return True
+
+        if step.kind == 'form':
+            return browser.fill_form(params['fields'], params['submit'], params['selector_type'])
+
+        if step.kind == 'wait_for':
+            if params['url_contains'] is not None:
+                condition = EC.url_contains(params['url_contains'])
+            elif params['state'] == 'absent':
+                return bool(browser.is_absent(params['selector_type'], params['selector'], params['timeout']))
+            else:
+                by = {'xpath': By.XPATH, 'id': By.ID, 'css': By.CSS_SELECTOR, 'name': By.NAME}[params['selector_type']]
+                condition = EC.visibility_of_element_located((by, params['selector']))
+            return browser.waits.wait(browser.driver, condition, params['timeout'])
+
+        if step.kind == 'extract_table':
+            columns = browser.extract_table(params['selector'], params['header_rows'], params['decimal'])
+            if columns is None:
+                return False
+            data[params['name']] = {name: list(values) for name, values in columns.items()}
+            return True
+
+        data.update(browser.driver.execute_script(EXTRACT_SCRIPT, params['specs']))
+        return True
+
+    def run(self, browser, flow_id):
+        """
+        Ejecuta un flujo con el navegador indicado. Se detiene en el primer paso que falla.
+
+        :param browser: Navegador en el que se ejecuta el flujo.
+        :param flow_id: 'id' del flujo.
+
+        :type browser: BrowserManager
+        :type flow_id: str
+
+        :return: Diccionario con 'flow', 'ok', 'data' (valores extraídos), 'duration' y 'steps'; cada paso
+                 con 'name', 'actions' (pasos declarados que agrupa), 'ok' y 'duration' en segundos.
+        :rtype: dict
+        """
+        result = {'flow': flow_id, 'ok': True, 'data': {}, 'duration': 0.0, 'steps': []}
+        start = time.perf_counter()
+        with browser.instrumentation.span('flow', 'action', flow=flow_id):
+            for step in self.plan(flow_id):
+                step_start = time.perf_counter()
+                with browser.instrumentation.span(f"flow.{step.kind}", 'action', flow=flow_id):
+                    ok = self._run_step(browser, step, result['data'])
+                result['steps'].append({'name': step.name, 'actions': len(step.actions), 'ok': ok,
+                                        'duration': time.perf_counter() - step_start})
+                if not ok:
+                    print(f"\n\t*** = ***\nError: El paso '{step.name}' del flujo '{flow_id}' no se completó.")
+                    result['ok'] = False
+                    break
+        result['duration'] = time.perf_counter() - start
+        return result
+
+    def run_many(self, pool, flow_ids, browser_type=None):
+        """
+        Ejecuta varios flujos independientes en paralelo, cada uno en un navegador del pool.
+
+        :param pool: Pool de navegadores.
+        :param flow_ids: 'id' de los flujos.
+        :param browser_type: Tipo de navegador requerido, o None para aceptar cualquiera.
+
+        :type pool: BrowserPool
+        :type flow_ids: list[str]
+        :type browser_type: str or None
+
+        :return: Resultados de run() en el orden de 'flow_ids'.
+        :rtype: list[dict]
+        """
+        for flow_id in flow_ids:
+            self.plan(flow_id)  # Compila todos antes de repartir, para fallar pronto si alguno no es válido
+        return pool.map(self.run, flow_ids, browser_type)
+
+
+if __name__ == "__main__":
+    from DriverManager.BrowserPool import BrowserPool
+
+    engine = FlowEngine()
+    with BrowserPool(['chrome'], size=3, profile='headless') as pool:
+        for result in engine.run_many(pool, list(engine.flows)):
+            print(f"{result['flow']}: {'correcto' if result['ok'] else 'fallido'} en {result['duration']:.2f}s")
+            for step in result['steps']:
+                print(f"    {step['name']:30} {step['duration']:6.2f}s")
+            print(f"    datos: {list(result['data'])}")
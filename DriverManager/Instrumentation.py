@@ -0,0 +1,236 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class Instrumentation:
+    """
+    Registra en qué se va el tiempo de BrowserManager: cada orden WebDriver (ida y vuelta al driver),
+    las esperas por condición, las pausas fijas, los reintentos y los aciertos de caché.
+
+    Cada medida es un span (diccionario con nombre, categoría, inicio, duración, span padre y atributos).
+    Los spans se pueden exportar a JSON o a un JSON con la forma de OpenTelemetry (OTLP).
+    Los contadores (reintentos, aciertos de caché...) se guardan aparte con count().
+
+    summary() se calcula sobre la marcha con todos los spans y contadores. Para que la memoria no crezca sin límite
+    en ejecuciones largas, solo se conservan los últimos 'max_spans' spans y contadores para exportarlos.
+    """
+    def __init__(self, max_spans=10000):
+        """
+        :param max_spans: Número máximo de spans (y de contadores) que se conservan para exportar.
+                          None los conserva todos.
+
+        :type max_spans: int or None
+        """
+        self.spans = deque(maxlen=max_spans)
+        self.counters = deque(maxlen=max_spans)
+        self.current_test = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._next_id = 1
+        # Agregados de summary() por prueba, actualizados al cerrar cada span y en cada count()
+        self._totals = {}
+
+    @staticmethod
+    def _empty_totals():
+        return {'commands': 0, 'command_time': 0.0, 'wait_time': 0.0, 'sleep_time': 0.0, 'action_time': 0.0,
+                'retries': 0, 'cache_hits': 0, 'cache_misses': 0}
+
+    def _new_id(self):
+        with self._lock:
+            span_id = self._next_id
+            self._next_id += 1
+            return span_id
+
+    @contextmanager
+    def span(self, name, category, **attributes):
+        """
+        Mide la duración del bloque 'with' como un span.
+
+        :param name: Nombre del span, por ejemplo la orden WebDriver o el método de BrowserManager.
+        :param category: 'command', 'wait', 'sleep' o 'action'.
+        :param attributes: Atributos adicionales del span.
+
+        :type name: str
+        :type category: str
+        """
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        parent_id, parent_category = stack[-1] if stack else (None, None)
+        span = {
+            'id': self._new_id(),
+            'parent': parent_id,
+            'name': name,
+            'category': category,
+            'test': self.current_test,
+            'thread': threading.current_thread().name,
+            'start': time.time(),
+            'duration': None,
+            'attributes': attributes
+        }
+        stack.append((span['id'], category))
+        start = time.perf_counter()
+        try:
+            yield span
+        except Exception as error:
+            span['attributes']['error'] = type(error).__name__
+            raise
+        finally:
+            span['duration'] = time.perf_counter() - start
+            stack.pop()
+            with self._lock:
+                self.spans.append(span)
+                totals = self._totals.setdefault(span['test'], self._empty_totals())
+                if category == 'command':
+                    totals['commands'] += 1
+                    totals['command_time'] += span['duration']
+                elif category in ('wait', 'sleep'):
+                    totals[category + '_time'] += span['duration']
+                elif category == 'action' and parent_category != 'action':
+                    # Solo las acciones de primer nivel, para no contar dos veces login() y sus write()/click()
+                    totals['action_time'] += span['duration']
+
+    def count(self, name, **attributes):
+        """
+        Registra un evento contable, como un reintento o un acierto de caché.
+
+        :param name: Nombre del evento, por ejemplo 'retry' o 'locator_cache.hit'.
+
+        :type name: str
+        """
+        with self._lock:
+            self.counters.append({'name': name, 'test': self.current_test, 'time': time.time(),
+                                  'attributes': attributes})
+            totals = self._totals.setdefault(self.current_test, self._empty_totals())
+            if name == 'retry':
+                totals['retries'] += 1
+            elif name.endswith('.hit'):
+                totals['cache_hits'] += 1
+            elif name.endswith('.miss'):
+                totals['cache_misses'] += 1
+
+    def attach(self, driver):
+        """
+        Envuelve 'driver.execute' para medir cada orden WebDriver, incluidas las de los WebElement.
+
+        :param driver: El WebDriver a instrumentar.
+
+        :type driver: WebDriver
+        """
+        execute = driver.execute
+
+        def instrumented_execute(driver_command, params=None):
+            with self.span(driver_command, 'command'):
+                return execute(driver_command, params)
+
+        driver.execute = instrumented_execute
+
+    def summary(self, by_test=False):
+        """
+        Devuelve los agregados de todos los spans y contadores registrados, también de los que ya no se conservan.
+
+        :param by_test: Si es True, devuelve los agregados de cada prueba en lugar del total.
+
+        :type by_test: bool
+
+        :return: Diccionario (o diccionario prueba -> diccionario) con 'commands', 'command_time', 'wait_time',
+                 'sleep_time', 'action_time', 'retries', 'cache_hits' y 'cache_misses'.
+        :rtype: dict
+        """
+        with self._lock:
+            totals = {test: dict(result) for test, result in self._totals.items()}
+        if by_test:
+            return totals
+        result = self._empty_totals()
+        for test_totals in totals.values():
+            for key, value in test_totals.items():
+                result[key] += value
+        return result
+
+    def export_json(self, path):
+        """
+        Escribe los spans y contadores conservados (los últimos 'max_spans') en un archivo JSON.
+
+        :param path: Ruta del archivo.
+
+        :type path: str
+        """
+        with self._lock:
+            data = {'spans': list(self.spans), 'counters': list(self.counters)}
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2)
+
+    def export_otel(self, path, service_name='DriverManager'):
+        """
+        Escribe los spans conservados en un archivo JSON con la estructura de exportación OTLP de OpenTelemetry,
+        para poder cargarlos en herramientas compatibles.
+
+        :param path: Ruta del archivo.
+        :param service_name: Valor del atributo 'service.name' del recurso.
+
+        :type path: str
+        :type service_name: str
+        """
+        trace_id = os.urandom(16).hex()
+        with self._lock:
+            spans = list(self.spans)
+
+        def attribute(key, value):
+            return {'key': key, 'value': {'stringValue': str(value)}}
+
+        otel_spans = []
+        for span in spans:
+            attributes = [attribute('category', span['category']), attribute('thread', span['thread'])]
+            if span['test']:
+                attributes.append(attribute('test', span['test']))
+            attributes += [attribute(key, value) for key, value in span['attributes'].items()]
+            otel_spans.append({
+                'traceId': trace_id,
+                'spanId': f"{span['id']:016x}",
+                'parentSpanId': f"{span['parent']:016x}" if span['parent'] else '',
+                'name': span['name'],
+                'startTimeUnixNano': str(int(span['start'] * 1e9)),
+                'endTimeUnixNano': str(int((span['start'] + span['duration']) * 1e9)),
+                'attributes': attributes
+            })
+        data = {'resourceSpans': [{
+            'resource': {'attributes': [attribute('service.name', service_name)]},
+            'scopeSpans': [{'scope': {'name': 'DriverManager.Instrumentation'}, 'spans': otel_spans}]
+        }]}
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2)
+
+
+class NullInstrumentation:
+    """
+    Instrumentación que no registra nada. Es la que usa BrowserManager por defecto, sin coste apreciable.
+    """
+    @contextmanager
+    def span(self, name, category, **attributes):
+        yield None
+
+    def count(self, name, **attributes):
+        pass
+
+    def attach(self, driver):
+        pass
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+
+def traced(method):
+    """
+    Decorador para métodos de BrowserManager: mide cada llamada como un span de categoría 'action'
+    con la instrumentación de la instancia.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.instrumentation.span(method.__name__, 'action'):
+            return method(self, *args, **kwargs)
+    return wrapper
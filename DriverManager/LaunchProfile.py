@@ -0,0 +1,148 @@
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+
+class LaunchProfile:
+    """
+    Conjunto de opciones con las que BrowserManager arranca el navegador.
+
+    Los perfiles predefinidos están en PROFILES y se eligen por nombre con get_profile().
+    """
+    def __init__(self, name, headless=False, block_images=False, block_fonts=False, block_css=False,
+                 disable_extensions=False, window_size=None, page_load_strategy='normal', arguments=None):
+        """
+        :param name: Nombre del perfil.
+        :param headless: Si es True, el navegador arranca sin ventana.
+        :param block_images: Si es True, no se descargan imágenes.
+        :param block_fonts: Si es True, no se descargan fuentes web.
+        :param block_css: Si es True, no se descargan hojas de estilo.
+        :param disable_extensions: Si es True, se desactivan las extensiones (solo Chrome; Firefox ya arranca sin ellas).
+        :param window_size: Tupla (ancho, alto) de la ventana. Si es None, open_browser() maximiza la ventana.
+        :param page_load_strategy: 'normal', 'eager' (espera solo al DOM) o 'none'.
+        :param arguments: Argumentos extra de línea de comandos para Chrome.
+
+        :type name: str
+        :type headless: bool
+        :type block_images: bool
+        :type block_fonts: bool
+        :type block_css: bool
+        :type disable_extensions: bool
+        :type window_size: tuple[int, int] or None
+        :type page_load_strategy: str
+        :type arguments: list[str]
+        """
+        self.name = name
+        self.headless = headless
+        self.block_images = block_images
+        self.block_fonts = block_fonts
+        self.block_css = block_css
+        self.disable_extensions = disable_extensions
+        self.window_size = window_size
+        self.page_load_strategy = page_load_strategy
+        self.arguments = arguments or []
+
+    def chrome_options(self):
+        """
+        Construye las opciones de Chrome para este perfil.
+
+        Las fuentes y hojas de estilo no se pueden bloquear con opciones de arranque en Chrome;
+        BrowserManager las bloquea tras arrancar con blocked_url_patterns().
+
+        :rtype: ChromeOptions
+        """
+        options = ChromeOptions()
+        options.page_load_strategy = self.page_load_strategy
+        if self.headless:
+            options.add_argument('--headless=new')
+        if self.disable_extensions:
+            options.add_argument('--disable-extensions')
+        if self.window_size:
+            options.add_argument(f'--window-size={self.window_size[0]},{self.window_size[1]}')
+        if self.block_images:
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        for argument in self.arguments:
+            options.add_argument(argument)
+        return options
+
+    def firefox_options(self):
+        """
+        Construye las opciones de Firefox para este perfil.
+
+        :rtype: FirefoxOptions
+        """
+        options = FirefoxOptions()
+        options.page_load_strategy = self.page_load_strategy
+        if self.headless:
+            options.add_argument('-headless')
+        if self.window_size:
+            options.add_argument(f'--width={self.window_size[0]}')
+            options.add_argument(f'--height={self.window_size[1]}')
+        if self.block_images:
+            options.set_preference('permissions.default.image', 2)
+        if self.block_fonts:
+            options.set_preference('browser.display.use_document_fonts', 0)
+            options.set_preference('gfx.downloadable_fonts.enabled', False)
+        if self.block_css:
+            options.set_preference('permissions.default.stylesheet', 2)
+        # 'disable_extensions' no se aplica: WebDriver arranca Firefox con un perfil temporal sin extensiones
+        return options
+
+    def options_for(self, browser_type):
+        """
+        Construye las opciones del perfil para el navegador indicado.
+
+        :param browser_type: "chrome" o "firefox".
+
+        :type browser_type: str
+
+        :rtype: ChromeOptions or FirefoxOptions
+        """
+        if browser_type == 'chrome':
+            return self.chrome_options()
+        return self.firefox_options()
+
+    def blocked_url_patterns(self):
+        """
+        Devuelve los patrones de URL que Chrome debe bloquear por CDP tras arrancar.
+
+        :rtype: list[str]
+        """
+        patterns = []
+        if self.block_fonts:
+            patterns += ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']
+        if self.block_css:
+            patterns += ['*.css']
+        return patterns
+
+
+# Perfiles predefinidos. 'default' reproduce el arranque original de BrowserManager.
+PROFILES = {
+    'default': LaunchProfile('default'),
+    'headless': LaunchProfile('headless', headless=True, window_size=(1920, 1080),
+                              arguments=['--disable-gpu', '--disable-dev-shm-usage']),
+    'lean': LaunchProfile('lean', headless=True, block_images=True, block_fonts=True, block_css=True,
+                          disable_extensions=True, window_size=(1280, 800), page_load_strategy='eager',
+                          arguments=['--disable-gpu', '--disable-dev-shm-usage', '--mute-audio',
+                                     '--disable-background-networking'])
+}
+
+
+def get_profile(profile):
+    """
+    Devuelve el LaunchProfile correspondiente.
+
+    :param profile: Nombre de un perfil de PROFILES, un LaunchProfile o None para el perfil 'default'.
+
+    :type profile: str or LaunchProfile or None
+
+    :rtype: LaunchProfile
+
+    :raises ValueError: Si el nombre del perfil no existe.
+    """
+    if isinstance(profile, LaunchProfile):
+        return profile
+    if profile is None:
+        profile = 'default'
+    if profile not in PROFILES:
+        raise ValueError(f"Perfil de arranque '{profile}' no soportado. Usa uno de {list(PROFILES)}.")
+    return PROFILES[profile]
@@ -0,0 +1,115 @@
+from selenium.common import WebDriverException
+
+# Comprueba que el elemento guardado sigue siendo el primero que encuentra el selector y que es visible.
+# Los selectores que dependen del texto o de la posición ('//td[contains(., 'X')]', '(//tr)[3]') pueden
+# encontrar otro elemento tras una actualización por AJAX aunque el guardado siga en el DOM.
+REVALIDATE_SCRIPT = """
+    var element = arguments[0], type = arguments[1], selector = arguments[2], first = null;
+    if (!element.isConnected) return false;
+    if (type === 'xpath') {
+        first = document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } else if (type === 'id') {
+        first = document.getElementById(selector);
+    } else if (type === 'css') {
+        first = document.querySelector(selector);
+    } else if (type === 'name') {
+        first = document.getElementsByName(selector)[0] || null;
+    } else {
+        first = Array.prototype.find.call(document.querySelectorAll('a'), function (link) {
+            return link.innerText.indexOf(selector) !== -1;
+        }) || null;
+    }
+    return first === element && element.getClientRects().length > 0
+           && getComputedStyle(element).visibility !== 'hidden';
+"""
+
+
+class LocatorCache:
+    """
+    Caché de elementos ya localizados por BrowserManager.select_element() dentro de la misma navegación.
+
+    Las entradas se guardan por (selector_type, selector, navigation_id). Al reutilizar una entrada se revalida
+    con una sola llamada (REVALIDATE_SCRIPT), que comprueba que el selector sigue encontrando ese mismo elemento
+    y que es visible, en lugar de crear un WebDriverWait y volver a buscar en el DOM.
+    Se descartan al navegar o cuando el elemento ya no es válido, ya no coincide con el selector o no es visible.
+    """
+    def __init__(self):
+        """
+        Inicializa la caché vacía y los contadores a cero.
+        """
+        self.entries = {}
+        self.navigation_id = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, selector_type, selector):
+        """
+        Devuelve el elemento guardado para el selector si sigue siendo el que encuentra el selector y es visible.
+
+        :param selector_type: Tipo de selector usado en select_element().
+        :param selector: El valor del selector.
+
+        :type selector_type: str
+        :type selector: str
+
+        :return: El WebElement guardado, o None si no hay entrada válida.
+        :rtype: WebElement or None
+        """
+        key = (selector_type, selector, self.navigation_id)
+        element = self.entries.get(key)
+        if element is None:
+            self.misses += 1
+            return None
+
+        try:
+            # 'parent' es el WebDriver del que se obtuvo el elemento
+            if element.parent.execute_script(REVALIDATE_SCRIPT, element, selector_type, selector):
+                self.hits += 1
+                return element
+        except WebDriverException:
+            # Elemento obsoleto o selector que el navegador no puede evaluar
+            pass
+
+        del self.entries[key]
+        self.evictions += 1
+        self.misses += 1
+        return None
+
+    def put(self, selector_type, selector, element):
+        """
+        Guarda el elemento localizado para la navegación actual.
+
+        :param selector_type: Tipo de selector usado en select_element().
+        :param selector: El valor del selector.
+        :param element: El WebElement localizado.
+
+        :type selector_type: str
+        :type selector: str
+        :type element: WebElement
+        """
+        self.entries[(selector_type, selector, self.navigation_id)] = element
+
+    def new_navigation(self):
+        """
+        Marca el inicio de una nueva navegación y descarta todas las entradas de la anterior.
+        """
+        self.navigation_id += 1
+        self.evictions += len(self.entries)
+        self.entries.clear()
+
+    def stats(self):
+        """
+        Devuelve los contadores de la caché. Cada acierto ahorra la búsqueda del elemento en el navegador.
+
+        :return: Diccionario con 'hits', 'misses', 'evictions', 'entries' y 'hit_rate'.
+        :rtype: dict
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
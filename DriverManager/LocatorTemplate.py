@@ -0,0 +1,69 @@
+from functools import lru_cache
+from string import Formatter
+
+
+def xpath_literal(text):
+    """
+    Convierte un texto en un literal XPath 1.0 válido, aunque contenga comillas simples y dobles.
+
+    :param text: Texto a buscar.
+
+    :type text: str
+
+    :return: El literal, por ejemplo 'abc', "l'eau" o concat('a', "'", 'b"c').
+    :rtype: str
+    """
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+class LocatorTemplate:
+    """
+    Plantilla XPath con parámetros que se escapan de forma segura.
+
+    La plantilla se analiza una sola vez al crearla y las XPath generadas se guardan en caché,
+    así que repetir la misma búsqueda no vuelve a construir la cadena.
+
+    Los parámetros se escriben como '{nombre}'. '{scope}' es especial: se sustituye tal cual por una XPath
+    que limita la búsqueda (por ejemplo a una tabla concreta) y por defecto es vacío, es decir, todo el documento.
+    El resto de parámetros se convierten en literales XPath con xpath_literal().
+    """
+    def __init__(self, template):
+        """
+        :param template: XPath con parámetros, por ejemplo "{scope}//*[contains(text(), {text})]".
+
+        :type template: str
+        """
+        self.template = template
+        self.parts = list(Formatter().parse(template))
+        self.render = lru_cache(maxsize=1024)(self._render)
+
+    def _render(self, scope='', **params):
+        """
+        Genera la XPath sustituyendo los parámetros.
+        """
+        xpath = []
+        for literal_text, field_name, _, _ in self.parts:
+            xpath.append(literal_text)
+            if field_name is None:
+                continue
+            if field_name == 'scope':
+                xpath.append(scope or '')
+            else:
+                xpath.append(xpath_literal(params[field_name]))
+        return ''.join(xpath)
+
+
+# Primer elemento cuyo texto propio contiene el texto buscado
+ELEMENT_BY_TEXT = LocatorTemplate("{scope}//*[contains(text(), {text})]")
+
+# Elemento con un nodo de texto propio igual al texto buscado (con los espacios normalizados)
+ELEMENT_BY_EXACT_TEXT = LocatorTemplate("{scope}//*[text()[normalize-space(.) = {text}]]")
+
+# Fila con una celda (td o th) que contiene el texto en ella o en sus descendientes.
+# El texto aparece una sola vez en la expresión, en lugar de las cuatro veces de la versión anterior.
+ROW_BY_TEXT = LocatorTemplate("{scope}//tr[*[self::td or self::th][.//text()[contains(., {text})]]]")
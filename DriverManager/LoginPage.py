@@ -1,15 +1,24 @@
 import json
 import os
+import sys
 
 from DriverManager.Credentials import Credentials
+from DriverManager.RequestFilter import RequestFilter
 
 class LoginPage:
     """
     Clase que representa una página de inicio de sesión.
 
     Contiene la URL de la página y los selectores para los campos de usuario, contraseña y el botón de login.
+
+    Es inmutable y usa __slots__, como Credentials, para que los archivos con decenas de miles de páginas
+    ocupen poca memoria.
     """
-    def __init__(self, id, url, username_selector, pwd_selector, login_button_selector, credentials):
+    __slots__ = ('id', 'url', 'username_selector', 'pwd_selector', 'login_button_selector', 'credentials', 'profile',
+                 'request_filter')
+
+    def __init__(self, id, url, username_selector, pwd_selector, login_button_selector, credentials, profile=None,
+                 request_filter=None):
         """
         Inicializa los detalles de la página de inicio de sesión.
 
@@ -19,6 +28,8 @@ class LoginPage:
         :param pwd_selector: Selector para el campo de contraseña.
         :param login_button_selector: Selector para el botón de login.
         :param credentials: Objeto que contiene el nombre de usuario y la contraseña.
+        :param profile: Nombre del perfil de arranque del navegador para esta página, o None para el perfil por defecto.
+        :param request_filter: Filtro de peticiones de red para esta página, o None para no filtrar.
 
         :type id: str
         :type url: str
@@ -26,13 +37,48 @@ class LoginPage:
         :type pwd_selector: str
         :type login_button_selector: str
         :type credentials: Credentials
+        :type profile: str or None
+        :type request_filter: RequestFilter or None
         """
-        self.id = id
-        self.url = url
-        self.username_selector = username_selector
-        self.pwd_selector = pwd_selector
-        self.login_button_selector = login_button_selector
-        self.credentials = credentials
+        for name, value in zip(LoginPage.__slots__, (id, url, username_selector, pwd_selector, login_button_selector,
+                                                     credentials, profile, request_filter)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"LoginPage es inmutable: no se puede cambiar '{name}'.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"LoginPage es inmutable: no se puede borrar '{name}'.")
+
+    def __reduce__(self):
+        # Sin esto pickle restauraría los atributos con __setattr__, que no está permitido
+        return LoginPage, tuple(getattr(self, name) for name in LoginPage.__slots__)
+
+    @staticmethod
+    def from_dict(entry):
+        """
+        Crea un LoginPage a partir de una entrada de 'login_data.json'.
+
+        :param entry: Diccionario con la estructura explicada en 'DriverManager/data_load/README.md'.
+
+        :type entry: dict
+
+        :return: El objeto LoginPage.
+        :rtype: LoginPage
+        """
+        credentials = Credentials(entry['credentials']['username'], entry['credentials']['password'])
+        # Los selectores y perfiles se repiten entre páginas: se comparte una sola copia de cada texto
+        profile = entry.get('profile')
+        return LoginPage(
+            entry['id'],
+            entry['url'],
+            sys.intern(entry['username_selector']),
+            sys.intern(entry['password_selector']),
+            sys.intern(entry['login_button_selector']),
+            credentials,
+            sys.intern(profile) if profile is not None else None,
+            RequestFilter.from_dict(entry)
+        )
 
     @staticmethod
     def read_login_data_from_json():
@@ -50,35 +96,23 @@ class LoginPage:
 
         #data = json.load(open(r'data_load/login_data.json'))
         data = json.load(open(login_data_path))
-        login_pages = []
-        for entry in data:
-            credentials = Credentials(entry['credentials']['username'], entry['credentials']['password'])
-            login_page = LoginPage(
-                entry['id'],
-                entry['url'],
-                entry['username_selector'],
-                entry['password_selector'],
-                entry['login_button_selector'],
-                credentials
-            )
-            login_pages.append(login_page)
-        return login_pages
+        return [LoginPage.from_dict(entry) for entry in data]
 
     @staticmethod
     def get_login_page_by_id(page_id):
         """
-        Devuelve un objeto LoginPage de la lista creada por LoginPage.read_login_data_from_json()
-        si el 'id' coincide con el valor de 'page_id' proporcionado.
+        Devuelve el objeto LoginPage de 'login_data.json' cuyo 'id' coincide con el valor de 'page_id' proporcionado.
         Si no se encuentra devuelve None.
 
+        Usa el registro compartido de LoginPageRegistry, que solo vuelve a leer el archivo si ha cambiado.
+
         :param page_id: 'id' del LoginPage buscado.
 
         :type page_id: str
 
         :return: El objeto LoginPage con el 'id' requerido, o None si no se encuentra.
         """
-        for page in LoginPage.read_login_data_from_json():
-            if page.id == page_id:
-                return page
-        return None
+        # Importación diferida: LoginPageRegistry importa LoginPage
+        from DriverManager.LoginPageRegistry import default_registry
+        return default_registry.get(page_id)
 
@@ -0,0 +1,201 @@
+import json
+import os
+import threading
+from urllib.parse import urlsplit
+
+from DriverManager.LoginPage import LoginPage
+
+
+def _is_truncated(error, buffer):
+    """
+    Indica si el error de decodificación se debe a que la entrada está cortada al final del búfer.
+
+    Los tokens sin cerrar (una cadena, un literal o un escape '\\uXXXX') se notifican en su inicio,
+    así que se admite un pequeño margen antes del final.
+
+    :param error: Error devuelto por el decodificador.
+    :param buffer: Texto que se estaba decodificando.
+
+    :type error: json.JSONDecodeError
+    :type buffer: str
+
+    :rtype: bool
+    """
+    if error.msg.startswith('Unterminated string'):
+        return True
+    return error.pos >= len(buffer.rstrip()) - 6
+
+
+def iter_login_data(path, chunk_size=65536):
+    """
+    Recorre las entradas del array JSON de 'path' de una en una, leyendo el archivo por bloques.
+
+    Permite procesar archivos con miles de entradas sin cargarlos enteros en memoria.
+
+    :param path: Ruta del archivo JSON con la estructura de 'DriverManager/data_load/README.md'.
+    :param chunk_size: Número de caracteres leídos en cada bloque.
+
+    :type path: str
+    :type chunk_size: int
+
+    :return: Generador de diccionarios, uno por entrada.
+    :rtype: generator[dict]
+
+    :raises ValueError: Si el archivo no contiene un array JSON válido.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    consumed = 0  # Caracteres del archivo descartados del búfer, para situar los errores
+    started = False
+    with open(path, encoding='utf-8') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            pos = 0
+
+            if not started:
+                stripped = buffer.lstrip()
+                consumed += len(buffer) - len(stripped)
+                buffer = stripped
+                if not buffer:
+                    if eof:
+                        raise ValueError(f"El archivo '{path}' está vacío.")
+                    continue
+                if buffer[0] != '[':
+                    raise ValueError(f"El archivo '{path}' no contiene un array JSON.")
+                pos = 1
+                started = True
+
+            while True:
+                # Salta separadores entre entradas
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                    pos += 1
+                if pos < len(buffer) and buffer[pos] == ']':
+                    return
+                try:
+                    entry, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as error:
+                    # Si el error no está al final del búfer, leer más no lo arregla: la entrada está mal formada
+                    if not _is_truncated(error, buffer):
+                        raise ValueError(f"El archivo '{path}' contiene una entrada no válida "
+                                         f"(carácter {consumed + error.pos}): {error.msg}.") from None
+                    # La entrada está incompleta: hace falta leer el siguiente bloque
+                    break
+                yield entry
+
+            consumed += pos
+            buffer = buffer[pos:]
+            if eof:
+                raise ValueError(f"El archivo '{path}' termina antes de cerrar el array JSON.")
+
+
+class LoginPageRegistry:
+    """
+    Registro de objetos LoginPage leídos de 'login_data.json' e indexados por 'id' y por host de la URL.
+
+    El archivo solo se vuelve a leer cuando cambia su fecha de modificación.
+    """
+    def __init__(self, path=None):
+        """
+        :param path: Ruta del archivo JSON. Por defecto 'DriverManager/data_load/login_data.json'.
+
+        :type path: str
+        """
+        if path is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))  # Obtiene directorio actual del archivo que lo ejecuta
+            path = os.path.join(base_dir, "data_load", "login_data.json")  # Construye la ruta absoluta
+        self.path = path
+        self._mtime = None
+        self._pages = []
+        self._by_id = {}
+        self._by_host = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        """
+        Vuelve a leer e indexar el archivo si su fecha de modificación ha cambiado desde la última lectura.
+        """
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self._mtime:
+            return
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            pages = [LoginPage.from_dict(entry) for entry in iter_login_data(self.path)]
+            by_id = {}
+            by_host = {}
+            for page in pages:
+                by_id.setdefault(page.id, page)
+                by_host.setdefault(urlsplit(page.url).hostname, []).append(page)
+            self._pages, self._by_id, self._by_host = pages, by_id, by_host
+            self._mtime = mtime
+
+    def get(self, page_id):
+        """
+        Devuelve el LoginPage con el 'id' indicado.
+
+        :param page_id: 'id' del LoginPage buscado.
+
+        :type page_id: str
+
+        :return: El objeto LoginPage con el 'id' requerido, o None si no se encuentra.
+        :rtype: LoginPage or None
+        """
+        self._refresh()
+        return self._by_id.get(page_id)
+
+    def get_by_host(self, host):
+        """
+        Devuelve los LoginPage cuya URL pertenece al host indicado.
+
+        :param host: Host de la URL, por ejemplo 'practicetestautomation.com'.
+
+        :type host: str
+
+        :return: Lista de LoginPage, vacía si no hay ninguno.
+        :rtype: list[LoginPage]
+        """
+        self._refresh()
+        return list(self._by_host.get(host, []))
+
+    def get_by_url(self, url):
+        """
+        Devuelve los LoginPage del mismo host que la URL indicada.
+
+        :param url: Cualquier URL del sitio.
+
+        :type url: str
+
+        :rtype: list[LoginPage]
+        """
+        return self.get_by_host(urlsplit(url).hostname)
+
+    def all(self):
+        """
+        Devuelve todos los LoginPage en el orden del archivo.
+
+        :rtype: list[LoginPage]
+        """
+        self._refresh()
+        return list(self._pages)
+
+    def stream(self):
+        """
+        Recorre el archivo creando los LoginPage de uno en uno, sin cargarlo ni indexarlo entero.
+
+        :rtype: generator[LoginPage]
+        """
+        for entry in iter_login_data(self.path):
+            yield LoginPage.from_dict(entry)
+
+    def __iter__(self):
+        return iter(self.all())
+
+    def __len__(self):
+        self._refresh()
+        return len(self._pages)
+
+
+# Registro compartido del archivo por defecto, usado por LoginPage.get_login_page_by_id()
+default_registry = LoginPageRegistry()
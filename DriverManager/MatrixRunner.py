@@ -0,0 +1,312 @@
+"""
+Ejecuta la matriz LoginPage × navegador × perfil de pruebas.py repartida entre varios procesos.
+
+Cada proceso de trabajo arranca sus propios navegadores (un BrowserPool por navegador y perfil) y los reutiliza
+para todos los casos que le tocan. Los resultados de todos los procesos se reúnen en un único informe JSON.
+
+Con --shard I/N solo se ejecuta la parte I de N de la matriz, siempre la misma para el mismo caso,
+de modo que varias máquinas de CI pueden repartirse la matriz sin coordinarse.
+
+Uso:
+    python -m DriverManager.MatrixRunner --workers 4 --browsers chrome firefox --profiles headless
+    python -m DriverManager.MatrixRunner --shard 2/3 --output matriz_2.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from DriverManager.BrowserPool import BrowserPool
+from DriverManager.LoginPageRegistry import LoginPageRegistry
+
+SCENARIOS = ('open', 'login')
+
+
+def expand_matrix(pages, browser_types, profiles=(None,), scenario='login'):
+    """
+    Genera todas las combinaciones LoginPage × navegador × perfil en un orden estable.
+
+    :param pages: LoginPage a probar.
+    :param browser_types: Tipos de navegador ("chrome", "firefox").
+    :param profiles: Perfiles de arranque. None usa el perfil del propio LoginPage.
+    :param scenario: 'open' solo abre la página; 'login' además inicia sesión si la página tiene formulario.
+
+    :type pages: list[LoginPage]
+    :type browser_types: list[str]
+    :type profiles: list[str or None]
+    :type scenario: str
+
+    :return: Lista de casos. Cada caso es un diccionario con 'id', 'page', 'browser', 'profile' y 'scenario'.
+    :rtype: list[dict]
+
+    :raises ValueError: Si el escenario no es soportado o dos casos tienen el mismo 'id' (LoginPage, navegadores
+                        o perfiles repetidos), porque sus resultados se sobrescribirían.
+    """
+    if scenario not in SCENARIOS:
+        raise ValueError(f"Escenario '{scenario}' no soportado. Use uno de {SCENARIOS}.")
+    cases = []
+    seen = set()
+    for page in pages:
+        for browser_type in browser_types:
+            for profile in profiles:
+                profile_name = profile or page.profile or 'default'
+                case_id = f"{page.id}-{browser_type}-{profile_name}"
+                if case_id in seen:
+                    raise ValueError(f"Caso '{case_id}' repetido en la matriz. Revise los LoginPage, navegadores "
+                                     f"y perfiles indicados.")
+                seen.add(case_id)
+                cases.append({
+                    'id': case_id,
+                    'page': page,
+                    'browser': browser_type,
+                    'profile': profile_name,
+                    'scenario': scenario
+                })
+    return cases
+
+
+def shard_of(case_id, shard_count):
+    """
+    Devuelve el shard (0 .. shard_count - 1) al que pertenece un caso.
+
+    Usa CRC32 del identificador y no hash(), que cambia entre procesos, para que el reparto sea el mismo
+    en cualquier máquina y ejecución.
+
+    :param case_id: Identificador del caso, por ejemplo el 'id' de expand_matrix() o el nodeid de pytest.
+    :param shard_count: Número total de shards.
+
+    :type case_id: str
+    :type shard_count: int
+
+    :rtype: int
+    """
+    return zlib.crc32(case_id.encode('utf-8')) % shard_count
+
+
+def parse_shard(value):
+    """
+    Interpreta un shard con la forma 'I/N', numerado desde 1.
+
+    :param value: Texto como '2/3'.
+
+    :type value: str
+
+    :return: Tupla (índice desde 0, número de shards).
+    :rtype: tuple[int, int]
+
+    :raises ValueError: Si el texto no tiene la forma 'I/N' con 1 <= I <= N.
+    """
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"Shard '{value}' no válido. Use la forma I/N, por ejemplo 2/3.") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"Shard '{value}' no válido. El índice debe estar entre 1 y {count}.")
+    return index - 1, count
+
+
+def select_shard(cases, shard_index, shard_count):
+    """
+    Filtra los casos que pertenecen al shard indicado.
+
+    :param cases: Casos de expand_matrix().
+    :param shard_index: Índice del shard, desde 0.
+    :param shard_count: Número total de shards.
+
+    :type cases: list[dict]
+    :type shard_index: int
+    :type shard_count: int
+
+    :rtype: list[dict]
+    """
+    return [case for case in cases if shard_of(case['id'], shard_count) == shard_index]
+
+
+def split_for_workers(cases, workers):
+    """
+    Reparte los casos entre los procesos de trabajo.
+
+    Los casos se ordenan por navegador y perfil y se reparten en bloques consecutivos, para que cada proceso
+    arranque el menor número posible de navegadores distintos.
+
+    :param cases: Casos a ejecutar.
+    :param workers: Número de procesos.
+
+    :type cases: list[dict]
+    :type workers: int
+
+    :return: Una lista de casos por proceso, sin listas vacías.
+    :rtype: list[list[dict]]
+    """
+    ordered = sorted(cases, key=lambda case: (case['browser'], case['profile'], case['id']))
+    size = -(-len(ordered) // workers) if ordered else 0  # División entera redondeando hacia arriba
+    return [ordered[i:i + size] for i in range(0, len(ordered), size)] if size else []
+
+
+def run_case(browser, case, seconds):
+    """
+    Ejecuta un caso con un navegador ya arrancado.
+
+    :return: True si el caso se completó.
+    :rtype: bool
+    """
+    page = case['page']
+    if case['scenario'] == 'login' and page.username_selector:
+        return bool(browser.login(page, seconds))
+    browser.open_browser(page.url)
+    return True
+
+
+def run_worker(cases, seconds=0):
+    """
+    Punto de entrada de cada proceso de trabajo: ejecuta sus casos y devuelve los resultados.
+
+    Arranca un BrowserPool de un navegador por cada combinación de navegador, perfil y filtro de peticiones,
+    la primera vez que la necesita, y los cierra todos al terminar. Cualquier excepción de un caso se guarda
+    en su resultado con estado 'error' y se sigue con el siguiente.
+
+    :param cases: Casos asignados a este proceso.
+    :param seconds: Tiempo en segundos a esperar entre acciones.
+
+    :type cases: list[dict]
+    :type seconds: float
+
+    :return: Un diccionario de resultado por caso, con 'id', 'page', 'browser', 'profile', 'status',
+             'duration', 'error' y 'worker'.
+    :rtype: list[dict]
+    """
+    pools = {}
+    results = []
+    try:
+        for case in cases:
+            result = {
+                'id': case['id'],
+                'page': case['page'].id,
+                'browser': case['browser'],
+                'profile': case['profile'],
+                'status': 'passed',
+                'duration': 0.0,
+                'error': None,
+                'worker': os.getpid()
+            }
+            start = time.perf_counter()
+            try:
+                # El filtro de peticiones del LoginPage se fija al arrancar: un pool por filtro distinto
+                request_filter = case['page'].request_filter
+                key = (case['browser'], case['profile'], request_filter)
+                if key not in pools:
+                    pools[key] = BrowserPool([case['browser']], profile=case['profile'],
+                                             request_filter=request_filter)
+                with pools[key].lease() as browser:
+                    if not run_case(browser, case, seconds):
+                        result['status'] = 'failed'
+            except Exception as error:
+                result['status'] = 'error'
+                result['error'] = f"{type(error).__name__}: {error}".strip()
+            result['duration'] = time.perf_counter() - start
+            results.append(result)
+    finally:
+        for pool in pools.values():
+            pool.close()
+    return results
+
+
+def run_matrix(cases, workers=1, seconds=0):
+    """
+    Ejecuta los casos repartidos entre 'workers' procesos y reúne los resultados.
+
+    :param cases: Casos de expand_matrix() o select_shard().
+    :param workers: Número de procesos de trabajo.
+    :param seconds: Tiempo en segundos a esperar entre acciones.
+
+    :type cases: list[dict]
+    :type workers: int
+    :type seconds: float
+
+    :return: Resultados de todos los casos en el orden de 'cases'.
+    :rtype: list[dict]
+
+    :raises ValueError: Si el número de procesos es menor que 1.
+    """
+    if workers < 1:
+        raise ValueError("Se necesita al menos un proceso de trabajo.")
+    chunks = split_for_workers(cases, workers)
+    if len(chunks) <= 1:
+        results = run_worker(chunks[0], seconds) if chunks else []
+    else:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [executor.submit(run_worker, chunk, seconds) for chunk in chunks]
+            results = [result for future in futures for result in future.result()]
+    order = {case['id']: position for position, case in enumerate(cases)}
+    return sorted(results, key=lambda result: order[result['id']])
+
+
+def summarize(results):
+    """
+    Cuenta los resultados por estado y suma la duración de los casos.
+
+    :rtype: dict
+    """
+    summary = {'total': len(results), 'passed': 0, 'failed': 0, 'error': 0,
+               'case_time': sum(result['duration'] for result in results)}
+    for result in results:
+        summary[result['status']] += 1
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ejecuta la matriz LoginPage × navegador × perfil en paralelo.")
+    parser.add_argument('--browsers', nargs='+', default=['chrome', 'firefox'])
+    parser.add_argument('--profiles', nargs='+', default=None,
+                        help="Perfiles de arranque. Por defecto el perfil de cada LoginPage.")
+    parser.add_argument('--pages', nargs='+', default=None, help="'id' de los LoginPage. Por defecto todos.")
+    parser.add_argument('--login-data', default=None, help="Archivo de LoginPage. Por defecto data_load/login_data.json.")
+    parser.add_argument('--scenario', default='login', choices=SCENARIOS)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--shard', default=None, help="Parte de la matriz a ejecutar, con la forma I/N.")
+    parser.add_argument('--seconds', type=float, default=0)
+    parser.add_argument('--output', default='matrix_results.json', help="Archivo JSON de resultados.")
+    args = parser.parse_args(argv)
+
+    registry = LoginPageRegistry(args.login_data)
+    if args.pages:
+        pages = [registry.get(page_id) for page_id in args.pages]
+        missing = [page_id for page_id, page in zip(args.pages, pages) if page is None]
+        if missing:
+            parser.error(f"LoginPage no encontrados: {', '.join(missing)}")
+    else:
+        pages = registry.all()
+
+    try:
+        cases = expand_matrix(pages, args.browsers, args.profiles or [None], args.scenario)
+        if args.shard:
+            cases = select_shard(cases, *parse_shard(args.shard))
+    except ValueError as error:
+        parser.error(str(error))
+
+    start = time.perf_counter()
+    results = run_matrix(cases, args.workers, args.seconds)
+    wall_time = time.perf_counter() - start
+
+    summary = summarize(results)
+    summary['wall_time'] = wall_time
+    summary['workers'] = args.workers
+    summary['shard'] = args.shard
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump({'summary': summary, 'results': results}, file, indent=2)
+
+    for result in results:
+        error = f"   {result['error']}" if result['error'] else ''
+        print(f"{result['id']:50} {result['status']:7} {result['duration']:7.2f}s{error}")
+    print(f"\n{summary['passed']}/{summary['total']} correctos, {summary['failed']} fallidos, "
+          f"{summary['error']} con error. Tiempo total {wall_time:.2f}s "
+          f"(suma de casos {summary['case_time']:.2f}s, {args.workers} procesos).")
+    print(f"Resultados guardados en {args.output}")
+    return 0 if summary['passed'] == summary['total'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
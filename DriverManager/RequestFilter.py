@@ -0,0 +1,208 @@
+import base64
+import json
+import os
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+# Proxy inexistente (puerto 'discard'): las peticiones bloqueadas fallan al instante en lugar de esperar
+BLOCKED_PROXY = 'PROXY 127.0.0.1:9'
+
+
+class RequestFilter:
+    """
+    Filtro de peticiones de red de BrowserManager para no descargar anuncios, analítica, fuentes o imágenes
+    que retrasan la carga de las páginas de login.
+
+    - 'deny': patrones de URL con comodines '*' que se bloquean. En Chrome se aplican por CDP
+      (Network.setBlockedURLs) sobre la URL completa y se pueden cambiar con el navegador arrancado.
+      En Firefox se aplican al arrancar con un script PAC, que solo ve el esquema y el host en HTTPS.
+    - 'allow': hosts permitidos (incluidos sus subdominios). Cualquier otro host se bloquea con un script PAC
+      al arrancar. Las direcciones locales ('localhost', '127.0.0.1') nunca pasan por el PAC.
+    - 'cache_dir': directorio de caché en disco que se conserva entre sesiones, de modo que los recursos estáticos
+      se sirven desde disco en los siguientes arranques.
+
+    La caché en disco es la caché HTTP del propio navegador: solo guarda y sirve lo que permiten las cabeceras
+    de caché del servidor ('Cache-Control', 'Expires', validadores). No intercepta las peticiones (CDP Fetch
+    o BiDi) ni guarda respuestas por su cuenta, así que los recursos marcados como no cacheables se descargan
+    siempre.
+
+    Un directorio de caché no se puede compartir entre navegadores abiertos a la vez (BrowserPool, WorkerFarm,
+    MatrixRunner): cada navegador toma con acquire_cache_slot() un subdirectorio 'slot-N' de 'cache_dir' que
+    ningún otro navegador en marcha usa, y lo libera al cerrarse. Los arranques sucesivos reutilizan los mismos
+    subdirectorios, de modo que la caché se conserva entre sesiones.
+    """
+    def __init__(self, deny=None, allow=None, cache_dir=None, cache_size_mb=512):
+        """
+        :param deny: Patrones de URL a bloquear, por ejemplo '*google-analytics.com*' o '*.woff2'.
+        :param allow: Hosts permitidos, o None para permitir todos los que no estén en 'deny'.
+        :param cache_dir: Directorio de la caché en disco, o None para la caché temporal de cada sesión.
+        :param cache_size_mb: Tamaño máximo de la caché en disco.
+
+        :type deny: list[str] or None
+        :type allow: list[str] or None
+        :type cache_dir: str or None
+        :type cache_size_mb: int
+        """
+        self.deny = list(deny or [])
+        self.allow = list(allow) if allow is not None else None
+        self.cache_dir = os.path.abspath(cache_dir) if cache_dir else None
+        self.cache_size_mb = cache_size_mb
+
+    @staticmethod
+    def from_dict(entry):
+        """
+        Crea el filtro de una entrada de 'login_data.json' con las claves opcionales 'block', 'allow' y 'cache_dir'.
+
+        :param entry: Entrada del archivo.
+
+        :type entry: dict
+
+        :return: El filtro, o None si la entrada no define ninguna de esas claves.
+        :rtype: RequestFilter or None
+        """
+        if not any(key in entry for key in ('block', 'allow', 'cache_dir')):
+            return None
+        return RequestFilter(entry.get('block'), entry.get('allow'), entry.get('cache_dir'))
+
+    def blocked_url_patterns(self, browser_type):
+        """
+        Devuelve los patrones que BrowserManager bloquea por CDP. Solo Chrome los admite.
+
+        :rtype: list[str]
+        """
+        return list(self.deny) if browser_type == 'chrome' else []
+
+    def launch_settings(self, browser_type):
+        """
+        Devuelve la parte del filtro que solo se aplica al arrancar el navegador: el script PAC y la caché en disco.
+        Dos filtros con los mismos valores se pueden intercambiar con el navegador arrancado.
+
+        :rtype: tuple
+        """
+        return self.pac_script(browser_type), (self.cache_dir, self.cache_size_mb) if self.cache_dir else None
+
+    def pac_script(self, browser_type):
+        """
+        Construye el script PAC que bloquea los hosts no permitidos y, en Firefox, los patrones de 'deny'.
+
+        :return: El código del script, o None si el navegador no necesita PAC con este filtro.
+        :rtype: str or None
+        """
+        deny = self.deny if browser_type == 'firefox' else []
+        if self.allow is None and not deny:
+            return None
+        return """
+            function FindProxyForURL(url, host) {
+                var allow = %s, deny = %s;
+                if (allow !== null) {
+                    var allowed = false;
+                    for (var i = 0; i < allow.length; i++) {
+                        if (host === allow[i] || dnsDomainIs(host, '.' + allow[i])) allowed = true;
+                    }
+                    if (!allowed) return '%s';
+                }
+                for (var i = 0; i < deny.length; i++) {
+                    if (shExpMatch(url, deny[i]) || shExpMatch(host, deny[i])) return '%s';
+                }
+                return 'DIRECT';
+            }
+        """ % (json.dumps(self.allow), json.dumps(deny), BLOCKED_PROXY, BLOCKED_PROXY)
+
+    def acquire_cache_slot(self):
+        """
+        Reserva para un navegador un subdirectorio de 'cache_dir' que no use ningún otro navegador en marcha,
+        de este o de otro proceso. Se toma el primer 'slot-N' libre para reutilizar la caché de arranques anteriores.
+
+        :return: El subdirectorio reservado, que se libera con CacheSlot.release(), o None si no hay 'cache_dir'.
+        :rtype: CacheSlot or None
+        """
+        if not self.cache_dir:
+            return None
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index = 0
+        while True:
+            path = os.path.join(self.cache_dir, f'slot-{index}')
+            lock_file = open(path + '.lock', 'a+')
+            try:
+                if os.name == 'nt':
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                # Lo usa otro navegador en marcha
+                lock_file.close()
+                index += 1
+                continue
+            os.makedirs(path, exist_ok=True)
+            return CacheSlot(path, lock_file)
+
+    def apply_options(self, options, browser_type, cache_slot=None):
+        """
+        Añade a las opciones de arranque el script PAC y la caché en disco.
+
+        :param options: Opciones creadas por LaunchProfile.options_for().
+        :param browser_type: "chrome" o "firefox".
+        :param cache_slot: Subdirectorio de caché reservado para este navegador con acquire_cache_slot(),
+                           o None para no usar caché en disco.
+
+        :type options: ChromeOptions or FirefoxOptions
+        :type browser_type: str
+        :type cache_slot: CacheSlot or None
+        """
+        pac = self.pac_script(browser_type)
+        pac_url = None
+        if pac is not None:
+            pac_url = 'data:application/x-ns-proxy-autoconfig;base64,' + base64.b64encode(pac.encode()).decode()
+
+        if browser_type == 'chrome':
+            if pac_url:
+                options.add_argument(f'--proxy-pac-url={pac_url}')
+            if cache_slot is not None:
+                options.add_argument(f'--disk-cache-dir={cache_slot.path}')
+                options.add_argument(f'--disk-cache-size={self.cache_size_mb * 1024 * 1024}')
+        else:
+            if pac_url:
+                options.set_preference('network.proxy.type', 2)
+                options.set_preference('network.proxy.autoconfig_url', pac_url)
+            if cache_slot is not None:
+                options.set_preference('browser.cache.disk.enable', True)
+                options.set_preference('browser.cache.disk.parent_directory', cache_slot.path)
+                options.set_preference('browser.cache.disk.smart_size.enabled', False)
+                options.set_preference('browser.cache.disk.capacity', self.cache_size_mb * 1024)
+
+
+class CacheSlot:
+    """
+    Subdirectorio de la caché en disco reservado por un navegador en marcha. Ver RequestFilter.acquire_cache_slot().
+
+    La reserva es un bloqueo de archivo ('slot-N.lock') que dura mientras el archivo está abierto, así que
+    también se libera si el proceso termina sin llamar a release().
+    """
+    def __init__(self, path, lock_file):
+        """
+        :param path: Ruta del subdirectorio de caché.
+        :param lock_file: Archivo de bloqueo abierto y bloqueado.
+
+        :type path: str
+        :type lock_file: file
+        """
+        self.path = path
+        self._lock_file = lock_file
+
+    def release(self):
+        """
+        Libera el subdirectorio para otro navegador. Llamarlo más de una vez no tiene efecto.
+        """
+        if self._lock_file is None:
+            return
+        if os.name == 'nt':
+            self._lock_file.seek(0)
+            msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+        self._lock_file.close()
+        self._lock_file = None
@@ -0,0 +1,356 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from DriverManager.TableData import grid_to_columns
+
+# Huella de 64 bits de cada fila (texto de sus celdas) y de la tabla entera, en una sola llamada.
+# Devuelve también la longitud de cada celda, para comprobar una fila guardada antes de reutilizarla.
+TABLE_HASHES_SCRIPT = """
+    var table = document.querySelector(arguments[0]);
+    if (!table) return null;
+    var headerRows = Math.min(Math.max(arguments[1], 0), table.rows.length);
+    // Dos FNV-1a de 32 bits independientes (distinta base y primo)
+    function hash(text) {
+        var h1 = 0x811c9dc5, h2 = 0x2d358dcc;
+        for (var i = 0; i < text.length; i++) {
+            var code = text.charCodeAt(i);
+            h1 = Math.imul(h1 ^ code, 0x01000193);
+            h2 = Math.imul(h2 ^ code, 0x5bd1e995);
+            h2 ^= h2 >>> 15;
+        }
+        return ('0000000' + (h1 >>> 0).toString(16)).slice(-8) + ('0000000' + (h2 >>> 0).toString(16)).slice(-8);
+    }
+    var rows = [];
+    for (var r = 0; r < table.rows.length; r++) {
+        var texts = Array.prototype.map.call(table.rows[r].cells, function (cell) { return cell.textContent.trim(); });
+        // El separador no aparece en el texto: ['ab', 'c'] y ['a', 'bc'] tienen huellas distintas
+        rows.push([hash(texts.join('\\u0001')), texts.map(function (text) { return Array.from(text).length; })]);
+    }
+    var rowHashes = rows.map(function (row) { return row[0]; });
+    return {table: hash(headerRows + '\\u0001' + rowHashes.join(',')), header_rows: headerRows, rows: rows};
+"""
+
+# Texto de las celdas de las filas indicadas, o null si la tabla ha cambiado y alguna ya no existe
+TABLE_ROWS_SCRIPT = """
+    var table = document.querySelector(arguments[0]), positions = arguments[1];
+    if (!table || positions.some(function (r) { return r >= table.rows.length; })) return null;
+    return positions.map(function (r) {
+        return Array.prototype.map.call(table.rows[r].cells, function (cell) { return cell.textContent.trim(); });
+    });
+"""
+
+
+class ResultStore:
+    """
+    Caché en disco (SQLite) de las celdas de tablas leídas con BrowserManager, para no volver a leerlas
+    si la página no ha cambiado.
+
+    Cada tabla se identifica por (LoginPage.id, url, selector CSS) y cada celda por el texto de su fila y su columna.
+    La validez se comprueba de dos maneras:
+        - check_http(): petición HEAD condicional con el ETag / Last-Modified guardados. Si el servidor responde
+          304, la tabla se sirve de la caché sin abrir el navegador.
+        - refresh(): con la página abierta, una sola llamada calcula una huella de 64 bits del texto de las celdas
+          de cada fila. Si la huella de la tabla coincide no se lee nada más; si no, solo se leen las filas cuya
+          huella no estaba guardada o cuyo número y longitud de celdas no coinciden con la fila guardada.
+    """
+    def __init__(self, path=None):
+        """
+        :param path: Ruta del archivo SQLite. Por defecto 'data_load/result_store.sqlite'.
+
+        :type path: str or None
+        """
+        if path is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))  # Obtiene directorio actual del archivo que lo ejecuta
+            path = os.path.join(base_dir, "data_load", "result_store.sqlite")  # Construye la ruta absoluta
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS tables (
+                    id INTEGER PRIMARY KEY,
+                    page_id TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    selector TEXT NOT NULL,
+                    table_hash TEXT,
+                    header TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    updated REAL,
+                    UNIQUE (page_id, url, selector)
+                );
+                CREATE TABLE IF NOT EXISTS rows (
+                    table_id INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    row_hash TEXT NOT NULL,
+                    row_text TEXT NOT NULL,
+                    cells TEXT NOT NULL,
+                    PRIMARY KEY (table_id, position)
+                );
+            """)
+
+    def _table(self, page_id, url, selector):
+        """
+        Devuelve la fila de 'tables' de la tabla como diccionario, o None si no está guardada.
+        """
+        cursor = self._connection.execute(
+            "SELECT id, table_hash, header, etag, last_modified, updated FROM tables "
+            "WHERE page_id = ? AND url = ? AND selector = ?", (page_id, url, selector))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip(('id', 'table_hash', 'header', 'etag', 'last_modified', 'updated'), row))
+
+    @staticmethod
+    def _http_validators(url, etag=None, last_modified=None, cookies=None, timeout=5):
+        """
+        Hace una petición HEAD, condicional si se indican validadores, con las cookies de la sesión del navegador.
+
+        Si la petición termina en otra URL (por ejemplo, una redirección al login porque la sesión no vale)
+        o el servidor no responde 2xx ni 304, los validadores no son los de la página y no se devuelven.
+
+        :param cookies: Cookies de la sesión, como las devuelve 'driver.get_cookies()', o None para no enviarlas.
+
+        :type cookies: list[dict] or None
+
+        :return: Tupla (código de estado, ETag, Last-Modified), o None si la URL no es HTTP, la petición falla
+                 o no responde la propia página.
+        :rtype: tuple or None
+        """
+        if not url.startswith(('http://', 'https://')):
+            return None
+        request = urllib.request.Request(url, method='HEAD', headers={'User-Agent': 'DriverManager'})
+        if cookies:
+            request.add_header('Cookie', '; '.join(f"{cookie['name']}={cookie['value']}" for cookie in cookies))
+        if etag:
+            request.add_header('If-None-Match', etag)
+        if last_modified:
+            request.add_header('If-Modified-Since', last_modified)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                if response.geturl() != url or not 200 <= response.status < 300:
+                    return None
+                return response.status, response.headers.get('ETag'), response.headers.get('Last-Modified')
+        except urllib.error.HTTPError as error:
+            if error.code == 304 and error.geturl() == url:
+                return 304, etag, last_modified
+            return None
+        except (urllib.error.URLError, OSError, ValueError):
+            return None
+
+    def check_http(self, page_id, url, selector='table', cookies=None):
+        """
+        Comprueba con una petición HEAD condicional si la página ha cambiado desde el último refresh().
+
+        :param page_id: 'id' del LoginPage.
+        :param url: URL de la página.
+        :param selector: Selector CSS de la tabla.
+        :param cookies: Cookies de la sesión ('browser.driver.get_cookies()') si la página requiere login.
+
+        :type page_id: str
+        :type url: str
+        :type selector: str
+        :type cookies: list[dict] or None
+
+        :return: 'unchanged' si el servidor confirma que no ha cambiado, 'changed' si ha cambiado y 'unknown'
+                 si no hay tabla guardada, el servidor no da validadores o la petición falla.
+        :rtype: str
+        """
+        with self._lock:
+            table = self._table(page_id, url, selector)
+        if table is None or table['table_hash'] is None or not (table['etag'] or table['last_modified']):
+            return 'unknown'
+        result = self._http_validators(url, table['etag'], table['last_modified'], cookies)
+        if result is None:
+            return 'unknown'
+        return 'unchanged' if result[0] == 304 else 'changed'
+
+    def refresh(self, browser, page_id, selector='table', header_rows=1):
+        """
+        Actualiza la caché con la tabla de la página abierta en el navegador, leyendo solo lo que ha cambiado.
+
+        :param browser: Navegador con la página ya abierta.
+        :param page_id: 'id' del LoginPage.
+        :param selector: Selector CSS de la tabla.
+        :param header_rows: Número de filas de encabezado. Si la tabla tiene menos filas, todas son encabezado.
+
+        :type browser: BrowserManager
+        :type page_id: str
+        :type selector: str
+        :type header_rows: int
+
+        :return: Diccionario con 'status' ('unchanged', 'updated' o 'missing' si no se encuentra la tabla
+                 o cambia mientras se lee), 'rows' (total de filas), 'read_rows' (filas leídas del navegador)
+                 y 'removed_rows'.
+        :rtype: dict
+        """
+        url = browser.driver.current_url
+        hashes = browser.driver.execute_script(TABLE_HASHES_SCRIPT, selector, header_rows)
+        if hashes is None:
+            print(f"\n\t*** = ***\nError: No se encontró ninguna tabla con el selector '{selector}'.")
+            return {'status': 'missing', 'rows': 0, 'read_rows': 0, 'removed_rows': 0}
+        header_rows = hashes['header_rows']
+        row_hashes = [row_hash for row_hash, _ in hashes['rows']]
+
+        with self._lock:
+            table = self._table(page_id, url, selector)
+        if table is not None and table['table_hash'] == hashes['table']:
+            return {'status': 'unchanged', 'rows': len(row_hashes) - header_rows, 'read_rows': 0,
+                    'removed_rows': 0}
+
+        # Las filas se reutilizan por su huella, aunque hayan cambiado de posición
+        known = {}
+        if table is not None:
+            with self._lock:
+                for row_hash, cells in self._connection.execute(
+                        "SELECT row_hash, cells FROM rows WHERE table_id = ?", (table['id'],)):
+                    known.setdefault(row_hash, json.loads(cells))
+        body = hashes['rows'][header_rows:]
+        # Antes de reutilizar una fila por su huella se comprueba que tenga las mismas celdas y longitudes
+        reused = {position: known[row_hash] for position, (row_hash, lengths) in enumerate(body)
+                  if row_hash in known and self._same_lengths(known[row_hash], lengths)}
+        to_read = list(range(header_rows)) + [header_rows + position for position in range(len(body))
+                                              if position not in reused]
+        texts = browser.driver.execute_script(TABLE_ROWS_SCRIPT, selector, to_read)
+        if texts is None:
+            print(f"\n\t*** = ***\nError: La tabla con el selector '{selector}' cambió mientras se leía.")
+            return {'status': 'missing', 'rows': 0, 'read_rows': 0, 'removed_rows': 0}
+        read = dict(zip(to_read, texts))
+
+        header = [read[position] for position in range(header_rows)]
+        rows = []
+        for position, (row_hash, _) in enumerate(body):
+            cells = reused[position] if position in reused else read[header_rows + position]
+            rows.append((position, row_hash, '\t'.join(cells), json.dumps(cells, ensure_ascii=False)))
+
+        # Con las cookies del navegador, para obtener los validadores de la página y no los del login
+        cookies = browser.driver.get_cookies() if url.startswith(('http://', 'https://')) else None
+        validators = self._http_validators(url, cookies=cookies) or (None, None, None)
+        removed = len(set(known) - set(row_hashes[header_rows:]))
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO tables (page_id, url, selector, table_hash, header, etag, last_modified, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (page_id, url, selector) DO UPDATE SET table_hash = excluded.table_hash, "
+                "header = excluded.header, etag = excluded.etag, last_modified = excluded.last_modified, "
+                "updated = excluded.updated",
+                (page_id, url, selector, hashes['table'], json.dumps(header, ensure_ascii=False), validators[1],
+                 validators[2], time.time()))
+            table_id = self._table(page_id, url, selector)['id']
+            self._connection.execute("DELETE FROM rows WHERE table_id = ?", (table_id,))
+            self._connection.executemany(
+                "INSERT INTO rows (table_id, position, row_hash, row_text, cells) VALUES (?, ?, ?, ?, ?)",
+                [(table_id,) + row for row in rows])
+        return {'status': 'updated', 'rows': len(rows), 'read_rows': len(to_read) - header_rows,
+                'removed_rows': removed}
+
+    @staticmethod
+    def _same_lengths(cells, lengths):
+        """
+        Indica si una fila guardada tiene tantas celdas y de la misma longitud como las medidas en la página.
+        """
+        return len(cells) == len(lengths) and all(len(cell) == length for cell, length in zip(cells, lengths))
+
+    def get_cell(self, page_id, url, text, column, selector='table'):
+        """
+        Devuelve el texto de una celda guardada, como BrowserManager.get_cell() pero sin navegador.
+
+        :param page_id: 'id' del LoginPage.
+        :param url: URL de la página.
+        :param text: Texto de alguna celda de la fila. Se prefiere la fila con una celda exactamente igual.
+        :param column: Número de columna (1-indexed; negativo cuenta desde el final) o título de la columna.
+        :param selector: Selector CSS de la tabla.
+
+        :type page_id: str
+        :type url: str
+        :type text: str
+        :type column: int | str
+        :type selector: str
+
+        :return: El texto de la celda, o None si la tabla, la fila o la columna no están guardadas.
+        :rtype: str or None
+        """
+        with self._lock:
+            table = self._table(page_id, url, selector)
+            if table is None:
+                return None
+            candidates = [json.loads(cells) for (cells,) in self._connection.execute(
+                "SELECT cells FROM rows WHERE table_id = ? AND instr(row_text, ?) > 0 ORDER BY position",
+                (table['id'], text))]
+        if not candidates:
+            return None
+        cells = next((row for row in candidates if text in row), candidates[0])
+
+        if isinstance(column, str):
+            header = json.loads(table['header'])
+            titles = header[-1] if header else []
+            if column in titles:
+                num_column = titles.index(column) + 1
+            else:
+                num_column = next((i + 1 for i, title in enumerate(titles) if column in title), None)
+            if num_column is None:
+                print(f"\n\t*** = ***\nError: No se encontró la columna con título '{column}'.")
+                return None
+        else:
+            num_column = column if column > 0 else len(cells) + column + 1
+        if not len(cells) >= num_column > 0:
+            print(f"\n\t*** = ***\nError: La fila tiene de 1 a {len(cells)} columnas, pero se pidió la {column}.")
+            return None
+        return cells[num_column - 1]
+
+    def get_table(self, page_id, url, selector='table', decimal='.'):
+        """
+        Devuelve la tabla guardada en formato columnar, como BrowserManager.extract_table() pero sin navegador.
+
+        :param page_id: 'id' del LoginPage.
+        :param url: URL de la página.
+        :param selector: Selector CSS de la tabla.
+        :param decimal: Separador decimal usado en la página ('.' o ',').
+
+        :type page_id: str
+        :type url: str
+        :type selector: str
+        :type decimal: str
+
+        :return: Diccionario título -> columna (ver TableData.grid_to_columns()), o None si no está guardada.
+        :rtype: dict or None
+        """
+        with self._lock:
+            table = self._table(page_id, url, selector)
+            if table is None:
+                return None
+            body = [json.loads(cells) for (cells,) in self._connection.execute(
+                "SELECT cells FROM rows WHERE table_id = ? ORDER BY position", (table['id'],))]
+        header = json.loads(table['header'])
+        return grid_to_columns(header + body, len(header), decimal)
+
+    def invalidate(self, page_id, url=None):
+        """
+        Borra las tablas guardadas de un LoginPage, o solo las de una URL.
+
+        :type page_id: str
+        :type url: str or None
+        """
+        with self._lock, self._connection:
+            condition, params = ("page_id = ?", (page_id,)) if url is None else \
+                ("page_id = ? AND url = ?", (page_id, url))
+            self._connection.execute(
+                f"DELETE FROM rows WHERE table_id IN (SELECT id FROM tables WHERE {condition})", params)
+            self._connection.execute(f"DELETE FROM tables WHERE {condition}", params)
+
+    def close(self):
+        """
+        Cierra la conexión con la base de datos.
+        """
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
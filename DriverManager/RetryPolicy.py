@@ -0,0 +1,161 @@
+import threading
+import time
+from collections import deque
+
+
+class RetryPolicy:
+    """
+    Decide cuánto esperar en cada intento de localizar un elemento en BrowserManager.
+
+    Cada intento espera 'timeout * backoff ** n' segundos (n = 0, 1, ...). El tiempo base se puede fijar por selector
+    ('selector_budgets') o aprender de los tiempos de aparición observados en cada LoginPage ('adaptive').
+    Si hay un plazo máximo por sesión ('session_deadline'), los intentos se recortan para no superarlo.
+
+    Los valores por defecto reproducen el comportamiento original: 2 intentos de 20 segundos.
+    """
+    def __init__(self, timeout=20, retries=2, backoff=1.0, min_timeout=0.5, max_timeout=60, selector_budgets=None,
+                 session_deadline=None, absence_timeout=0.5, adaptive=False, adaptive_margin=2.0,
+                 adaptive_min_samples=5, adaptive_window=200):
+        """
+        :param timeout: Segundos de espera del primer intento.
+        :param retries: Número máximo de intentos.
+        :param backoff: Factor por el que se multiplica la espera en cada intento (1.0 = espera constante).
+        :param min_timeout: Espera mínima de un intento.
+        :param max_timeout: Espera máxima de un intento.
+        :param selector_budgets: Diccionario selector -> segundos del primer intento, para selectores concretos.
+        :param session_deadline: Segundos máximos de la sesión, o None. Se mide el tiempo real transcurrido desde
+                                 'session_started' (ver schedule()), no solo la suma de las esperas: los intentos se
+                                 recortan para que la sesión no pase de ese tiempo.
+        :param absence_timeout: Segundos máximos que BrowserManager.is_absent() espera a que un elemento desaparezca.
+        :param adaptive: Si es True, el primer intento dura el p95 de los tiempos de aparición observados en el
+                         LoginPage multiplicado por 'adaptive_margin', acotado entre 'min_timeout' y 'timeout'.
+                         El último intento conserva la espera sin aprendizaje.
+        :param adaptive_margin: Margen sobre el p95 observado.
+        :param adaptive_min_samples: Muestras necesarias antes de usar el tiempo aprendido.
+        :param adaptive_window: Número de muestras recientes que se guardan por LoginPage.
+
+        :type timeout: float
+        :type retries: int
+        :type backoff: float
+        :type min_timeout: float
+        :type max_timeout: float
+        :type selector_budgets: dict[str, float]
+        :type session_deadline: float or None
+        :type absence_timeout: float
+        :type adaptive: bool
+        :type adaptive_margin: float
+        :type adaptive_min_samples: int
+        :type adaptive_window: int
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.selector_budgets = selector_budgets or {}
+        self.session_deadline = session_deadline
+        self.absence_timeout = absence_timeout
+        self.adaptive = adaptive
+        self.adaptive_margin = adaptive_margin
+        self.adaptive_min_samples = adaptive_min_samples
+        self.adaptive_window = adaptive_window
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fast():
+        """
+        Política para páginas locales o rápidas: intentos de 2, 4 y 8 segundos.
+
+        :rtype: RetryPolicy
+        """
+        return RetryPolicy(timeout=2, retries=3, backoff=2.0)
+
+    def record(self, page_id, elapsed):
+        """
+        Guarda el tiempo que tardó en aparecer un elemento en un LoginPage.
+
+        :param page_id: 'id' del LoginPage en curso, o None si no hay ninguno.
+        :param elapsed: Segundos hasta que el elemento fue visible.
+
+        :type page_id: str or None
+        :type elapsed: float
+        """
+        with self._lock:
+            samples = self._samples.get(page_id)
+            if samples is None:
+                samples = self._samples[page_id] = deque(maxlen=self.adaptive_window)
+            samples.append(elapsed)
+
+    def p95(self, page_id):
+        """
+        Devuelve el percentil 95 de los tiempos de aparición observados en un LoginPage.
+
+        :param page_id: 'id' del LoginPage.
+
+        :type page_id: str or None
+
+        :return: El p95 en segundos, o None si no hay suficientes muestras.
+        :rtype: float or None
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(page_id, ()))
+        if len(samples) < self.adaptive_min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))]
+
+    def base_timeout(self, selector, page_id=None):
+        """
+        Devuelve la espera del primer intento para el selector.
+
+        :rtype: float
+        """
+        if selector in self.selector_budgets:
+            return self.selector_budgets[selector]
+        if self.adaptive:
+            p95 = self.p95(page_id)
+            if p95 is not None:
+                return min(self.timeout, max(self.min_timeout, p95 * self.adaptive_margin))
+        return self.timeout
+
+    def _attempt_timeout(self, base, attempt):
+        """
+        Devuelve la espera del intento 'attempt' (desde 0) con la espera base indicada, acotada entre
+        'min_timeout' y 'max_timeout'.
+
+        :rtype: float
+        """
+        return min(self.max_timeout, max(self.min_timeout, base * self.backoff ** attempt))
+
+    def schedule(self, selector, page_id=None, session_started=None):
+        """
+        Calcula la espera de cada intento para localizar el selector.
+
+        :param selector: El valor del selector.
+        :param page_id: 'id' del LoginPage en curso, para el tiempo aprendido.
+        :param session_started: Instante (time.monotonic()) en que empezó la sesión, para el plazo máximo.
+
+        :type selector: str
+        :type page_id: str or None
+        :type session_started: float or None
+
+        :return: Lista de segundos de espera, uno por intento. Vacía si ya se agotó el plazo de la sesión.
+        :rtype: list[float]
+        """
+        base = self.base_timeout(selector, page_id)
+        timeouts = [self._attempt_timeout(base, attempt) for attempt in range(self.retries)]
+        if timeouts and selector not in self.selector_budgets and base < self.timeout:
+            # El tiempo aprendido es el de toda la página: el último intento espera lo de siempre, para que un
+            # elemento más lento que el resto siga encontrándose
+            timeouts[-1] = max(timeouts[-1], self._attempt_timeout(self.timeout, self.retries - 1))
+
+        if self.session_deadline is None or session_started is None:
+            return timeouts
+        remaining = self.session_deadline - (time.monotonic() - session_started)
+        schedule = []
+        for timeout in timeouts:
+            if remaining <= 0:
+                break
+            schedule.append(min(timeout, remaining))
+            remaining -= timeout
+        return schedule
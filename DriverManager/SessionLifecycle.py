@@ -0,0 +1,172 @@
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _browser_root_process(browser):
+    """
+    Busca el proceso principal del navegador de la sesión, o None si no se puede identificar.
+    """
+    capabilities = browser.driver.capabilities
+    if browser.browser_type == 'firefox':
+        pid = capabilities.get('moz:processID')
+        return psutil.Process(pid) if pid else None
+
+    # Con chromedriver compartido hay varios Chrome colgando del mismo driver: el de esta sesión es el que usa
+    # su directorio de perfil
+    user_data_dir = capabilities.get('chrome', {}).get('userDataDir')
+    driver_process = psutil.Process(browser.service.process.pid)
+    for process in driver_process.children():
+        try:
+            if user_data_dir and any(user_data_dir in argument for argument in process.cmdline()):
+                return process
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return None
+
+
+def session_rss_mb(browser):
+    """
+    Devuelve el RSS en MB del navegador de la sesión y todos sus procesos hijos (pestañas, GPU...).
+
+    Si el driver no es compartido y no se identifica el proceso del navegador, se mide el driver con todos
+    sus descendientes.
+
+    :param browser: Sesión a medir.
+
+    :type browser: BrowserManager
+
+    :return: Memoria en MB, o None si no está instalado 'psutil' o no se pudo medir.
+    :rtype: float or None
+    """
+    if psutil is None:
+        return None
+    try:
+        root = _browser_root_process(browser)
+        if root is None:
+            if browser.shared_service and browser.browser_type == 'chrome':
+                return None
+            root = psutil.Process(browser.service.process.pid)
+        total = 0
+        for process in [root] + root.children(recursive=True):
+            try:
+                total += process.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+    except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
+        return None
+    return total / (1024 * 1024)
+
+
+class SessionLifecycle:
+    """
+    Vigila la memoria de una sesión de BrowserManager y recicla el navegador cuando crece demasiado.
+
+    BrowserManager llama a after_navigation() tras cada open_browser(). Cada 'sample_every' navegaciones se mide
+    el RSS del navegador (si 'psutil' está instalado); si supera 'max_rss_mb', o si desde el último reciclado
+    se han hecho 'max_navigations' navegaciones, se llama a BrowserManager.recycle(), que arranca un navegador
+    nuevo con las mismas cookies, almacenamiento y URL.
+
+    Cada instancia guarda las estadísticas de una sola sesión.
+    """
+    def __init__(self, max_rss_mb=None, max_navigations=None, sample_every=10):
+        """
+        :param max_rss_mb: Memoria en MB a partir de la cual se recicla el navegador, o None para solo medirla.
+                           Medir necesita 'psutil'.
+        :param max_navigations: Navegaciones tras las que se recicla el navegador, o None.
+        :param sample_every: Cada cuántas navegaciones se mide la memoria. Medir cuesta unos milisegundos.
+
+        :type max_rss_mb: float or None
+        :type max_navigations: int or None
+        :type sample_every: int
+        """
+        self.max_rss_mb = max_rss_mb
+        self.max_navigations = max_navigations
+        self.sample_every = max(1, sample_every)
+        self.navigations = 0  # Desde el último reciclado
+        self.total_navigations = 0
+        self.samples = 0
+        self.last_rss_mb = None
+        self.peak_rss_mb = None
+        self.recycles = []
+        self._recycling = False
+
+    def sample(self, browser):
+        """
+        Mide la memoria actual del navegador y actualiza las estadísticas.
+
+        :param browser: Sesión a medir.
+
+        :type browser: BrowserManager
+
+        :return: Memoria en MB, o None si no se pudo medir.
+        :rtype: float or None
+        """
+        rss = session_rss_mb(browser)
+        if rss is not None:
+            self.samples += 1
+            self.last_rss_mb = rss
+            self.peak_rss_mb = rss if self.peak_rss_mb is None else max(self.peak_rss_mb, rss)
+        return rss
+
+    def after_navigation(self, browser):
+        """
+        Cuenta la navegación y recicla el navegador si se ha superado algún límite.
+
+        :param browser: Sesión que acaba de navegar.
+
+        :type browser: BrowserManager
+        """
+        if self._recycling:
+            # Navegaciones de recycle() al restaurar la sesión
+            return
+        self.navigations += 1
+        self.total_navigations += 1
+
+        reason = None
+        if self.max_navigations is not None and self.navigations >= self.max_navigations:
+            reason = 'navigations'
+        elif self.total_navigations % self.sample_every == 0:
+            rss = self.sample(browser)
+            if self.max_rss_mb is not None and rss is not None and rss > self.max_rss_mb:
+                reason = 'memory'
+        if reason is None:
+            return
+
+        before = self.last_rss_mb
+        start = time.perf_counter()
+        self._recycling = True
+        try:
+            browser.recycle()
+        finally:
+            self._recycling = False
+        duration = time.perf_counter() - start
+        self.recycles.append({
+            'reason': reason,
+            'navigations': self.navigations,
+            'rss_before_mb': before,
+            'rss_after_mb': self.sample(browser),
+            'duration': duration
+        })
+        self.navigations = 0
+
+    def stats(self):
+        """
+        Devuelve las estadísticas de memoria y reciclado de la sesión.
+
+        :return: Diccionario con 'navigations', 'total_navigations', 'samples', 'last_rss_mb', 'peak_rss_mb',
+                 'recycle_count' y 'recycles' (motivo, memoria antes y después y duración de cada reciclado).
+        :rtype: dict
+        """
+        return {
+            'navigations': self.navigations,
+            'total_navigations': self.total_navigations,
+            'samples': self.samples,
+            'last_rss_mb': self.last_rss_mb,
+            'peak_rss_mb': self.peak_rss_mb,
+            'recycle_count': len(self.recycles),
+            'recycles': list(self.recycles)
+        }
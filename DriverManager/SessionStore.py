@@ -0,0 +1,134 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+class SessionStore:
+    """
+    Almacén en disco del estado de sesión (cookies, localStorage y sessionStorage) tras un login real,
+    indexado por el 'id' del LoginPage.
+
+    BrowserManager.login_with_session() lo usa para inyectar la sesión guardada y saltarse el formulario.
+    Cada entrada caduca a los 'ttl' segundos de guardarse.
+
+    Varios procesos (MatrixRunner, WorkerFarm) pueden compartir el mismo archivo: cada lectura-modificación-escritura
+    se hace con un bloqueo de archivo ('<archivo>.lock') además del cerrojo entre hilos.
+    """
+    def __init__(self, path=None, ttl=3600):
+        """
+        :param path: Archivo JSON donde se guardan las sesiones. Por defecto 'DriverManager/data_load/session_store.json'.
+        :param ttl: Segundos de validez de cada sesión guardada.
+
+        :type path: str
+        :type ttl: float
+        """
+        if path is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))  # Obtiene directorio actual del archivo que lo ejecuta
+            path = os.path.join(base_dir, "data_load", "session_store.json")  # Construye la ruta absoluta
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def _read(self):
+        """
+        Lee todas las sesiones del archivo. Devuelve un diccionario vacío si no existe o está dañado.
+        """
+        try:
+            with open(self.path) as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, sessions):
+        """
+        Escribe todas las sesiones en un archivo temporal propio y lo renombra, para no dejar nunca un JSON a medias.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as file:
+                json.dump(sessions, file)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @contextmanager
+    def _locked(self):
+        """
+        Bloquea el archivo para este hilo y para los demás procesos que usan el mismo archivo.
+        """
+        with self._lock, open(self.path + '.lock', 'a+') as lock_file:
+            if os.name == 'nt':
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if os.name == 'nt':
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def save(self, page_id, state):
+        """
+        Guarda el estado de sesión de una página.
+
+        :param page_id: 'id' del LoginPage.
+        :param state: Estado devuelto por BrowserManager.capture_session_state().
+
+        :type page_id: str
+        :type state: dict
+        """
+        with self._locked():
+            sessions = self._read()
+            sessions[page_id] = dict(state, saved_at=time.time())
+            self._write(sessions)
+
+    def load(self, page_id):
+        """
+        Devuelve el estado de sesión guardado si existe y no ha caducado. Las entradas caducadas se eliminan.
+
+        :param page_id: 'id' del LoginPage.
+
+        :type page_id: str
+
+        :return: El estado guardado, o None si no hay uno válido.
+        :rtype: dict or None
+        """
+        with self._locked():
+            sessions = self._read()
+            state = sessions.get(page_id)
+            if state is None:
+                return None
+            if time.time() - state['saved_at'] > self.ttl:
+                del sessions[page_id]
+                self._write(sessions)
+                return None
+            return state
+
+    def invalidate(self, page_id):
+        """
+        Elimina el estado de sesión guardado de una página, por ejemplo si el sitio lo ha rechazado.
+
+        :param page_id: 'id' del LoginPage.
+
+        :type page_id: str
+        """
+        with self._locked():
+            sessions = self._read()
+            if sessions.pop(page_id, None) is not None:
+                self._write(sessions)
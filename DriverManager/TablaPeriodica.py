@@ -10,30 +10,43 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from DriverManager.BrowserManager import BrowserManager
+from DriverManager.Instrumentation import traced
 from DriverManager.LoginPage import LoginPage
+from DriverManager.ResultStore import ResultStore
 
 
 class TablaPeriodica(BrowserManager):
-    def __init__(self, browser_type):
+    def __init__(self, browser_type, wait_strategy=None, profile=None, instrumentation=None):
         """
         Inicializa el driver basado en el navegador seleccionado.
         Inicializa sus atributos creando un LoginPage.
 
         :param browser_type: Tipo de navegador a usar. Acepta "chrome" y "firefox".
+        :param wait_strategy: Estrategia de espera tras cada acción. Ver BrowserManager.
+        :param profile: Perfil de arranque. Por defecto el indicado en el LoginPage 'TABLA_P'.
+        :param instrumentation: Instrumentation para registrar tiempos. Ver BrowserManager.
 
         :type browser_type: str
+        :type wait_strategy: WaitStrategy
+        :type profile: str or LaunchProfile
+        :type instrumentation: Instrumentation
 
-        :raises ValueError: Si el tipo de navegador no es soportado.
+        :raises ValueError: Si el tipo de navegador o el perfil no son soportados.
         """
-        super().__init__(browser_type)
         self.loginpage = LoginPage.get_login_page_by_id('TABLA_P')
+        super().__init__(browser_type, wait_strategy, profile or self.loginpage.profile,
+                         instrumentation=instrumentation)
 
-    def open_browser(self):
+    @traced
+    def open_browser(self, url=None):
         """
         Abre la URL de login en CST y maximiza la ventana del navegador.
+
+        :param url: URL que se va a abrir en lugar de la de login, como hacen recycle() o
+                    restore_session_state() al volver a la página en la que estaba el navegador.
+        :type url: str or None
         """
-        self.driver.get(self.loginpage.url)
-        self.driver.maximize_window()
+        super().open_browser(url or self.loginpage.url)
 
 
 
@@ -44,6 +57,8 @@ if __name__ == "__main__":
     tp.open_browser()
     tp.select_element('id', 'Gases', t)
     time.sleep(2)
+    # Una sola llamada al navegador para leer todas las tablas; get_cell responde desde la instantánea
+    tp.load_table_snapshot()
     o2_neutrones = tp.get_cell('Cloro', -2, t)
 
 
@@ -52,5 +67,14 @@ if __name__ == "__main__":
     print('*********************************')
     print(o2_neutrones.get_attribute('outerHTML'))
     print('*********************************')
+    # Tabla completa en una sola llamada; Wikipedia en español usa la coma como separador decimal
+    tabla = tp.extract_table('table.wikitable', decimal=',')
+    print(list(tabla))
+    print('*********************************')
+    # Caché en disco: la próxima vez solo se vuelven a leer las filas que hayan cambiado
+    with ResultStore() as store:
+        print(store.refresh(tp, tp.loginpage.id, 'table.wikitable'))
+        print(store.get_cell(tp.loginpage.id, tp.driver.current_url, 'Cloro', -2, 'table.wikitable'))
+    print('*********************************')
     time.sleep(2)
     tp.close_browser()
\ No newline at end of file
@@ -0,0 +1,216 @@
+import math
+import re
+from array import array
+
+# Número con signo opcional, separador de miles opcional (solo en grupos de tres cifras) y parte decimal opcional.
+# Los espacios (normales, duros y finos) también sirven como separador de miles.
+_NUMBER_PATTERN = r'^[+-]?(?:\d{{1,3}}(?:[{thousands} \xa0\u202f]\d{{3}})+|\d+)(?:{decimal}\d+)?$'
+_NUMBER = {
+    '.': re.compile(_NUMBER_PATTERN.format(thousands=',', decimal=r'\.')),
+    ',': re.compile(_NUMBER_PATTERN.format(thousands=r'\.', decimal=','))
+}
+# Límites de array('q')
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def parse_number(text, decimal='.'):
+    """
+    Convierte el texto de una celda en int o float si representa un número.
+
+    El separador de miles (',' si el decimal es '.', o '.' si el decimal es ',') solo se acepta separando
+    grupos de tres cifras: con decimal='.', "1,234" es 1234 pero "1,5" no es un número.
+
+    :param text: Texto de la celda.
+    :param decimal: Separador decimal usado en la página ('.' o ',').
+
+    :type text: str
+    :type decimal: str
+
+    :return: El número, o None si el texto no es numérico.
+    :rtype: int or float or None
+
+    :raises ValueError: Si 'decimal' no es '.' ni ','.
+    """
+    if decimal not in _NUMBER:
+        raise ValueError(f"Separador decimal '{decimal}' no soportado. Usa '.' o ','.")
+    value = text.strip().replace('−', '-')
+    if not _NUMBER[decimal].match(value):
+        return None
+    thousands = ',' if decimal == '.' else '.'
+    for separator in (thousands, ' ', '\xa0', '\u202f'):
+        value = value.replace(separator, '')
+    value = value.replace(decimal, '.')
+    return float(value) if '.' in value else int(value)
+
+
+def _typed_column(values, decimal):
+    """
+    Convierte una columna de textos en array('q') si todos son enteros, en array('d') si todos son numéricos
+    (las celdas vacías pasan a NaN) o la deja como lista de textos.
+
+    Los enteros que no caben en 64 bits (identificadores largos) dejan la columna como textos,
+    para no perder cifras al pasarlos a float.
+    """
+    numbers = []
+    for text in values:
+        if text == '':
+            numbers.append(None)
+            continue
+        number = parse_number(text, decimal)
+        if number is None:
+            return list(values)
+        numbers.append(number)
+
+    if all(number is None for number in numbers):
+        return list(values)
+    if all(isinstance(number, int) for number in numbers):
+        if all(_INT64_MIN <= number <= _INT64_MAX for number in numbers):
+            return array('q', numbers)
+        return list(values)
+    return array('d', [math.nan if number is None else float(number) for number in numbers])
+
+
+def grid_to_columns(grid, header_rows=1, decimal='.'):
+    """
+    Convierte la cuadrícula de textos de una tabla en un diccionario columnar.
+
+    Los títulos de columna se forman uniendo con ' / ' los textos de las 'header_rows' primeras filas;
+    los títulos repetidos o vacíos reciben un sufijo con su número de columna.
+
+    :param grid: Lista de filas, cada una con el texto de cada celda (ya con rowspan/colspan desplegados).
+    :param header_rows: Número de filas de títulos al principio de la tabla.
+    :param decimal: Separador decimal usado en la página ('.' o ',').
+
+    :type grid: list[list[str]]
+    :type header_rows: int
+    :type decimal: str
+
+    :return: Diccionario título -> array('q'), array('d') o list[str], todas de la misma longitud.
+    :rtype: dict
+    """
+    width = max((len(row) for row in grid), default=0)
+    rows = [row + [''] * (width - len(row)) for row in grid]
+
+    headers = []
+    for column in range(width):
+        parts = []
+        for row in rows[:header_rows]:
+            if row[column] and row[column] not in parts:
+                parts.append(row[column])
+        header = ' / '.join(parts) or f"columna_{column + 1}"
+        if header in headers:
+            header = f"{header}_{column + 1}"
+        headers.append(header)
+
+    body = rows[header_rows:]
+    return {header: _typed_column([row[column] for row in body], decimal)
+            for column, header in enumerate(headers)}
+
+
+class TextGrid:
+    """
+    Textos de las celdas de una tabla fila a fila, guardados de forma compacta.
+
+    Todos los textos se concatenan en una sola cadena y se guardan en array('I') la posición donde empieza cada
+    celda y la primera celda de cada fila. Así millones de celdas no crean millones de objetos str y listas;
+    los textos de una fila se crean solo al pedirla. Se usa como una lista de listas: grid[fila][columna].
+    """
+    __slots__ = ('_text', '_offsets', '_row_starts')
+
+    def __init__(self, rows=()):
+        """
+        :param rows: Filas, cada una con el texto de cada celda. Las filas pueden tener longitudes distintas.
+
+        :type rows: iterable[list[str]]
+        """
+        parts = []
+        offsets = array('I', [0])
+        row_starts = array('I', [0])
+        position = 0
+        for row in rows:
+            for text in row:
+                parts.append(text)
+                position += len(text)
+                offsets.append(position)
+            row_starts.append(len(offsets) - 1)
+        self._text = ''.join(parts)
+        self._offsets = offsets
+        self._row_starts = row_starts
+
+    def __len__(self):
+        return len(self._row_starts) - 1
+
+    def __getitem__(self, row):
+        """
+        Devuelve la lista de textos de la fila. Admite índices negativos y slices.
+
+        :rtype: list[str] or list[list[str]]
+        """
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(f"La tabla tiene {len(self)} filas, pero se pidió la {row}.")
+        offsets = self._offsets
+        return [self._text[offsets[i]:offsets[i + 1]]
+                for i in range(self._row_starts[row], self._row_starts[row + 1])]
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    def cell(self, row, column):
+        """
+        Devuelve el texto de una celda sin crear los del resto de la fila.
+
+        :param row: Posición de la fila (0-indexed).
+        :param column: Posición de la celda en la fila (0-indexed).
+
+        :type row: int
+        :type column: int
+
+        :rtype: str
+
+        :raises IndexError: Si la fila o la columna no existen.
+        """
+        if not 0 <= column < self.row_length(row):
+            raise IndexError(f"La fila {row} tiene {self.row_length(row)} celdas, pero se pidió la {column}.")
+        i = self._row_starts[row] + column
+        return self._text[self._offsets[i]:self._offsets[i + 1]]
+
+    def row_length(self, row):
+        """
+        Devuelve el número de celdas de la fila.
+
+        :rtype: int
+        """
+        return self._row_starts[row + 1] - self._row_starts[row]
+
+
+def to_frame(columns, as_frame):
+    """
+    Convierte el diccionario columnar en la estructura pedida.
+
+    :param columns: Diccionario devuelto por grid_to_columns().
+    :param as_frame: None para devolverlo tal cual, 'numpy' para un diccionario de numpy.ndarray
+                     o 'pandas' para un pandas.DataFrame.
+
+    :type columns: dict
+    :type as_frame: str or None
+
+    :raises ValueError: Si 'as_frame' no es un formato soportado.
+    :raises ImportError: Si el formato pedido necesita una librería que no está instalada.
+    """
+    if as_frame is None:
+        return columns
+    if as_frame == 'numpy':
+        import numpy
+        return {header: numpy.asarray(values) if isinstance(values, array) else numpy.asarray(values, dtype=object)
+                for header, values in columns.items()}
+    if as_frame == 'pandas':
+        import pandas
+        return pandas.DataFrame({header: list(values) if isinstance(values, array) else values
+                                 for header, values in columns.items()})
+    raise ValueError(f"Formato '{as_frame}' no soportado. Usa None, 'numpy' o 'pandas'.")
@@ -0,0 +1,246 @@
+import csv
+import json
+
+from selenium.webdriver.common.by import By
+
+# Texto de las filas [start, start + count) de la tabla y, con 'prune', las elimina del DOM.
+# Las filas de <tfoot> no son datos: 'table.rows' siempre las pone al final, así que basta con no contarlas.
+FETCH_ROWS_SCRIPT = """
+    var table = document.querySelector(arguments[0]);
+    if (!table) return null;
+    var start = arguments[1], count = arguments[2], prune = arguments[3];
+    var rows = table.rows, length = rows.length - table.querySelectorAll(':scope > tfoot > tr').length;
+    var end = Math.min(start + count, length), out = [];
+    for (var i = start; i < end; i++) {
+        var cells = rows[i].cells, values = [];
+        for (var c = 0; c < cells.length; c++) values.push(cells[c].textContent.trim());
+        out.push(values);
+    }
+    if (prune) {
+        for (var i = end - 1; i >= start; i--) rows[i].remove();
+    }
+    return {rows: out, total: length - (prune ? end - start : 0)};
+"""
+
+# Número de filas de datos de la tabla (sin <tfoot>), o -1 si la tabla no está.
+ROW_COUNT_SCRIPT = """
+    var table = document.querySelector(arguments[0]);
+    return table ? table.rows.length - table.querySelectorAll(':scope > tfoot > tr').length : -1;
+"""
+
+# Hace scroll hasta la última fila de datos de la tabla y el final de la página.
+SCROLL_TO_END_SCRIPT = """
+    var table = document.querySelector(arguments[0]);
+    var length = table ? table.rows.length - table.querySelectorAll(':scope > tfoot > tr').length : 0;
+    if (length > 0) table.rows[length - 1].scrollIntoView({block: 'end'});
+    window.scrollTo(0, document.body.scrollHeight);
+"""
+
+
+class TableStream:
+    """
+    Lee una tabla por bloques de filas en lugar de cargarla entera, siguiendo la paginación
+    ("siguiente página") o el scroll infinito si se indican.
+
+    Cada bloque se pide al navegador en una sola llamada y solo cuando se consume el anterior, así que la memoria
+    en Python depende del tamaño del bloque y no del de la tabla. Con 'prune=True' además se eliminan del DOM
+    las filas ya leídas, para que tampoco crezca la memoria del navegador con el scroll infinito.
+    """
+    def __init__(self, browser, selector='table', chunk_size=500, header_rows=1, next_selector=None,
+                 next_selector_type='css', scroll=False, prune=False, max_pages=None, seconds=0):
+        """
+        :param browser: BrowserManager con la página de la tabla ya abierta.
+        :param selector: Selector CSS de la tabla.
+        :param chunk_size: Número máximo de filas por bloque.
+        :param header_rows: Filas de títulos al principio de la tabla en cada página. No se devuelven como datos.
+        :param next_selector: Selector del botón o enlace de "siguiente página", o None si no hay paginación.
+        :param next_selector_type: Tipo del selector de "siguiente página": 'css' o 'xpath'.
+        :param scroll: Si es True, al acabar las filas se hace scroll para cargar más (scroll infinito).
+        :param prune: Si es True, se eliminan del DOM las filas ya leídas.
+        :param max_pages: Número máximo de páginas a recorrer, o None para recorrerlas todas.
+        :param seconds: Tiempo en segundos a esperar entre acciones si el throttling está activado.
+
+        :type browser: BrowserManager
+        :type selector: str
+        :type chunk_size: int
+        :type header_rows: int
+        :type next_selector: str or None
+        :type next_selector_type: str
+        :type scroll: bool
+        :type prune: bool
+        :type max_pages: int or None
+        :type seconds: float
+        """
+        self.browser = browser
+        self.selector = selector
+        self.chunk_size = chunk_size
+        self.header_rows = header_rows
+        self.next_selector = next_selector
+        self.next_selector_type = next_selector_type
+        self.scroll = scroll
+        self.prune = prune
+        self.max_pages = max_pages
+        self.seconds = seconds
+        self.header = None
+
+    def _fetch(self, start, count, prune):
+        """
+        Lee en una sola llamada las filas [start, start + count) de la tabla, sin contar las de <tfoot>.
+
+        :return: Diccionario con 'rows' (listas de textos) y 'total' (filas en el DOM tras la lectura),
+                 o None si no se encuentra la tabla.
+        :rtype: dict or None
+        """
+        return self.browser.driver.execute_script(FETCH_ROWS_SCRIPT, self.selector, start, count, prune)
+
+    def _row_count(self):
+        """
+        Devuelve el número de filas de la tabla en el DOM sin contar las de <tfoot>, o -1 si la tabla no está.
+        """
+        return self.browser.driver.execute_script(ROW_COUNT_SCRIPT, self.selector)
+
+    def _scroll_for_more(self, total):
+        """
+        Hace scroll hasta el final de la tabla y espera a que se carguen filas nuevas.
+
+        :return: True si aparecieron filas nuevas, False si la tabla ya no crece.
+        :rtype: bool
+        """
+        self.browser.driver.execute_script(SCROLL_TO_END_SCRIPT, self.selector)
+        return self.browser.waits.wait(self.browser.driver, lambda driver: self._row_count() > total)
+
+    def _next_page(self):
+        """
+        Pulsa el botón de "siguiente página" si está visible y habilitado, y comprueba que cambien las filas.
+
+        El clic ya espera a que la página se estabilice, así que si las filas no cambian en 'quiet_timeout'
+        segundos más se da por hecho que era la última página (hay botones que nunca se deshabilitan).
+
+        :return: True si se pasó a otra página, False si no hay más páginas.
+        :rtype: bool
+        """
+        by = By.XPATH if self.next_selector_type == 'xpath' else By.CSS_SELECTOR
+        buttons = self.browser.driver.find_elements(by, self.next_selector)
+        if not buttons or not buttons[0].is_displayed() or not buttons[0].is_enabled():
+            return False
+
+        previous = self._fetch(self.header_rows, 1, False)
+        self.browser.click(self.next_selector_type, self.next_selector, self.seconds)
+        # La página siguiente puede cargarse por AJAX sin navegar: se comprueba que cambie la primera fila
+        return self.browser.waits.wait(self.browser.driver,
+                                       lambda driver: self._fetch(self.header_rows, 1, False) != previous,
+                                       self.browser.waits.quiet_timeout)
+
+    def chunks(self):
+        """
+        Genera bloques de filas. Cada bloque es una lista de tuplas con el texto de cada celda.
+
+        El siguiente bloque no se pide al navegador hasta que se consume el anterior.
+
+        :rtype: generator[list[tuple[str]]]
+        """
+        if self.header_rows:
+            data = self._fetch(0, self.header_rows, False)
+            if data is None:
+                print(f"\n\t*** = ***\nError: No se encontró ninguna tabla con selector: {self.selector}.")
+                return
+            if data['rows']:
+                self.header = tuple(data['rows'][-1])
+
+        page = 1
+        offset = self.header_rows
+        while True:
+            data = self._fetch(offset, self.chunk_size, self.prune)
+            if data is None:
+                print(f"\n\t*** = ***\nError: No se encontró ninguna tabla con selector: {self.selector}.")
+                return
+            if data['rows']:
+                yield [tuple(row) for row in data['rows']]
+                # Con 'prune' las filas leídas desaparecen y las siguientes ocupan su lugar
+                if not self.prune:
+                    offset += len(data['rows'])
+                continue
+
+            if self.scroll and self._scroll_for_more(data['total']):
+                continue
+            if self.next_selector and (self.max_pages is None or page < self.max_pages) and self._next_page():
+                page += 1
+                offset = self.header_rows
+                continue
+            return
+
+    def rows(self):
+        """
+        Genera las filas de una en una, como tuplas con el texto de cada celda.
+
+        :rtype: generator[tuple[str]]
+        """
+        for chunk in self.chunks():
+            yield from chunk
+
+    def __iter__(self):
+        return self.rows()
+
+    def _record(self, row):
+        """
+        Convierte una fila en un diccionario título -> valor sin perder celdas si la fila no mide lo mismo
+        que los títulos: a las columnas sin título se les da 'columna_N' (como en grid_to_columns) y las que
+        faltan se rellenan con ''.
+
+        :param row: Texto de cada celda de la fila.
+
+        :type row: tuple[str]
+
+        :rtype: dict
+        """
+        if len(row) == len(self.header):
+            return dict(zip(self.header, row))
+        record = {header: '' for header in self.header}
+        for column, value in enumerate(row):
+            header = self.header[column] if column < len(self.header) else f"columna_{column + 1}"
+            if column >= len(self.header) and header in record:
+                header = f"{header}_{column + 1}"
+            record[header] = value
+        return record
+
+    def write_csv(self, path):
+        """
+        Escribe la tabla en un CSV bloque a bloque, con la fila de títulos si la hay.
+
+        :param path: Ruta del archivo CSV.
+
+        :type path: str
+
+        :return: Número de filas de datos escritas.
+        :rtype: int
+        """
+        written = 0
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            for chunk in self.chunks():
+                if written == 0 and self.header:
+                    writer.writerow(self.header)
+                writer.writerows(chunk)
+                written += len(chunk)
+        return written
+
+    def write_jsonl(self, path):
+        """
+        Escribe la tabla en un archivo JSON Lines bloque a bloque. Cada línea es un objeto título -> valor
+        si la tabla tiene títulos, o una lista de valores si no los tiene. Ver _record().
+
+        :param path: Ruta del archivo JSONL.
+
+        :type path: str
+
+        :return: Número de filas de datos escritas.
+        :rtype: int
+        """
+        written = 0
+        with open(path, 'w', encoding='utf-8') as file:
+            for chunk in self.chunks():
+                for row in chunk:
+                    record = self._record(row) if self.header else list(row)
+                    file.write(json.dumps(record, ensure_ascii=False) + '\n')
+                written += len(chunk)
+        return written
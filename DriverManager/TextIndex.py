@@ -0,0 +1,184 @@
+class TextIndex:
+    """
+    Índice de textos dentro de la página: un Map de JavaScript de texto normalizado -> nodos de texto, y otro
+    de trigramas (cada secuencia de tres caracteres) -> textos que la contienen para las búsquedas parciales.
+
+    Se construye una vez por navegación con un TreeWalker y se mantiene al día con un MutationObserver,
+    así que cada búsqueda (o lote de búsquedas) es una única llamada a execute_script en lugar de evaluar
+    una XPath sobre todo el DOM. Las búsquedas exactas son una consulta al Map; las parciales solo comparan
+    los textos que contienen el trigrama menos frecuente del texto buscado. Los textos buscados de menos
+    de tres caracteres recorren todos los textos indexados.
+
+    Al navegar el índice desaparece con la página. Si la página cambia demasiado ('max_mutations' cambios),
+    el índice se invalida. En ambos casos la búsqueda reconstruye el índice y responde con el índice nuevo.
+    """
+    def __init__(self, browser, max_mutations=10000):
+        """
+        :param browser: BrowserManager sobre el que se construye el índice.
+        :param max_mutations: Número de mutaciones del DOM a partir del cual el índice se invalida.
+
+        :type browser: BrowserManager
+        :type max_mutations: int
+        """
+        self.browser = browser
+        self.max_mutations = max_mutations
+        self.hits = 0
+        self.fallbacks = 0
+        self.builds = 0
+
+    def build(self):
+        """
+        Construye (o reconstruye) el índice en la página actual.
+
+        :return: Número de textos distintos indexados.
+        :rtype: int
+        """
+        self.builds += 1
+        return self.browser.driver.execute_script("""
+            var maxMutations = arguments[0];
+            if (window.__dmTextIndex && window.__dmTextIndex.observer) window.__dmTextIndex.observer.disconnect();
+            function norm(text) { return text.replace(/\\s+/g, ' ').trim(); }
+            var index = {map: new Map(), trigrams: new Map(), valid: true, mutations: 0};
+
+            function addKey(key) {
+                var seen = new Set();
+                for (var i = 0; i + 3 <= key.length; i++) {
+                    var trigram = key.substr(i, 3);
+                    if (seen.has(trigram)) continue;
+                    seen.add(trigram);
+                    var keys = index.trigrams.get(trigram);
+                    if (!keys) index.trigrams.set(trigram, keys = []);
+                    keys.push(key);
+                }
+            }
+            function addText(node) {
+                var key = norm(node.nodeValue);
+                if (!key || !node.parentElement) return;
+                var nodes = index.map.get(key);
+                if (!nodes) {
+                    index.map.set(key, nodes = []);
+                    addKey(key);
+                }
+                nodes.push(node);
+            }
+            function addTree(root) {
+                if (root.nodeType === 3) { addText(root); return; }
+                if (root.nodeType !== 1) return;
+                var walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT), node;
+                while ((node = walker.nextNode())) addText(node);
+            }
+
+            addTree(document.body);
+            // Los nodos eliminados o con otro texto se descartan al consultar; aquí solo se añaden los nuevos
+            index.observer = new MutationObserver(function (records) {
+                index.mutations += records.length;
+                if (index.mutations > maxMutations) {
+                    index.valid = false;
+                    index.observer.disconnect();
+                    index.map.clear();
+                    index.trigrams.clear();
+                    return;
+                }
+                records.forEach(function (record) {
+                    if (record.type === 'characterData') addText(record.target);
+                    else record.addedNodes.forEach(addTree);
+                });
+            });
+            index.observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+            window.__dmTextIndex = index;
+            return index.map.size;
+        """, self.max_mutations)
+
+    def _query(self, texts, exact, closest):
+        """
+        Busca los textos en el índice de la página en una sola llamada.
+
+        :return: Lista con un WebElement (o None) por texto, o None si el índice no existe o está invalidado.
+        :rtype: list or None
+        """
+        return self.browser.driver.execute_script("""
+            var index = window.__dmTextIndex, texts = arguments[0], exact = arguments[1], closest = arguments[2];
+            if (!index || !index.valid) return null;
+            function norm(text) { return text.replace(/\\s+/g, ' ').trim(); }
+
+            // Textos indexados que pueden contener 'key': los del trigrama menos frecuente de 'key'
+            function containing(key) {
+                if (key.length < 3) return Array.from(index.map.keys());
+                var best = null;
+                for (var i = 0; i + 3 <= key.length; i++) {
+                    var keys = index.trigrams.get(key.substr(i, 3));
+                    if (!keys) return [];
+                    if (!best || keys.length < best.length) best = keys;
+                }
+                return best;
+            }
+
+            function find(text) {
+                var key = norm(text), candidates = [];
+                if (index.map.has(key)) candidates.push([key, index.map.get(key)]);
+                if (!exact) {
+                    containing(key).forEach(function (other) {
+                        if (other !== key && other.indexOf(key) !== -1) candidates.push([other, index.map.get(other)]);
+                    });
+                }
+                for (var i = 0; i < candidates.length; i++) {
+                    var nodes = candidates[i][1];
+                    for (var j = 0; j < nodes.length; j++) {
+                        var node = nodes[j];
+                        if (!node.isConnected || norm(node.nodeValue) !== candidates[i][0]) continue;
+                        var element = closest ? node.parentElement.closest(closest) : node.parentElement;
+                        if (element && element.getClientRects().length > 0) return element;
+                    }
+                }
+                return null;
+            }
+            return texts.map(find);
+        """, list(texts), exact, closest)
+
+    def lookup_many(self, texts, exact=False, closest=None):
+        """
+        Busca varios textos en una sola llamada al navegador.
+
+        :param texts: Textos a buscar.
+        :param exact: Si es True, el texto del nodo debe coincidir entero; si es False, basta con que lo contenga.
+        :param closest: Selector CSS opcional: en lugar del elemento con el texto se devuelve su ancestro más
+                        cercano que lo cumpla (por ejemplo 'tr' para obtener la fila).
+
+        :type texts: list[str]
+        :type exact: bool
+        :type closest: str or None
+
+        :return: Lista con el WebElement visible encontrado para cada texto, o None si no se encuentra.
+                 Devuelve None en lugar de la lista si el índice no se puede usar ni reconstruido y hay que usar XPath.
+        :rtype: list[WebElement or None] or None
+        """
+        results = self._query(texts, exact, closest)
+        if results is None:
+            # Índice perdido por navegación o invalidado por demasiados cambios: se reconstruye y se responde con él
+            self.fallbacks += 1
+            self.build()
+            results = self._query(texts, exact, closest)
+            if results is None:
+                return None
+        self.hits += 1
+        return results
+
+    def lookup(self, text, exact=False, closest=None):
+        """
+        Busca un texto en el índice. Ver lookup_many().
+
+        :return: El WebElement encontrado, o None si no se encuentra o el índice no es utilizable.
+        :rtype: WebElement or None
+        """
+        results = self.lookup_many([text], exact, closest)
+        return results[0] if results else None
+
+    def stats(self):
+        """
+        Devuelve los contadores del índice.
+
+        :return: Diccionario con 'hits' (consultas resueltas por el índice), 'fallbacks' (consultas que encontraron
+                 el índice perdido o invalidado y lo reconstruyeron) y 'builds' (veces que se construyó el índice).
+        :rtype: dict
+        """
+        return {'hits': self.hits, 'fallbacks': self.fallbacks, 'builds': self.builds}
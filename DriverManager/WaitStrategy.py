@@ -0,0 +1,228 @@
+import time
+
+from selenium.common import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
+
+from DriverManager.Instrumentation import NULL_INSTRUMENTATION
+
+
+# Instala (una vez por página) el observador de cambios del DOM y el contador de peticiones XHR/fetch pendientes
+OBSERVE_PAGE_SCRIPT = """
+    if (window.__dmLastMutation === undefined) {
+        window.__dmLastMutation = performance.now();
+        new MutationObserver(function () {
+            window.__dmLastMutation = performance.now();
+        }).observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+
+        window.__dmPending = 0;
+        var send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            window.__dmPending++;
+            this.addEventListener('loadend', function () { window.__dmPending--; });
+            return send.apply(this, arguments);
+        };
+        if (window.fetch) {
+            var fetch = window.fetch;
+            window.fetch = function () {
+                window.__dmPending++;
+                return fetch.apply(window, arguments).finally(function () { window.__dmPending--; });
+            };
+        }
+    }
+"""
+
+# Antes de un clic o un envío: instala el observador, anota el instante de la acción y si la página empieza a
+# descargarse. PageSettled no da la página por estable hasta ver algún efecto de la acción (ver 'min_wait').
+MARK_ACTION_SCRIPT = OBSERVE_PAGE_SCRIPT + """
+    window.__dmActionAt = performance.now();
+    window.__dmLeaving = false;
+    window.addEventListener('beforeunload', function () { window.__dmLeaving = true; }, {once: true});
+"""
+
+
+class PageSettled:
+    """
+    Condición para WebDriverWait que se cumple cuando la página ha terminado de cargar, no tiene peticiones
+    XHR/fetch pendientes y el DOM lleva 'idle_time' segundos sin cambios.
+
+    Si el DOM no deja de cambiar (relojes, carruseles, animaciones) o hay peticiones que no terminan (long polling),
+    a los 'quiet_timeout' segundos de la primera comprobación basta con que la página haya terminado de cargar.
+
+    Si antes de la acción se ejecutó MARK_ACTION_SCRIPT, mientras la página anterior se descarga no se cumple,
+    y si aún no se ha visto ningún efecto de la acción (página nueva, cambio en el DOM o petición en curso)
+    tampoco se cumple hasta pasados 'min_wait' segundos: un clic que navega puede no haber empezado la navegación
+    en la primera comprobación.
+
+    La primera comprobación en cada página instala el observador del DOM y el contador de peticiones
+    (OBSERVE_PAGE_SCRIPT), si WaitStrategy.before_click() no lo hizo ya. Cada comprobación es una única llamada
+    a execute_script.
+    """
+    def __init__(self, idle_time, quiet_timeout=1.0, min_wait=0.0):
+        """
+        :param idle_time: Segundos sin cambios en el DOM para considerar la página estable.
+        :param quiet_timeout: Segundos máximos esperando a que el DOM y la red queden en reposo una vez cargada
+                              la página.
+        :param min_wait: Segundos mínimos de espera si la acción marcada con MARK_ACTION_SCRIPT aún no ha tenido
+                         ningún efecto visible.
+
+        :type idle_time: float
+        :type quiet_timeout: float
+        :type min_wait: float
+        """
+        self.idle_time = idle_time
+        self.quiet_timeout = quiet_timeout
+        self.min_wait = min_wait
+        self.started = None
+
+    def __call__(self, driver):
+        state = driver.execute_script(OBSERVE_PAGE_SCRIPT + """
+            return {
+                ready: document.readyState,
+                pending: window.__dmPending,
+                domIdle: (performance.now() - window.__dmLastMutation) / 1000,
+                leaving: window.__dmLeaving === true,
+                // Sin marca es una página nueva (o no se marcó la acción): no hay nada más que esperar
+                changed: window.__dmActionAt === undefined || window.__dmLastMutation > window.__dmActionAt
+                         || window.__dmPending > 0
+            };
+        """)
+        now = time.monotonic()
+        if self.started is None:
+            self.started = now
+        if state['ready'] != 'complete' or state['leaving']:
+            return False
+        if not state['changed'] and now - self.started < self.min_wait:
+            return False
+        quiet = state['pending'] <= 0 and state['domIdle'] >= self.idle_time
+        return quiet or now - self.started >= self.quiet_timeout
+
+
+class ValueCommitted:
+    """
+    Condición para WebDriverWait que se cumple cuando el valor del campo de entrada es el texto escrito.
+    """
+    def __init__(self, element, text):
+        """
+        :param element: Campo de entrada en el que se ha escrito.
+        :param text: Texto que debe contener el campo.
+
+        :type element: WebElement
+        :type text: str
+        """
+        self.element = element
+        self.text = text
+
+    def __call__(self, driver):
+        return self.element.get_property('value') == self.text
+
+
+class WaitStrategy:
+    """
+    Decide cuánto esperar después de cada acción de BrowserManager.
+
+    Por defecto espera a condiciones reales (elemento clicable, valor escrito, página estable) en lugar de
+    dormir un tiempo fijo. Con 'throttle=True' además duerme los 'seconds' indicados en cada acción,
+    como hacía BrowserManager originalmente, por ejemplo para ver la ejecución a velocidad humana.
+    """
+    def __init__(self, timeout=10, poll_frequency=0.05, idle_time=0.3, commit_timeout=2, throttle=False,
+                 quiet_timeout=1.0, min_wait=0.25):
+        """
+        :param timeout: Segundos máximos de espera para que el elemento sea clicable o la página termine de cargar.
+        :param poll_frequency: Segundos entre comprobaciones de cada condición.
+        :param idle_time: Segundos sin cambios en el DOM para considerar la página estable.
+        :param commit_timeout: Segundos máximos de espera para que el valor escrito aparezca en el campo.
+        :param throttle: Si es True, se duerme además el tiempo 'seconds' de cada acción.
+        :param quiet_timeout: Segundos máximos esperando a que el DOM y la red queden en reposo una vez cargada
+                              la página. Ver PageSettled.
+        :param min_wait: Segundos mínimos de espera tras un clic que aún no ha tenido ningún efecto visible,
+                         por si la navegación que provoca no ha empezado. Ver PageSettled.
+
+        :type timeout: float
+        :type poll_frequency: float
+        :type idle_time: float
+        :type commit_timeout: float
+        :type throttle: bool
+        :type quiet_timeout: float
+        :type min_wait: float
+        """
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.idle_time = idle_time
+        self.commit_timeout = commit_timeout
+        self.throttle = throttle
+        self.quiet_timeout = quiet_timeout
+        self.min_wait = min_wait
+        # BrowserManager la sustituye por la suya si se instrumenta
+        self.instrumentation = NULL_INSTRUMENTATION
+
+    def pause(self, seconds):
+        """
+        Duerme 'seconds' segundos solo si el throttling explícito está activado.
+
+        :param seconds: Tiempo en segundos a esperar.
+
+        :type seconds: float
+        """
+        if self.throttle and seconds:
+            with self.instrumentation.span('sleep', 'sleep', seconds=seconds):
+                time.sleep(seconds)
+
+    def wait(self, driver, condition, timeout=None):
+        """
+        Espera a que se cumpla la condición sin lanzar excepción si no se cumple.
+
+        :param driver: El WebDriver sobre el que se evalúa la condición.
+        :param condition: Callable que recibe el driver, como las de expected_conditions.
+        :param timeout: Segundos máximos de espera. Por defecto 'self.timeout'.
+
+        :type driver: WebDriver
+        :type condition: callable
+        :type timeout: float
+
+        :return: True si la condición se cumplió, False si se agotó el tiempo.
+        :rtype: bool
+        """
+        if timeout is None:
+            timeout = self.timeout
+        with self.instrumentation.span(type(condition).__name__, 'wait', timeout=timeout) as span:
+            try:
+                # Durante una navegación el script puede fallar; se reintenta en la siguiente comprobación
+                WebDriverWait(driver, timeout, poll_frequency=self.poll_frequency,
+                              ignored_exceptions=[WebDriverException]).until(condition)
+                return True
+            except TimeoutException:
+                if span is not None:
+                    span['attributes']['timed_out'] = True
+                return False
+
+    def after_locate(self, driver, element, seconds):
+        """
+        Se llama cuando select_element() ya ha localizado el elemento visible.
+        """
+        self.pause(seconds)
+
+    def before_click(self, driver, element):
+        """
+        Espera a que el elemento esté habilitado y sea clicable, e instala el observador de la página para que
+        after_click() vea también las peticiones que lance el propio clic y sepa si el clic ha tenido efecto.
+        """
+        self.wait(driver, EC.element_to_be_clickable(element))
+        try:
+            driver.execute_script(MARK_ACTION_SCRIPT)
+        except WebDriverException:
+            pass
+
+    def after_write(self, driver, element, text, seconds):
+        """
+        Espera a que el campo contenga el texto escrito.
+        """
+        self.wait(driver, ValueCommitted(element, text), self.commit_timeout)
+        self.pause(seconds)
+
+    def after_click(self, driver, seconds):
+        """
+        Espera a que la página se estabilice tras el clic (carga completa, red y DOM en reposo). Ver PageSettled.
+        """
+        self.wait(driver, PageSettled(self.idle_time, self.quiet_timeout, self.min_wait))
+        self.pause(seconds)
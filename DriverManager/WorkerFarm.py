@@ -0,0 +1,381 @@
+import json
+import multiprocessing
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from multiprocessing.connection import wait
+
+from selenium.common import WebDriverException
+
+from DriverManager.BrowserManager import BrowserManager
+
+
+def _worker_main(browser_class, browser_type, profile, task, setup, tasks, events, heartbeat_interval):
+    """
+    Bucle de cada proceso de trabajo: arranca su navegador, procesa los elementos que le envía el supervisor
+    y cierra el navegador al terminar, también si algo falla.
+
+    Los avisos al supervisor van por una tubería propia del proceso ('events'), de modo que matar un proceso
+    no puede dejar bloqueada la comunicación de los demás. Un hilo envía un latido cada 'heartbeat_interval'
+    segundos mientras el proceso esté vivo.
+    """
+    if hasattr(os, 'setpgrp'):
+        # Grupo de procesos propio para que el supervisor pueda matar también chromedriver y el navegador
+        os.setpgrp()
+
+    stopped = threading.Event()
+    lock = threading.Lock()
+
+    def send(kind, key=None, payload=None):
+        with lock:
+            events.send((kind, key, payload))
+
+    def heartbeat():
+        while not stopped.wait(heartbeat_interval):
+            send('heartbeat')
+
+    threading.Thread(target=heartbeat, daemon=True).start()
+
+    browser = None
+    try:
+        while True:
+            if browser is None:
+                browser = browser_class(browser_type, profile=profile)
+                if setup is not None:
+                    setup(browser)
+                send('ready')
+
+            message = tasks.get()
+            if message is None:
+                break
+            key, item = message
+            try:
+                send('done', key, task(browser, item))
+            except WebDriverException as error:
+                # El navegador puede haber quedado inservible: se arranca otro para el siguiente elemento
+                send('failed', key, f"{type(error).__name__}: {error}".strip())
+                try:
+                    browser.close_browser()
+                except WebDriverException:
+                    pass
+                browser = None
+            except Exception as error:
+                send('failed', key, f"{type(error).__name__}: {error}".strip())
+    finally:
+        stopped.set()
+        if browser is not None:
+            try:
+                browser.close_browser()
+            except WebDriverException:
+                pass
+
+
+def kill_process_tree(process):
+    """
+    Mata un proceso de trabajo junto con el driver y el navegador que arrancó, y recoge su estado de salida
+    para que no quede como zombi.
+
+    :param process: Proceso de trabajo.
+
+    :type process: multiprocessing.Process
+    """
+    if process.pid is None:
+        return
+    try:
+        if hasattr(os, 'killpg'):
+            # Aunque el proceso ya haya terminado, pueden quedar vivos el driver o el navegador de su grupo
+            os.killpg(process.pid, signal.SIGKILL)
+        elif process.is_alive():
+            subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], capture_output=True)
+    except (ProcessLookupError, PermissionError):
+        if process.is_alive():
+            process.kill()
+    process.join(5)
+
+
+class Checkpoint:
+    """
+    Registro en disco (JSON Lines) de los elementos ya completados, para reanudar un trabajo interrumpido.
+
+    Cada línea es {"key": ..., "status": "done" | "failed", "result": ...}. Solo los 'done' se saltan al reanudar.
+    """
+    def __init__(self, path):
+        """
+        :param path: Ruta del archivo de checkpoint, o None para no guardar nada en disco.
+
+        :type path: str or None
+        """
+        self.path = path
+        self.results = {}
+        if path is not None and os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Línea a medio escribir si el proceso murió mientras guardaba
+                    if entry['status'] == 'done':
+                        self.results[entry['key']] = entry['result']
+
+    def is_done(self, key):
+        return key in self.results
+
+    def record(self, key, status, result):
+        """
+        Añade el resultado de un elemento y lo fuerza a disco.
+
+        :param key: Clave del elemento.
+        :param status: 'done' o 'failed'.
+        :param result: Resultado (serializable en JSON) o mensaje de error.
+
+        :type key: str
+        :type status: str
+        """
+        if status == 'done':
+            self.results[key] = result
+        if self.path is None:
+            return
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps({'key': key, 'status': status, 'result': result}) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+
+
+class WorkerFarm:
+    """
+    Supervisor que reparte elementos de trabajo entre procesos, cada uno con su propio BrowserManager.
+
+    Un navegador colgado o caído solo afecta a su proceso: el supervisor lo detecta por falta de latidos o porque
+    el elemento en curso supera 'item_timeout', mata el proceso con su driver y su navegador, arranca otro y
+    vuelve a encolar el elemento. Cada elemento terminado se guarda en el checkpoint, de modo que al relanzar
+    el trabajo solo se procesa lo pendiente.
+
+    'task' y 'setup' deben ser funciones definidas a nivel de módulo, porque se envían a otros procesos.
+    """
+    def __init__(self, task, browser_type, workers=2, browser_class=BrowserManager, profile=None, setup=None,
+                 checkpoint_path=None, heartbeat_interval=5, heartbeat_timeout=30, item_timeout=300,
+                 max_attempts=3, max_items_per_worker=None):
+        """
+        :param task: Función 'task(browser, item)' que procesa un elemento y devuelve un resultado serializable
+                     en JSON.
+        :param browser_type: Tipo de navegador a usar. Acepta "chrome" y "firefox".
+        :param workers: Número de procesos de trabajo.
+        :param browser_class: Clase del navegador de cada proceso, BrowserManager o una subclase como TablaPeriodica.
+        :param profile: Perfil de arranque del navegador. Ver BrowserManager.
+        :param setup: Función opcional 'setup(browser)' que se ejecuta cada vez que se arranca un navegador,
+                      por ejemplo para abrir la página o iniciar sesión.
+        :param checkpoint_path: Archivo de checkpoint para reanudar el trabajo, o None.
+        :param heartbeat_interval: Segundos entre latidos de cada proceso.
+        :param heartbeat_timeout: Segundos sin latidos tras los que se considera colgado un proceso.
+        :param item_timeout: Segundos máximos por elemento, incluido el arranque del navegador.
+        :param max_attempts: Intentos por elemento antes de darlo por fallido.
+        :param max_items_per_worker: Si se indica, cada proceso se recicla tras ese número de elementos para que
+                                     la memoria del navegador no crezca durante horas.
+
+        :type task: callable
+        :type browser_type: str
+        :type workers: int
+        :type browser_class: type
+        :type profile: str or LaunchProfile
+        :type setup: callable
+        :type checkpoint_path: str or None
+        :type heartbeat_interval: float
+        :type heartbeat_timeout: float
+        :type item_timeout: float
+        :type max_attempts: int
+        :type max_items_per_worker: int or None
+
+        :raises ValueError: Si el número de procesos o de intentos es menor que 1.
+        """
+        if workers < 1 or max_attempts < 1:
+            raise ValueError("Se necesita al menos un proceso de trabajo y un intento por elemento.")
+        self.task = task
+        self.browser_type = browser_type
+        self.workers = workers
+        self.browser_class = browser_class
+        self.profile = profile
+        self.setup = setup
+        self.checkpoint = Checkpoint(checkpoint_path)
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.item_timeout = item_timeout
+        self.max_attempts = max_attempts
+        self.max_items_per_worker = max_items_per_worker
+        self.failures = {}
+        self.restarts = 0
+        # 'spawn' para no heredar hilos ni sockets del supervisor
+        self._context = multiprocessing.get_context('spawn')
+        self._slots = []
+
+    def _spawn(self):
+        """
+        Arranca un proceso de trabajo con su propia cola de elementos y su propia tubería de avisos.
+        """
+        tasks = self._context.Queue()
+        events, child_events = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(self.browser_class, self.browser_type, self.profile, self.task, self.setup,
+                  tasks, child_events, self.heartbeat_interval),
+            daemon=True
+        )
+        process.start()
+        child_events.close()
+        now = time.monotonic()
+        # 'busy' es el elemento en curso; el tiempo de 'started' cuenta también el arranque del navegador
+        return {'process': process, 'tasks': tasks, 'events': events, 'ready': False, 'busy': None,
+                'started': now, 'heartbeat': now, 'processed': 0}
+
+    def _stop(self, slot, graceful):
+        """
+        Detiene el proceso de trabajo. Si 'graceful' es True le deja antes unos segundos para cerrar su navegador.
+        """
+        if graceful and slot['process'].is_alive():
+            try:
+                slot['tasks'].put(None)
+            except (OSError, ValueError):
+                pass
+            slot['process'].join(10)
+        kill_process_tree(slot['process'])
+        slot['tasks'].close()
+        slot['events'].close()
+
+    def _restart(self, worker_id, pending, attempts, reason):
+        """
+        Detiene el proceso, devuelve su elemento en curso a la cola y arranca otro en su lugar.
+
+        Con 'reason' None se trata de un reciclado programado y el proceso se detiene ordenadamente.
+        """
+        slot = self._slots[worker_id]
+        self._stop(slot, graceful=reason is None)
+        busy = slot['busy']
+        if busy is not None:
+            key, item = busy
+            if attempts.get(key, 0) >= self.max_attempts:
+                self._fail(key, reason)
+            else:
+                pending.appendleft(busy)
+        self.restarts += 1
+        self._slots[worker_id] = self._spawn()
+
+    def _fail(self, key, error):
+        self.failures[key] = error
+        self.checkpoint.record(key, 'failed', error)
+
+    def run(self, items, key=str):
+        """
+        Procesa los elementos pendientes y espera a que terminen todos.
+
+        :param items: Elementos de trabajo. Deben poder enviarse a otro proceso.
+        :param key: Función que da la clave única de cada elemento en el checkpoint. Por defecto str(item).
+
+        :type items: iterable
+        :type key: callable
+
+        :return: Diccionario clave -> resultado de todos los elementos completados, incluidos los de ejecuciones
+                 anteriores guardados en el checkpoint. Los fallidos quedan en 'self.failures'.
+        :rtype: dict
+        """
+        pending = deque(entry for entry in ((key(item), item) for item in items)
+                        if not self.checkpoint.is_done(entry[0]))
+        attempts = {}
+        startup_failures = 0  # Procesos seguidos que murieron sin llegar a arrancar el navegador
+        self.failures = {}
+        self._slots = [self._spawn() for _ in range(min(self.workers, len(pending)))]
+        try:
+            while pending or any(slot['busy'] is not None for slot in self._slots):
+                # Reparte elementos a los procesos con el navegador listo
+                for slot in self._slots:
+                    if slot['ready'] and slot['busy'] is None and pending:
+                        slot['busy'] = pending.popleft()
+                        slot['started'] = time.monotonic()
+                        attempts[slot['busy'][0]] = attempts.get(slot['busy'][0], 0) + 1
+                        slot['tasks'].put(slot['busy'])
+
+                readers = {slot['events']: worker_id for worker_id, slot in enumerate(self._slots)}
+                for events in wait(list(readers), timeout=self.heartbeat_interval):
+                    worker_id = readers[events]
+                    slot = self._slots[worker_id]
+                    try:
+                        kind, item_key, payload = events.recv()
+                    except (EOFError, OSError):
+                        continue  # El proceso ha muerto; lo detecta el watchdog
+                    slot['heartbeat'] = time.monotonic()
+                    if kind == 'ready':
+                        slot['ready'] = True
+                        startup_failures = 0
+                    elif kind in ('done', 'failed') and slot['busy'] is not None and slot['busy'][0] == item_key:
+                        busy = slot['busy']
+                        slot['busy'] = None
+                        slot['processed'] += 1
+                        if kind == 'done':
+                            self.checkpoint.record(item_key, 'done', payload)
+                        elif attempts[item_key] < self.max_attempts:
+                            pending.append(busy)
+                        else:
+                            self._fail(item_key, payload)
+                        if self.max_items_per_worker and slot['processed'] >= self.max_items_per_worker:
+                            self._restart(worker_id, pending, attempts, None)
+
+                # Watchdog: procesos muertos, sin latidos o con el elemento en curso atascado
+                now = time.monotonic()
+                for worker_id, slot in enumerate(self._slots):
+                    if not slot['process'].is_alive():
+                        reason = f"El proceso terminó inesperadamente (código {slot['process'].exitcode})."
+                    elif now - slot['heartbeat'] > self.heartbeat_timeout:
+                        reason = f"Sin latidos durante más de {self.heartbeat_timeout} segundos."
+                    elif (slot['busy'] is not None or not slot['ready']) and now - slot['started'] > self.item_timeout:
+                        reason = f"Elemento sin terminar tras {self.item_timeout} segundos."
+                    else:
+                        continue
+                    print(f"\n\t*** = ***\nError: Proceso {worker_id}: {reason} Se reinicia.")
+                    if not slot['ready']:
+                        startup_failures += 1
+                    self._restart(worker_id, pending, attempts, reason)
+
+                if startup_failures >= self.max_attempts * len(self._slots):
+                    # El navegador no llega a arrancar (driver ausente, perfil erróneo...): no tiene sentido seguir
+                    print(f"\n\t*** = ***\nError: El navegador no arranca tras {startup_failures} intentos. "
+                          f"Se abandonan {len(pending)} elementos pendientes.")
+                    for item_key, item in pending:
+                        self._fail(item_key, "El navegador no arranca.")
+                    pending.clear()
+                    for slot in self._slots:
+                        if slot['busy'] is not None:
+                            self._fail(slot['busy'][0], "El navegador no arranca.")
+                            slot['busy'] = None
+        finally:
+            self.close()
+        return dict(self.checkpoint.results)
+
+    def close(self):
+        """
+        Pide a los procesos que terminen cerrando su navegador y mata los que no lo hagan a tiempo.
+        """
+        for slot in self._slots:
+            self._stop(slot, graceful=True)
+        self._slots = []
+
+
+def _abrir_tabla(browser):
+    browser.open_browser()
+    browser.load_table_snapshot()
+
+
+def _neutrones(browser, elemento):
+    cell = browser.get_cell(elemento, 'Neutrones', 0)
+    return cell.text if cell is not None else None
+
+
+if __name__ == "__main__":
+    from DriverManager.TablaPeriodica import TablaPeriodica
+
+    # Relanzar con el mismo checkpoint solo procesa los elementos que faltan
+    farm = WorkerFarm(_neutrones, 'chrome', workers=2, browser_class=TablaPeriodica, setup=_abrir_tabla,
+                      checkpoint_path='tabla_periodica.checkpoint.jsonl', max_items_per_worker=50)
+    resultados = farm.run(['Hidrógeno', 'Helio', 'Carbono', 'Oxígeno', 'Cloro', 'Hierro', 'Oro'])
+    print(resultados)
+    print(f"Fallidos: {farm.failures}. Reinicios: {farm.restarts}.")
@@ -0,0 +1,59 @@
+"""
+Compara el rendimiento de AsyncBrowserManager con N sesiones concurrentes frente a BrowserManager en serie,
+haciendo login en la página del sitio de pruebas local.
+
+Uso: python -m DriverManager.benchmarks.bench_async [sesiones]
+"""
+import asyncio
+import sys
+import time
+
+from DriverManager.AsyncBrowserManager import AsyncBrowserManager
+from DriverManager.BrowserManager import BrowserManager
+from DriverManager.Credentials import Credentials
+from DriverManager.FixtureServer import FixtureServer
+from DriverManager.LoginPage import LoginPage
+
+t = 0
+
+
+def run_sync(loginpage, sessions):
+    """
+    Arranca, hace login y cierra 'sessions' navegadores uno detrás de otro.
+    """
+    for _ in range(sessions):
+        browser = BrowserManager('chrome')
+        try:
+            browser.login(loginpage, t)
+        finally:
+            browser.close_browser()
+
+
+async def run_async(loginpage, sessions):
+    """
+    Arranca, hace login y cierra 'sessions' navegadores a la vez desde un único event loop.
+    """
+    async def one_session():
+        async with AsyncBrowserManager('chrome', timeout=120) as browser:
+            await browser.login(loginpage, t)
+
+    await asyncio.gather(*(one_session() for _ in range(sessions)))
+
+
+if __name__ == "__main__":
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with FixtureServer() as server:
+        loginpage = LoginPage('FIXTURE', server.url('login.html'), "//*[@id='username']", "//*[@id='password']",
+                              "//*[@id='submit']", Credentials('student', 'Password123'))
+
+        start = time.perf_counter()
+        run_sync(loginpage, sessions)
+        sync_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        asyncio.run(run_async(loginpage, sessions))
+        async_elapsed = time.perf_counter() - start
+
+    print(f"BrowserManager (serie): {sessions} sesiones en {sync_elapsed:.2f} s, {sessions / sync_elapsed:.2f} sesiones/s")
+    print(f"AsyncBrowserManager:    {sessions} sesiones en {async_elapsed:.2f} s, {sessions / async_elapsed:.2f} sesiones/s "
+          f"(x{sync_elapsed / async_elapsed:.2f})")
@@ -0,0 +1,81 @@
+"""
+Compara la memoria y el tiempo de N logins simultáneos contra el sitio de pruebas local:
+    - N navegadores (un BrowserPool de tamaño N), un proceso de navegador por login.
+    - Un único navegador con N pestañas aisladas (BrowserManager.map_contexts()).
+
+La memoria se mide cuando los N logins han terminado y todas las sesiones siguen abiertas.
+Necesita 'psutil' para medir la memoria.
+
+Uso: python -m DriverManager.benchmarks.bench_contexts [logins_simultaneos]
+"""
+import sys
+import threading
+import time
+
+from DriverManager.BrowserManager import BrowserManager
+from DriverManager.BrowserPool import BrowserPool
+from DriverManager.Credentials import Credentials
+from DriverManager.FixtureServer import FixtureServer
+from DriverManager.LoginPage import LoginPage
+from DriverManager.SessionLifecycle import session_rss_mb
+
+t = 0
+
+
+def measure_when_all_logged_in(n, browsers):
+    """
+    Devuelve una barrera para 'n' hilos que, cuando todos han hecho login, suma la memoria de 'browsers'
+    en la lista 'memory'.
+    """
+    memory = []
+
+    def measure():
+        sizes = [session_rss_mb(browser) for browser in browsers]
+        memory.append(None if None in sizes else sum(sizes))
+
+    return threading.Barrier(n, action=measure), memory
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with FixtureServer() as server:
+        loginpage = LoginPage('FIXTURE', server.url('login.html'), "//*[@id='username']", "//*[@id='password']",
+                              "//*[@id='submit']", Credentials('student', 'Password123'))
+
+        start = time.perf_counter()
+        with BrowserPool(['chrome'], size=n, profile='headless') as pool:
+            barrier, memory = measure_when_all_logged_in(n, pool.browsers)
+
+            def login_driver(browser, page):
+                ok = browser.login(page, t)
+                barrier.wait()
+                return ok
+
+            results = pool.map(login_driver, [loginpage] * n)
+        drivers_time = time.perf_counter() - start
+        drivers_memory = memory[0]
+
+        start = time.perf_counter()
+        browser = BrowserManager('chrome', profile='headless')
+        try:
+            barrier, memory = measure_when_all_logged_in(n, [browser])
+
+            def login_context(context, page):
+                ok = context.login(page, t)
+                barrier.wait()
+                return ok and any(cookie['name'] == 'session' for cookie in context.get_cookies())
+
+            context_results = browser.map_contexts(login_context, [loginpage] * n, concurrency=n)
+        finally:
+            browser.close_browser()
+        contexts_time = time.perf_counter() - start
+        contexts_memory = memory[0]
+
+    def show(name, elapsed, rss, ok):
+        per_login = f"{rss / n:.0f} MB/login" if rss is not None else "memoria n/d"
+        print(f"{name:22} {n} logins en {elapsed:.2f} s, {per_login}, correctos {sum(map(bool, ok))}/{n}")
+
+    show(f"{n} navegadores", drivers_time, drivers_memory, results)
+    show(f"1 navegador, {n} pestañas", contexts_time, contexts_memory, context_results)
+    if drivers_memory and contexts_memory:
+        print(f"Memoria por login x{drivers_memory / contexts_memory:.1f} menor con pestañas")
@@ -0,0 +1,53 @@
+"""
+Micro-benchmark del coste de las XPath de búsqueda por texto sobre la tabla grande del sitio de pruebas:
+la XPath anterior construida con f-string, la de LocatorTemplate y la de LocatorTemplate limitada a la tabla.
+
+Uso: python -m DriverManager.benchmarks.bench_locators [filas] [repeticiones]
+"""
+import statistics
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+from DriverManager.BrowserManager import BrowserManager
+from DriverManager.FixtureServer import FixtureServer
+from DriverManager.LocatorTemplate import ROW_BY_TEXT
+
+
+def old_row_xpath(text):
+    """
+    XPath que usaba get_row_by_text() antes de LocatorTemplate.
+    """
+    return f"//tr[td[contains(text(), '{text}') or .//*[contains(text(), '{text}')]] or th[contains(text(), '{text}') or .//*[contains(text(), '{text}')]]]"
+
+
+def measure(browser, xpath, repetitions):
+    """
+    Devuelve la mediana en milisegundos de localizar la XPath con find_element.
+    """
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        browser.driver.find_element(By.XPATH, xpath)
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    text = f"Fila {rows - 1}"  # Una de las últimas filas: el peor caso para un recorrido en orden de documento
+    with FixtureServer() as server:
+        browser = BrowserManager('chrome', profile='headless')
+        try:
+            browser.open_browser(server.url(f'big_table.html?rows={rows}'))
+            candidates = [
+                ('f-string anterior', old_row_xpath(text)),
+                ('LocatorTemplate', ROW_BY_TEXT.render(None, text=text)),
+                ('LocatorTemplate en la tabla', ROW_BY_TEXT.render("//table[@id='big']", text=text))
+            ]
+            for name, xpath in candidates:
+                print(f"{name:30} {measure(browser, xpath, repetitions):8.2f} ms")
+        finally:
+            browser.close_browser()
@@ -0,0 +1,98 @@
+"""
+Mide la memoria por registro del modelo de datos:
+    - LoginPage + Credentials: clases con __dict__ (como eran antes) frente a las actuales con __slots__
+      y selectores compartidos, para N páginas como las de 'login_data.json'.
+    - Textos de una tabla: lista de listas de str frente a TextGrid.
+
+No necesita navegador.
+
+Uso: python -m DriverManager.benchmarks.bench_models [paginas] [filas]
+"""
+import json
+import sys
+import tracemalloc
+
+from DriverManager.LoginPage import LoginPage
+from DriverManager.TableData import TextGrid
+
+
+class DictCredentials:
+    """
+    Credentials con __dict__, como era antes de usar __slots__.
+    """
+    def __init__(self, username, pwd):
+        self.username = username
+        self.pwd = pwd
+
+
+class DictLoginPage:
+    """
+    LoginPage con __dict__, como era antes de usar __slots__.
+    """
+    def __init__(self, id, url, username_selector, pwd_selector, login_button_selector, credentials, profile=None,
+                 request_filter=None):
+        self.id = id
+        self.url = url
+        self.username_selector = username_selector
+        self.pwd_selector = pwd_selector
+        self.login_button_selector = login_button_selector
+        self.credentials = credentials
+        self.profile = profile
+        self.request_filter = request_filter
+
+
+def login_entries(n):
+    """
+    Genera 'n' entradas de 'login_data.json' decodificadas con json, que crea una copia nueva de cada texto
+    aunque se repita entre entradas, como al leer el archivo real.
+    """
+    for i in range(n):
+        yield json.loads(json.dumps({
+            'id': f"PAGE_{i}",
+            'url': f"https://site{i}.example.com/login",
+            'username_selector': "//*[@id='username']",
+            'password_selector': "//*[@id='password']",
+            'login_button_selector': "//*[@id='submit']",
+            'credentials': {'username': f"user{i}", 'password': f"pwd{i}"},
+            'profile': 'headless'
+        }))
+
+
+def table_rows(rows):
+    """
+    Genera 'rows' filas de 4 celdas con textos nuevos, como los que devuelve execute_script.
+    """
+    for i in range(rows):
+        yield [str(i), f"Fila {i}", str(i * 7 % 1000), f"{i / 8:.3f}"]
+
+
+def old_login_page(entry):
+    return DictLoginPage(entry['id'], entry['url'], entry['username_selector'], entry['password_selector'],
+                         entry['login_button_selector'],
+                         DictCredentials(entry['credentials']['username'], entry['credentials']['password']),
+                         entry.get('profile'))
+
+
+def measure(build):
+    """
+    Devuelve los bytes que siguen reservados tras construir el objeto devuelto por 'build()'.
+    """
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    results = [
+        ("LoginPage con __dict__", n, measure(lambda: [old_login_page(entry) for entry in login_entries(n)])),
+        ("LoginPage con __slots__", n, measure(lambda: [LoginPage.from_dict(entry) for entry in login_entries(n)])),
+        ("Filas en listas de str", rows, measure(lambda: list(table_rows(rows)))),
+        ("Filas en TextGrid", rows, measure(lambda: TextGrid(table_rows(rows)))),
+    ]
+    for name, count, size in results:
+        print(f"{name:24} {size / count:8.1f} bytes/registro ({size / 1024 / 1024:.1f} MB en total)")
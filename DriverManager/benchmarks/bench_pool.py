@@ -0,0 +1,42 @@
+"""
+Mide el rendimiento de BrowserPool con distintos tamaños contra el sitio de pruebas local.
+
+Uso: python -m DriverManager.benchmarks.bench_pool [numero_de_logins]
+"""
+import sys
+import time
+
+from DriverManager.BrowserPool import BrowserPool
+from DriverManager.Credentials import Credentials
+from DriverManager.FixtureServer import FixtureServer
+from DriverManager.LoginPage import LoginPage
+
+POOL_SIZES = [1, 2, 4]
+BROWSER_TYPES = ['chrome', 'firefox']
+t = 0
+
+
+def fixture_login_pages(server, n):
+    """
+    Crea 'n' LoginPage que apuntan a la página de login del sitio de pruebas.
+    """
+    return [LoginPage(f"FIXTURE_{i}", server.url('login.html'), "//*[@id='username']", "//*[@id='password']",
+                      "//*[@id='submit']", Credentials('student', 'Password123')) for i in range(n)]
+
+
+if __name__ == "__main__":
+    n_logins = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    with FixtureServer() as server:
+        pages = fixture_login_pages(server, n_logins)
+        base_throughput = None
+        for size in POOL_SIZES:
+            start = time.perf_counter()
+            with BrowserPool(BROWSER_TYPES, size) as pool:
+                startup = time.perf_counter() - start
+                start = time.perf_counter()
+                pool.run_logins(pages, t)
+                elapsed = time.perf_counter() - start
+            throughput = n_logins / elapsed
+            base_throughput = base_throughput or throughput
+            print(f"pool={size}: arranque {startup:.2f} s, {n_logins} logins en {elapsed:.2f} s, "
+                  f"{throughput:.2f} logins/s (x{throughput / base_throughput:.2f})")
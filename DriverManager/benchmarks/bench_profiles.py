@@ -0,0 +1,46 @@
+"""
+Mide el tiempo de arranque y la memoria por sesión de cada perfil de arranque (LaunchProfile)
+abriendo la página de login del sitio de pruebas local.
+
+La memoria se mide como la suma del RSS del navegador y todos sus procesos hijos (ver SessionLifecycle).
+Cada sesión usa su propio driver (shared_service=False) para que el arranque incluya el del driver.
+Necesita 'psutil'; sin él solo se mide el tiempo.
+
+Uso: python -m DriverManager.benchmarks.bench_profiles [repeticiones]
+"""
+import statistics
+import sys
+import time
+
+from DriverManager.BrowserManager import BrowserManager
+from DriverManager.FixtureServer import FixtureServer
+from DriverManager.LaunchProfile import PROFILES
+from DriverManager.SessionLifecycle import session_rss_mb
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+BROWSER_TYPES = ['chrome', 'firefox']
+
+
+if __name__ == "__main__":
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    if psutil is None:
+        print("psutil no está instalado: no se medirá la memoria.")
+    with FixtureServer() as server:
+        for browser_type in BROWSER_TYPES:
+            for name in PROFILES:
+                startups, memories = [], []
+                for _ in range(repetitions):
+                    start = time.perf_counter()
+                    browser = BrowserManager(browser_type, profile=name, shared_service=False)
+                    browser.open_browser(server.url('login.html'))
+                    startups.append(time.perf_counter() - start)
+                    rss = session_rss_mb(browser)
+                    if rss is not None:  # None si no se pudo medir el proceso del navegador
+                        memories.append(rss)
+                    browser.close_browser()
+                memory = f"{statistics.median(memories):.0f} MB" if memories else "n/d"
+                print(f"{browser_type:8} {name:9} arranque {statistics.median(startups):.2f} s, memoria {memory}")
@@ -0,0 +1,43 @@
+"""
+Compara la memoria de una sesión larga de BrowserManager con y sin reciclado del navegador (SessionLifecycle),
+navegando muchas veces por la tabla grande del sitio de pruebas local.
+
+Comprueba también que tras cada reciclado la sesión sigue iniciada (la cookie del login se conserva).
+Necesita 'psutil' para medir la memoria.
+
+Uso: python -m DriverManager.benchmarks.bench_recycling [navegaciones]
+"""
+import sys
+import time
+
+from DriverManager.BrowserManager import BrowserManager
+from DriverManager.Credentials import Credentials
+from DriverManager.FixtureServer import FixtureServer
+from DriverManager.LoginPage import LoginPage
+from DriverManager.SessionLifecycle import SessionLifecycle
+
+t = 0
+
+
+if __name__ == "__main__":
+    navigations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with FixtureServer() as server:
+        loginpage = LoginPage('FIXTURE', server.url('login.html'), "//*[@id='username']", "//*[@id='password']",
+                              "//*[@id='submit']", Credentials('student', 'Password123'))
+        for name, lifecycle in [('sin reciclado', SessionLifecycle(sample_every=25)),
+                                ('con reciclado', SessionLifecycle(max_rss_mb=600, max_navigations=200,
+                                                                   sample_every=25))]:
+            browser = BrowserManager('chrome', profile='headless', lifecycle=lifecycle)
+            try:
+                browser.login(loginpage, t)
+                start = time.perf_counter()
+                for i in range(navigations):
+                    browser.open_browser(server.url(f'big_table.html?rows={1000 + i % 7}'))
+                elapsed = time.perf_counter() - start
+                logged_in = any(cookie['name'] == 'session' for cookie in browser.driver.get_cookies())
+            finally:
+                browser.close_browser()
+            stats = lifecycle.stats()
+            peak = f"{stats['peak_rss_mb']:.0f} MB" if stats['peak_rss_mb'] is not None else "n/d"
+            print(f"{name}: {navigations} navegaciones en {elapsed:.1f} s, pico {peak}, "
+                  f"{stats['recycle_count']} reciclados, sesión conservada: {logged_in}")
@@ -0,0 +1,59 @@
+"""
+Mide el tiempo hasta que la página de login está lista (open_browser() y el botón visible) en una página del sitio
+de pruebas local que carga analítica, anuncios, fuentes e imágenes lentas desde otro host, con y sin RequestFilter.
+
+Casos:
+    - sin filtro: se espera a todos los recursos de terceros.
+    - deny: se bloquean los recursos de 'localhost' (el host "de terceros" del sitio de pruebas) por CDP.
+    - caché en disco: sin bloquear nada, pero cada sesión reutiliza la caché en disco de las anteriores.
+
+Uso: python -m DriverManager.benchmarks.bench_request_filter [repeticiones]
+"""
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from DriverManager.BrowserManager import BrowserManager
+from DriverManager.FixtureServer import FixtureServer
+from DriverManager.RequestFilter import RequestFilter
+
+t = 0
+
+
+def page_ready(server, request_filter, repetitions):
+    """
+    Devuelve la mediana en segundos del tiempo hasta que la página está lista, con una sesión nueva en cada
+    repetición para que solo la caché en disco (y no la de memoria) se conserve entre medidas.
+    """
+    durations = []
+    for _ in range(repetitions):
+        browser = BrowserManager('chrome', profile='headless', request_filter=request_filter)
+        try:
+            start = time.perf_counter()
+            browser.open_browser(server.url('third_party.html?ms=1500'))
+            browser.select_element('css', '#submit', t)
+            durations.append(time.perf_counter() - start)
+        finally:
+            browser.close_browser()
+    return statistics.median(durations)
+
+
+if __name__ == "__main__":
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    cache_dir = tempfile.mkdtemp(prefix='dm_cache_')
+    try:
+        with FixtureServer() as server:
+            cases = [
+                ('sin filtro', None),
+                ('deny localhost', RequestFilter(deny=['*://localhost:*'])),
+                ('caché en disco', RequestFilter(cache_dir=cache_dir))
+            ]
+            base = None
+            for name, request_filter in cases:
+                median = page_ready(server, request_filter, repetitions)
+                base = base or median
+                print(f"{name:16} página lista en {median:.2f} s (x{base / median:.2f})")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
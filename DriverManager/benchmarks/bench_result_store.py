@@ -0,0 +1,51 @@
+"""
+Compara leer la tabla grande del sitio de pruebas entera (extract_table) con refrescarla en la caché de resultados
+(ResultStore) cuando no ha cambiado, cuando cambian unas pocas filas y con la comprobación HTTP previa.
+
+Uso: python -m DriverManager.benchmarks.bench_result_store [filas] [filas_cambiadas]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from DriverManager.BrowserManager import BrowserManager
+from DriverManager.FixtureServer import FixtureServer
+from DriverManager.ResultStore import ResultStore
+
+CHANGE_ROWS_SCRIPT = """
+    var rows = document.querySelector('#big tbody').rows;
+    for (var i = 0; i < arguments[0]; i++) rows[i * 97 % rows.length].cells[2].textContent = 'cambiado ' + i;
+"""
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    changed = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    with FixtureServer() as server, tempfile.TemporaryDirectory() as tmp_dir:
+        store = ResultStore(os.path.join(tmp_dir, 'result_store.sqlite'))
+        browser = BrowserManager('chrome', profile='headless')
+        try:
+            url = server.url(f'big_table.html?rows={rows}')
+            browser.open_browser(url)
+
+            def timed(func, *args):
+                start = time.perf_counter()
+                result = func(*args)
+                return result, time.perf_counter() - start
+
+            _, full_elapsed = timed(browser.extract_table, '#big')
+            first, first_elapsed = timed(store.refresh, browser, 'FIXTURE', '#big')
+            same, same_elapsed = timed(store.refresh, browser, 'FIXTURE', '#big')
+            browser.driver.execute_script(CHANGE_ROWS_SCRIPT, changed)
+            partial, partial_elapsed = timed(store.refresh, browser, 'FIXTURE', '#big')
+            http, http_elapsed = timed(store.check_http, 'FIXTURE', browser.driver.current_url, '#big')
+            assert store.get_cell('FIXTURE', browser.driver.current_url, 'Fila 1', 3) == 'cambiado 0'
+
+            print(f"extract_table:           {rows} filas en {full_elapsed:.3f} s")
+            print(f"Primer refresh:          {first['read_rows']} filas leídas en {first_elapsed:.3f} s")
+            print(f"Refresh sin cambios:     {same['read_rows']} filas leídas en {same_elapsed:.3f} s")
+            print(f"Refresh con {changed} cambios: {partial['read_rows']} filas leídas en {partial_elapsed:.3f} s")
+            print(f"Comprobación HTTP:       '{http}' en {http_elapsed:.3f} s, sin navegador")
+        finally:
+            browser.close_browser()
+            store.close()
@@ -0,0 +1,32 @@
+"""
+Mide el tiempo de arranque de BrowserManager en frío (primera instancia del proceso: búsqueda del driver
+y arranque de chromedriver) y en caliente (siguientes instancias), con y sin servicio compartido.
+
+Uso: python -m DriverManager.benchmarks.bench_startup [instancias]
+"""
+import statistics
+import sys
+import time
+
+from DriverManager.BrowserManager import BrowserManager
+
+
+def measure_startups(instances, shared_service):
+    """
+    Devuelve la duración en segundos del arranque de cada una de las 'instances' instancias.
+    """
+    durations = []
+    for _ in range(instances):
+        start = time.perf_counter()
+        browser = BrowserManager('chrome', profile='headless', shared_service=shared_service)
+        durations.append(time.perf_counter() - start)
+        browser.close_browser()
+    return durations
+
+
+if __name__ == "__main__":
+    instances = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    # La ruta del driver se busca en la primera pasada; el frío de la segunda solo incluye arrancar el servicio
+    for name, shared_service in [('servicio por instancia', False), ('servicio compartido', True)]:
+        durations = measure_startups(instances, shared_service)
+        print(f"{name}: frío {durations[0]:.2f} s, caliente mediana {statistics.median(durations[1:] or durations):.2f} s")
@@ -0,0 +1,38 @@
+"""
+Compara la búsqueda de un lote de etiquetas por XPath (una llamada por etiqueta) frente al índice de textos
+de la página (TextIndex, una llamada para todo el lote) sobre la tabla grande del sitio de pruebas.
+
+Uso: python -m DriverManager.benchmarks.bench_text_index [etiquetas]
+"""
+import sys
+import time
+
+from DriverManager.BrowserManager import BrowserManager
+from DriverManager.FixtureServer import FixtureServer
+
+if __name__ == "__main__":
+    labels = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    texts = [f"Fila {i}" for i in range(1, labels + 1)]
+    with FixtureServer() as server:
+        browser = BrowserManager('chrome', profile='headless')
+        try:
+            browser.open_browser(server.url('big_table.html?rows=10000'))
+
+            start = time.perf_counter()
+            by_xpath = browser.select_elements_by_text(texts, exact=True)
+            xpath_elapsed = time.perf_counter() - start
+
+            index = browser.enable_text_index()
+            start = time.perf_counter()
+            size = index.build()
+            build_elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            by_index = browser.select_elements_by_text(texts, exact=True)
+            index_elapsed = time.perf_counter() - start
+
+            assert sum(e is not None for e in by_xpath) == sum(e is not None for e in by_index)
+            print(f"XPath:  {labels} etiquetas en {xpath_elapsed:.3f} s")
+            print(f"Índice: construcción {build_elapsed:.3f} s ({size} textos), "
+                  f"{labels} etiquetas en {index_elapsed:.3f} s (x{xpath_elapsed / index_elapsed:.0f})")
+        finally:
+            browser.close_browser()
@@ -0,0 +1,45 @@
+"""
+Compara la latencia de BrowserManager.login() con esperas por condición frente a las pausas fijas
+(WaitStrategy(throttle=True)) contra la página de login del sitio de pruebas local.
+
+Uso: python -m DriverManager.benchmarks.bench_waits [repeticiones]
+"""
+import statistics
+import sys
+import time
+
+from DriverManager.BrowserManager import BrowserManager
+from DriverManager.Credentials import Credentials
+from DriverManager.FixtureServer import FixtureServer
+from DriverManager.LoginPage import LoginPage
+from DriverManager.WaitStrategy import WaitStrategy
+
+t = .4  # El mismo valor que usa pruebas.py
+
+
+def measure_login(browser, loginpage, repetitions):
+    """
+    Devuelve la lista de duraciones en segundos de 'repetitions' llamadas a login().
+    """
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        browser.login(loginpage, t)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+if __name__ == "__main__":
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with FixtureServer() as server:
+        loginpage = LoginPage('FIXTURE', server.url('login.html'), "//*[@id='username']", "//*[@id='password']",
+                              "//*[@id='submit']", Credentials('student', 'Password123'))
+        for name, strategy in [('sleep fijo (throttle)', WaitStrategy(throttle=True)),
+                               ('esperas por condición', WaitStrategy())]:
+            browser = BrowserManager('chrome', strategy)
+            try:
+                durations = measure_login(browser, loginpage, repetitions)
+            finally:
+                browser.close_browser()
+            print(f"{name}: mediana {statistics.median(durations):.3f} s, "
+                  f"mín {min(durations):.3f} s, máx {max(durations):.3f} s")
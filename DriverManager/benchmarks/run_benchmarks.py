@@ -0,0 +1,175 @@
+"""
+Suite de benchmarks de BrowserManager contra el sitio de pruebas local (DriverManager/fixture_site).
+
+Mide el arranque, login(), select_element(), get_cell() (con y sin instantánea), select_all_elements()
+sobre una tabla de 10.000 filas, extract_table() de la tabla periódica y el tiempo hasta que una página lenta
+o cargada por AJAX está lista, siempre en navegadores sin ventana.
+
+Los resultados se escriben en JSON. Con --baseline se comparan con un resultado anterior y el proceso
+termina con código 1 si algún caso empeora más del umbral.
+
+Uso:
+    python -m DriverManager.benchmarks.run_benchmarks --output resultados.json
+    python -m DriverManager.benchmarks.run_benchmarks --baseline baseline.json --threshold 0.15
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+import selenium
+
+from DriverManager.BrowserManager import BrowserManager
+from DriverManager.Credentials import Credentials
+from DriverManager.FixtureServer import FixtureServer
+from DriverManager.LoginPage import LoginPage
+
+t = 0
+
+
+def measure(func, repetitions, setup=None):
+    """
+    Ejecuta 'func' 'repetitions' veces y devuelve las estadísticas de duración en segundos.
+
+    :param func: Función a medir, sin argumentos.
+    :param repetitions: Número de repeticiones.
+    :param setup: Función opcional que se ejecuta antes de cada repetición, fuera de la medida.
+
+    :type func: callable
+    :type repetitions: int
+    :type setup: callable or None
+
+    :return: Diccionario con 'median', 'p95', 'min', 'max' y 'runs'.
+    :rtype: dict
+    """
+    durations = []
+    for _ in range(repetitions):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    durations.sort()
+    return {
+        'median': statistics.median(durations),
+        'p95': durations[min(len(durations) - 1, int(round(0.95 * (len(durations) - 1))))],
+        'min': durations[0],
+        'max': durations[-1],
+        'runs': len(durations)
+    }
+
+
+def run_suite(server, browser_type, profile, repetitions):
+    """
+    Ejecuta todos los casos y devuelve un diccionario nombre del caso -> estadísticas.
+    """
+    results = {}
+    loginpage = LoginPage('FIXTURE', server.url('login.html'), "//*[@id='username']", "//*[@id='password']",
+                          "//*[@id='submit']", Credentials('student', 'Password123'))
+
+    def startup():
+        BrowserManager(browser_type, profile=profile).close_browser()
+
+    results['startup'] = measure(startup, repetitions)
+
+    browser = BrowserManager(browser_type, profile=profile)
+    try:
+        results['login'] = measure(lambda: browser.login(loginpage, t), repetitions)
+
+        browser.open_browser(server.url('login.html'))
+        # Sin caché de localizadores para medir la búsqueda real en el DOM
+        results['select_element'] = measure(lambda: browser.select_element('xpath', "//*[@id='submit']", t),
+                                            repetitions, setup=browser.locator_cache.new_navigation)
+
+        browser.open_browser(server.url('periodic_table.html'))
+        results['get_cell'] = measure(lambda: browser.get_cell('Cloro', 'Neutrones', t), repetitions,
+                                      setup=browser.clear_table_snapshot)
+        results['get_cell_snapshot'] = measure(lambda: (browser.load_table_snapshot('#tabla'),
+                                                        browser.get_cell('Cloro', 'Neutrones', t)), repetitions)
+        results['extract_table_periodic'] = measure(lambda: browser.extract_table('#tabla', decimal=','),
+                                                    repetitions)
+
+        browser.open_browser(server.url('big_table.html?rows=10000'))
+        results['select_all_elements_10k'] = measure(lambda: browser.select_all_elements('css', '#big tr'),
+                                                     repetitions)
+
+        def page_ready(path, selector):
+            def run():
+                browser.open_browser(server.url(path))
+                browser.select_element('css', selector, t)
+            return run
+
+        results['page_ready_slow'] = measure(page_ready('slow/login.html?ms=500', '#submit'), repetitions)
+        results['page_ready_ajax'] = measure(page_ready('ajax.html?delay=500', '#submit'), repetitions)
+    finally:
+        browser.close_browser()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compara las medianas con las de la línea base e imprime la variación de cada caso.
+
+    :return: Lista de nombres de los casos que han empeorado más que el umbral.
+    :rtype: list[str]
+    """
+    regressions = []
+    for name, stats in results.items():
+        if name not in baseline:
+            print(f"{name:26} {stats['median'] * 1000:9.1f} ms   (sin línea base)")
+            continue
+        base = baseline[name]['median']
+        ratio = stats['median'] / base if base else float('inf')
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  << REGRESIÓN'
+            regressions.append(name)
+        print(f"{name:26} {stats['median'] * 1000:9.1f} ms   base {base * 1000:9.1f} ms   x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de BrowserManager contra el sitio de pruebas local.")
+    parser.add_argument('--browser', default='chrome', choices=['chrome', 'firefox'])
+    parser.add_argument('--profile', default='headless')
+    parser.add_argument('--repetitions', type=int, default=5)
+    parser.add_argument('--output', default='benchmark_results.json', help="Archivo JSON de resultados.")
+    parser.add_argument('--baseline', default=None, help="Archivo JSON de resultados anterior con el que comparar.")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Empeoramiento relativo de la mediana a partir del cual se considera regresión.")
+    args = parser.parse_args(argv)
+
+    with FixtureServer() as server:
+        results = run_suite(server, args.browser, args.profile, args.repetitions)
+
+    data = {
+        'meta': {
+            'browser': args.browser,
+            'profile': args.profile,
+            'repetitions': args.repetitions,
+            'python': platform.python_version(),
+            'selenium': selenium.__version__,
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'results': results
+    }
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2)
+    print(f"Resultados guardados en {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        if compare(results, baseline, args.threshold):
+            return 1
+    else:
+        for name, stats in results.items():
+            print(f"{name:26} {stats['median'] * 1000:9.1f} ms   p95 {stats['p95'] * 1000:9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Plugin de pytest para pruebas.py: instrumenta los navegadores y al final imprime una tabla con el tiempo
+de cada prueba repartido en órdenes WebDriver, esperas y pausas, junto con reintentos y aciertos de caché.
+
+Opciones:
+    --instrumentation-json=RUTA   Exporta todos los spans y contadores a JSON.
+    --instrumentation-otel=RUTA   Exporta los spans a JSON con formato OTLP de OpenTelemetry.
+    --shard=I/N                   Ejecuta solo la parte I de N de las pruebas, para repartirlas entre máquinas de CI.
+"""
+import pytest
+
+from DriverManager.Instrumentation import Instrumentation
+
+instrumentation_key = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('instrumentation')
+    group.addoption('--instrumentation-json', default=None, help="Exporta los spans de BrowserManager a JSON.")
+    group.addoption('--instrumentation-otel', default=None, help="Exporta los spans de BrowserManager en formato OTLP.")
+    parser.addoption('--shard', default=None, help="Ejecuta solo la parte I de N de las pruebas (forma I/N).")
+
+
+def pytest_collection_modifyitems(config, items):
+    shard = config.getoption('--shard')
+    if not shard:
+        return
+    from DriverManager.MatrixRunner import parse_shard, shard_of  # Importa Selenium; solo si se pide un shard
+    try:
+        shard_index, shard_count = parse_shard(shard)
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+    # El reparto depende solo del nodeid, así que cada prueba cae siempre en el mismo shard
+    selected, deselected = [], []
+    for item in items:
+        (selected if shard_of(item.nodeid, shard_count) == shard_index else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope='session')
+def instrumentation(request):
+    """Fixture con la instrumentación compartida por todos los navegadores de la sesión."""
+    instrumentation = Instrumentation()
+    request.config.stash[instrumentation_key] = instrumentation
+    return instrumentation
+
+
+@pytest.fixture(autouse=True)
+def _instrumentation_current_test(request, instrumentation):
+    """Atribuye a cada prueba los spans registrados mientras se ejecuta."""
+    instrumentation.current_test = request.node.nodeid
+    yield
+    instrumentation.current_test = None
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    instrumentation = config.stash.get(instrumentation_key, None)
+    if instrumentation is None:
+        return
+
+    # Sin navegadores instrumentados (pruebas sin conexión) no hay nada que mostrar
+    summary = {test: result for test, result in instrumentation.summary(by_test=True).items() if test is not None}
+    if summary:
+        terminalreporter.section('instrumentación de BrowserManager')
+        terminalreporter.write_line(f"{'prueba':60} {'acciones':>9} {'órdenes':>8} {'t.órdenes':>10} {'esperas':>9} "
+                                    f"{'pausas':>8} {'reintentos':>10} {'caché':>9}")
+    for test, result in summary.items():
+        terminalreporter.write_line(
+            f"{test[-60:]:60} {result['action_time']:8.2f}s {result['commands']:8d} {result['command_time']:9.2f}s "
+            f"{result['wait_time']:8.2f}s {result['sleep_time']:7.2f}s {result['retries']:10d} "
+            f"{result['cache_hits']:4d}/{result['cache_misses']:<4d}")
+
+    json_path = config.getoption('--instrumentation-json')
+    if json_path:
+        instrumentation.export_json(json_path)
+    otel_path = config.getoption('--instrumentation-otel')
+    if otel_path:
+        instrumentation.export_otel(otel_path)
@@ -0,0 +1 @@
+window.fixtureAds = {slots: 3};
@@ -0,0 +1 @@
+window.fixtureAnalytics = {loaded: Date.now()};
@@ -1,42 +1,44 @@
 import json
 import pytest
 from DriverManager.BrowserManager import BrowserManager
+from DriverManager.BrowserPool import BrowserPool
 from DriverManager.Credentials import Credentials
 from DriverManager.LoginPage import LoginPage
+from DriverManager.LoginPageRegistry import default_registry
+from DriverManager.SessionStore import SessionStore
 
 t=.4
 # Mapeo de navegadores
 browser_mapping = ['chrome', 'firefox']
 # Cargar los datos del login desde el archivo JSON
-pages_mapping = [page.url for page in LoginPage.read_login_data_from_json()]
-
-# @pytest.fixture(scope='function')
-# def browser(request):
-#     """Fixture para inicializar el navegador."""
-#     browser_name = request.param  # El nombre del navegador se pasa como parámetro
-#     browser_instance = BrowserManager(browser_name)
-#     yield browser_instance  # Devuelve la instancia del navegador
-#     browser_instance.close_browser()  # Se ejecuta al final de la prueba
-
-# @pytest.mark.parametrize('browser, page', [(b, p) for b in browser_mapping for p in pages_mapping])
-# def test_open_google(browser, page):
-#
-#     browser = BrowserManager(browser)
-#     browser.open_browser(page)
-#     browser.close_browser()
+pages_mapping = [page.url for page in default_registry]
+
+# La matriz navegador × página (× perfil) se ejecuta en paralelo con MatrixRunner:
+#     python -m DriverManager.MatrixRunner --workers 4 --browsers chrome firefox --scenario open
+
+@pytest.fixture(scope='session')
+def pool(instrumentation):
+    """Fixture con los navegadores arrancados una sola vez para toda la sesión de pruebas."""
+    pool = BrowserPool(['chrome'], instrumentation=instrumentation)  # 'instrumentation' viene de conftest.py
+    yield pool
+    pool.close()  # Se ejecuta al final de la sesión
 
 @pytest.fixture(scope='function')
-def browser():
-    """Fixture para inicializar el navegador."""
-    browser = BrowserManager('chrome')
-    yield browser  # Devuelve la instancia del navegador
-    browser.close_browser()  # Se ejecuta al final de la prueba
+def browser(pool):
+    """Fixture que presta un navegador limpio del pool."""
+    with pool.lease() as browser:
+        yield browser  # Devuelve la instancia del navegador, que se limpia al final de la prueba
+
+@pytest.fixture(scope='session')
+def session_store():
+    """Fixture con el almacén de sesiones compartido por todas las pruebas."""
+    return SessionStore()
 
 @pytest.mark.parametrize('page', pages_mapping)
 def test_open_google(browser, page):
     browser.open_browser(page)
 
-@pytest.mark.parametrize('loginpage', LoginPage.read_login_data_from_json())
+@pytest.mark.parametrize('loginpage', default_registry.all())
 def test_login(browser, loginpage):
     browser.login(loginpage, t)
 
@@ -50,3 +52,7 @@ def test_login_page_by_id(browser):
         browser.login(login_page, t)
     else:
         print(f"Página con id '{page_id}' no encontrada.")
+
+@pytest.mark.parametrize('loginpage', [page for page in default_registry if page.username_selector])
+def test_login_with_session(browser, session_store, loginpage):
+    assert browser.login_with_session(loginpage, session_store, t)
@@ -0,0 +1,115 @@
+import threading
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from DriverManager.BrowserContext import BrowserContext  # noqa: E402
+from DriverManager.BrowserManager import BrowserManager, on_main_window  # noqa: E402
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.switches.append(handle)
+        self.driver.current_window_handle = handle
+
+    def new_window(self, kind):
+        handle = f"tab-{len(self.driver.window_handles)}"
+        self.driver.window_handles.append(handle)
+        self.window(handle)
+
+
+class FakeDriver:
+    """
+    Registra los cambios de ventana, los cierres y las órdenes CDP. Chromedriver usa el id del target como
+    identificador de la ventana.
+    """
+    def __init__(self):
+        self.window_handles = ['main']
+        self.current_window_handle = 'main'
+        self.switch_to = FakeSwitchTo(self)
+        self.switches = []
+        self.closed = []
+        self.cdp = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp.append((command, params))
+        if command == 'Target.createBrowserContext':
+            return {'browserContextId': f"context-{len(self.cdp)}"}
+        if command == 'Target.createTarget':
+            target_id = f"target-{len(self.cdp)}"
+            self.window_handles.append(f"handle-{target_id}")
+            return {'targetId': target_id}
+        return {}
+
+    def close(self):
+        self.closed.append(self.current_window_handle)
+        self.window_handles.remove(self.current_window_handle)
+
+    def execute_script(self, script, *args):
+        return self.current_window_handle
+
+
+def make_browser(browser_type='chrome'):
+    # Sin __init__: no se arranca ningún driver
+    browser = BrowserManager.__new__(BrowserManager)
+    browser.browser_type = browser_type
+    browser.driver = FakeDriver()
+    browser.driver_lock = threading.RLock()
+    browser.main_handle = browser.current_handle = 'main'
+    return browser
+
+
+@on_main_window
+def active_window(browser):
+    return browser.driver.current_window_handle
+
+
+def test_run_switches_only_when_another_window_is_active():
+    browser = make_browser()
+    first, second = browser.new_context(), browser.new_context()
+    assert first.handle == 'handle-target-2' and second.handle == 'handle-target-4'
+    assert first.context_id == 'context-1'
+    assert browser.driver.switches == []
+
+    assert first.execute_script('') == first.handle
+    assert first.execute_script('') == first.handle
+    assert second.execute_script('') == second.handle
+    assert browser.driver.switches == [first.handle, second.handle]
+    assert browser.current_handle == second.handle
+
+
+def test_close_restores_main_window_and_disposes_context():
+    browser = make_browser()
+    context = browser.new_context()
+    context.execute_script('')
+    context.close()
+    assert browser.driver.closed == [context.handle]
+    assert browser.current_handle == browser.main_handle == browser.driver.current_window_handle
+    assert browser.driver.cdp[-1] == ('Target.disposeBrowserContext', {'browserContextId': context.context_id})
+
+
+def test_main_window_methods_switch_back_while_contexts_are_open():
+    browser = make_browser()
+    context = browser.new_context()
+    context.execute_script('')
+    assert active_window(browser) == 'main'
+    assert browser.current_handle == 'main'
+    # La pestaña vuelve a su ventana en su siguiente orden
+    assert context.execute_script('') == context.handle
+    assert active_window(browser) == 'main'
+    assert browser.driver.switches == [context.handle, 'main', context.handle, 'main']
+
+
+def test_firefox_contexts_are_plain_tabs():
+    browser = make_browser('firefox')
+    context = browser.new_context()
+    assert isinstance(context, BrowserContext) and context.context_id is None
+    assert browser.current_handle == context.handle == 'tab-1'
+    assert active_window(browser) == 'main'
+    context.close()
+    assert browser.driver.cdp == []
+    assert browser.current_handle == 'main'
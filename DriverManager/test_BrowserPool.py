@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip('selenium')
+
+from DriverManager.BrowserPool import BrowserPool  # noqa: E402
+
+
+class FakeBrowser:
+    def __init__(self, browser_type):
+        self.browser_type = browser_type
+        self.closed = False
+        self.broken = False
+
+    def reset_session(self):
+        if self.broken:
+            raise RuntimeError('driver colgado')
+
+    def close_browser(self):
+        self.closed = True
+
+
+@pytest.fixture
+def started(monkeypatch):
+    browsers = []
+
+    def new_browser(pool, browser_type):
+        if browser_type == 'roto':
+            raise RuntimeError('no arranca')
+        browsers.append(FakeBrowser(browser_type))
+        return browsers[-1]
+
+    monkeypatch.setattr(BrowserPool, '_new_browser', new_browser)
+    return browsers
+
+
+def test_failed_start_closes_the_browsers_that_started(started):
+    with pytest.raises(RuntimeError):
+        BrowserPool(['chrome', 'roto', 'firefox'])
+    assert len(started) == 2 and all(browser.closed for browser in started)
+
+
+def test_lease_returns_browsers_and_replaces_broken_ones(started):
+    with BrowserPool(['chrome', 'firefox']) as pool:
+        with pool.lease('firefox') as browser:
+            assert browser.browser_type == 'firefox'
+            browser.broken = True
+        assert browser.closed and browser not in pool.browsers
+        assert sorted(b.browser_type for b in pool.browsers) == ['chrome', 'firefox']
+        assert pool.map(lambda browser, item: (browser.browser_type, item), [1, 2], 'chrome') == \
+            [('chrome', 1), ('chrome', 2)]
+        with pytest.raises(ValueError):
+            pool.acquire('edge')
+        first = pool.acquire('chrome')
+        with pytest.raises(TimeoutError):
+            pool.acquire('chrome', timeout=0.05)
+        pool.release(first)
+    assert all(browser.closed for browser in started)
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from DriverManager.FlowEngine import compile_flow  # noqa: E402
+
+PAGE = SimpleNamespace(id='EJEMPLO', url='https://example.com/login', username_selector="//*[@id='username']",
+                       pwd_selector="//*[@id='password']", login_button_selector="//*[@id='submit']",
+                       credentials=SimpleNamespace(username='admin', pwd='secreto'))
+REGISTRY = SimpleNamespace(get=lambda page_id: PAGE if page_id == 'EJEMPLO' else None)
+
+
+def compile_steps(steps, page='EJEMPLO'):
+    return compile_flow({'id': 'PRUEBA', 'page': page, 'steps': steps}, REGISTRY)
+
+
+def test_login_expands_into_navigate_and_one_form():
+    plan = compile_steps([{'action': 'login'}])
+    assert [step.kind for step in plan] == ['navigate', 'form']
+    assert plan[0].params == {'url': PAGE.url}
+    assert plan[1].params == {'fields': [(PAGE.username_selector, 'admin'), (PAGE.pwd_selector, 'secreto')],
+                              'submit': PAGE.login_button_selector, 'selector_type': 'xpath'}
+    assert plan[1].name == 'fill+fill+click'
+
+
+def test_fills_keep_order_and_repeated_selectors():
+    plan = compile_steps([{'action': 'fill', 'selector': 'q', 'value': 'a'},
+                          {'action': 'fill', 'selector': 'r', 'value': '{username}'},
+                          {'action': 'fill', 'selector': 'q', 'value': 'b'}])
+    assert len(plan) == 1 and plan[0].params['fields'] == [('q', 'a'), ('r', 'admin'), ('q', 'b')]
+    assert plan[0].params['submit'] is None
+
+
+def test_form_splits_after_click_and_on_selector_type_change():
+    plan = compile_steps([{'action': 'fill', 'selector': 'a', 'value': '1'},
+                          {'action': 'click', 'selector': 'b'},
+                          {'action': 'fill', 'selector': 'c', 'value': '2'},
+                          {'action': 'fill', 'selector': 'd', 'value': '3', 'selector_type': 'css'}])
+    assert [(step.kind, step.params['selector_type'], len(step.actions)) for step in plan] == \
+        [('form', 'xpath', 2), ('form', 'xpath', 1), ('form', 'css', 1)]
+
+
+def test_consecutive_extracts_are_batched():
+    plan = compile_steps([{'action': 'extract', 'name': 'a', 'selector': '#a', 'selector_type': 'css'},
+                          {'action': 'extract', 'name': 'b', 'selector': '//b', 'all': True},
+                          {'action': 'extract', 'name': 't', 'table': "table.datos", 'decimal': ','},
+                          {'action': 'wait_for', 'url_contains': '/fin'}])
+    assert [step.kind for step in plan] == ['extract', 'extract_table', 'wait_for']
+    assert [spec['name'] for spec in plan[0].params['specs']] == ['a', 'b']
+    assert plan[1].params == {'name': 't', 'selector': 'table.datos', 'header_rows': 1, 'decimal': ','}
+
+
+@pytest.mark.parametrize('steps', [
+    [{'action': 'fill', 'selector': 'q'}],
+    [{'action': 'click'}],
+    [{'action': 'borrar', 'selector': 'q'}],
+    [{'action': 'click', 'selector': 'q', 'selector_type': 'tag'}],
+    [{'action': 'wait_for', 'timeout': 5}],
+    [{'action': 'extract', 'selector': '#a'}],
+    [{'action': 'extract', 'name': 'a'}],
+    [{'action': 'extract', 'name': 't', 'table': '//table'}],
+    [{'action': 'extract', 'name': 't', 'table': 'table', 'selector_type': 'xpath'}],
+])
+def test_invalid_steps_are_rejected(steps):
+    with pytest.raises(ValueError):
+        compile_steps(steps)
+
+
+def test_fill_values_are_written_as_text():
+    plan = compile_steps([{'action': 'fill', 'selector': 'edad', 'value': 5}])
+    assert plan[0].params['fields'] == [('edad', '5')]
+
+
+def test_login_and_navigate_need_a_page():
+    with pytest.raises(ValueError):
+        compile_steps([{'action': 'login'}], page=None)
+    with pytest.raises(ValueError):
+        compile_steps([{'action': 'navigate'}], page=None)
+    with pytest.raises(ValueError):
+        compile_steps([], page='OTRA')
@@ -0,0 +1,51 @@
+import pytest
+
+pytest.importorskip('selenium')
+
+from selenium.common import StaleElementReferenceException  # noqa: E402
+
+from DriverManager.LocatorCache import REVALIDATE_SCRIPT, LocatorCache  # noqa: E402
+
+
+class FakeDriver:
+    def __init__(self):
+        self.matches = True
+        self.stale = False
+
+    def execute_script(self, script, element, selector_type, selector):
+        assert script is REVALIDATE_SCRIPT and element.parent is self
+        if self.stale:
+            raise StaleElementReferenceException('obsoleto')
+        return self.matches
+
+
+class FakeElement:
+    def __init__(self, driver):
+        self.parent = driver
+
+
+def test_hit_only_while_selector_still_matches():
+    driver = FakeDriver()
+    cache = LocatorCache()
+    element = FakeElement(driver)
+    assert cache.get('xpath', '(//tr)[3]') is None
+    cache.put('xpath', '(//tr)[3]', element)
+    assert cache.get('xpath', '(//tr)[3]') is element
+
+    driver.matches = False
+    assert cache.get('xpath', '(//tr)[3]') is None
+    assert cache.get('xpath', '(//tr)[3]') is None
+    assert cache.stats() == {'hits': 1, 'misses': 3, 'evictions': 1, 'entries': 0, 'hit_rate': 0.25}
+
+
+def test_stale_elements_and_navigation_evict():
+    driver = FakeDriver()
+    cache = LocatorCache()
+    cache.put('id', 'a', FakeElement(driver))
+    cache.put('id', 'b', FakeElement(driver))
+    driver.stale = True
+    assert cache.get('id', 'a') is None
+    cache.new_navigation()
+    driver.stale = False
+    assert cache.get('id', 'b') is None
+    assert cache.stats()['evictions'] == 2
@@ -0,0 +1,42 @@
+import re
+
+import pytest
+
+from DriverManager.LocatorTemplate import ELEMENT_BY_TEXT, ROW_BY_TEXT, LocatorTemplate, xpath_literal
+
+
+def literal_value(literal):
+    """
+    Devuelve el texto que representa un literal XPath 1.0 ('...', "..." o concat() de ellos).
+    """
+    match = re.fullmatch(r"concat\((.*)\)", literal)
+    parts = re.findall(r"'[^']*'|\"[^\"]*\"", match.group(1)) if match else [literal]
+    assert match is None or ', '.join(parts) == match.group(1)
+    return ''.join(part[1:-1] for part in parts)
+
+
+@pytest.mark.parametrize('text', ['abc', "l'eau", 'di "hola"', 'a\'b"c', "'", '"\'"', '', "it's \"x\" y 'z'"])
+def test_xpath_literal_round_trip(text):
+    literal = xpath_literal(text)
+    assert literal_value(literal) == text
+
+
+def test_template_escapes_params_and_keeps_scope():
+    assert ELEMENT_BY_TEXT.render(None, text="l'eau") == '//*[contains(text(), "l\'eau")]'
+    assert ROW_BY_TEXT.render("//table[@id='t']", text='Cloro') == \
+        "//table[@id='t']//tr[*[self::td or self::th][.//text()[contains(., 'Cloro')]]]"
+
+
+def test_template_render_is_cached():
+    template = LocatorTemplate("{scope}//a[@title = {title}]")
+    assert template.render(None, title='x') is template.render(None, title='x')
+    assert template.render.cache_info().hits == 1
+
+
+@pytest.mark.parametrize('text', ["l'eau", 'a\'b"c', 'Fila 1'])
+def test_rendered_xpath_finds_text(text):
+    etree = pytest.importorskip('lxml.etree')
+    document = etree.fromstring(f"<table><tr><td>otra</td></tr><tr><td><span>{text}</span></td></tr></table>"
+                                .replace('"', '&quot;'))
+    rows = document.xpath(ROW_BY_TEXT.render(None, text=text))
+    assert len(rows) == 1 and rows[0].findtext('td/span') == text
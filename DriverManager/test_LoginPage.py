@@ -0,0 +1,51 @@
+import pickle
+
+import pytest
+
+from DriverManager.Credentials import Credentials
+from DriverManager.LoginPage import LoginPage
+
+ENTRY = {
+    'id': 'EJEMPLO',
+    'url': 'https://example.com/login',
+    'username_selector': "//*[@id='username']",
+    'password_selector': "//*[@id='password']",
+    'login_button_selector': "//*[@id='submit']",
+    'credentials': {'username': 'admin', 'password': 'password123'},
+    'profile': 'headless',
+    'block': ['*.woff2'],
+    'cache_dir': 'cache'
+}
+
+
+def test_from_dict():
+    page = LoginPage.from_dict(ENTRY)
+    assert (page.id, page.url, page.pwd_selector, page.profile) == \
+        ('EJEMPLO', ENTRY['url'], ENTRY['password_selector'], 'headless')
+    assert (page.credentials.username, page.credentials.pwd) == ('admin', 'password123')
+    assert page.request_filter.deny == ['*.woff2']
+    assert LoginPage.from_dict(dict(ENTRY, id='OTRA')).username_selector is page.username_selector
+    assert LoginPage.from_dict({key: ENTRY[key] for key in list(ENTRY)[:6]}).request_filter is None
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_round_trip(protocol):
+    page = LoginPage.from_dict(ENTRY)
+    copy = pickle.loads(pickle.dumps(page, protocol))
+    assert all(getattr(copy, name) == getattr(page, name)
+               for name in ('id', 'url', 'username_selector', 'pwd_selector', 'login_button_selector', 'profile'))
+    assert (copy.credentials.username, copy.credentials.pwd) == ('admin', 'password123')
+    assert copy.request_filter.cache_dir == page.request_filter.cache_dir
+    with pytest.raises(AttributeError):
+        copy.url = 'https://otra.example.com'
+
+
+@pytest.mark.parametrize('obj, name', [(LoginPage.from_dict(ENTRY), 'url'), (Credentials('a', 'b'), 'pwd')])
+def test_objects_are_immutable_and_slotted(obj, name):
+    with pytest.raises(AttributeError):
+        setattr(obj, name, 'x')
+    with pytest.raises(AttributeError):
+        delattr(obj, name)
+    with pytest.raises(AttributeError):
+        obj.extra = 'x'
+    assert not hasattr(obj, '__dict__')
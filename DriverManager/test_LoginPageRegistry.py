@@ -0,0 +1,80 @@
+import json
+import os
+
+import pytest
+
+from DriverManager.LoginPageRegistry import LoginPageRegistry, iter_login_data
+
+
+def entry(page_id, url="https://example.com/login"):
+    return {
+        'id': page_id,
+        'url': url,
+        'username_selector': "//*[@id='username']",
+        'password_selector': "//*[@id='password']",
+        'login_button_selector': "//*[@id='submit']",
+        'credentials': {'username': 'user', 'password': 'pwd, "con" [corchetes]'}
+    }
+
+
+@pytest.fixture
+def login_data(tmp_path):
+    def write(entries, text=None):
+        path = tmp_path / 'login_data.json'
+        path.write_text(text if text is not None else json.dumps(entries, indent=2), encoding='utf-8')
+        return str(path)
+    return write
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 65536])
+def test_iter_login_data_reads_entries_split_across_chunks(login_data, chunk_size):
+    entries = [entry(f"PAGE_{i}") for i in range(20)]
+    assert list(iter_login_data(login_data(entries), chunk_size)) == entries
+
+
+def test_iter_login_data_empty_array(login_data):
+    assert list(iter_login_data(login_data([]))) == []
+
+
+@pytest.mark.parametrize('text', ['', '{"id": "A"}', '[{"id": "A"}, {"id": '])
+def test_iter_login_data_rejects_invalid_files(login_data, text):
+    with pytest.raises(ValueError):
+        list(iter_login_data(login_data(None, text), chunk_size=4))
+
+
+@pytest.mark.parametrize('chunk_size', range(1, 12))
+def test_iter_login_data_splits_literals_numbers_and_escapes(login_data, chunk_size):
+    entries = [dict(entry("PAGE_\u00e9"), active=True, extra=None, retries=12.5e-1) for _ in range(3)]
+    assert list(iter_login_data(login_data(entries, json.dumps(entries, ensure_ascii=True)), chunk_size)) == entries
+
+
+def test_iter_login_data_stops_at_first_malformed_entry(login_data):
+    valid = json.dumps(entry("A"))
+    text = '[' + valid + ', {"id": "B", "url" "x"}, ' + ', '.join([valid] * 2000) + ']'
+    position = text.index('"x"')
+    entries = iter_login_data(login_data(None, text), chunk_size=64)
+    assert next(entries) == entry("A")
+    with pytest.raises(ValueError, match=rf"no válida \(carácter {position}\)"):
+        next(entries)
+
+
+def test_registry_indexes_by_id_and_host(login_data):
+    registry = LoginPageRegistry(login_data([entry('A', 'https://a.example.com/login'),
+                                             entry('B', 'https://b.example.com/login'),
+                                             entry('C', 'https://a.example.com/admin')]))
+    assert len(registry) == 3
+    assert registry.get('B').url == 'https://b.example.com/login'
+    assert registry.get('X') is None
+    assert [page.id for page in registry.get_by_url('https://a.example.com/otra')] == ['A', 'C']
+    assert [page.id for page in registry.stream()] == ['A', 'B', 'C']
+
+
+def test_registry_reloads_when_file_changes(login_data):
+    path = login_data([entry('A')])
+    registry = LoginPageRegistry(path)
+    assert registry.get('B') is None
+
+    login_data([entry('A'), entry('B')])
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert registry.get('B') is not None
@@ -0,0 +1,87 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from DriverManager import MatrixRunner  # noqa: E402
+from DriverManager.MatrixRunner import (expand_matrix, parse_shard, select_shard, shard_of,  # noqa: E402
+                                        split_for_workers)
+
+
+def page(page_id, profile=None, request_filter=None):
+    return SimpleNamespace(id=page_id, profile=profile, url=f"https://example.com/{page_id}", username_selector=None,
+                           request_filter=request_filter)
+
+
+def test_shard_of_is_stable_and_in_range():
+    assert shard_of('A-chrome-default', 3) == shard_of('A-chrome-default', 3)
+    assert {shard_of(f"case-{i}", 4) for i in range(200)} == {0, 1, 2, 3}
+
+
+@pytest.mark.parametrize('value, expected', [('1/1', (0, 1)), ('2/3', (1, 3)), ('3/3', (2, 3))])
+def test_parse_shard(value, expected):
+    assert parse_shard(value) == expected
+
+
+@pytest.mark.parametrize('value', ['0/3', '4/3', '2', 'a/b', '1/2/3', ''])
+def test_parse_shard_rejects_invalid_values(value):
+    with pytest.raises(ValueError):
+        parse_shard(value)
+
+
+def test_shards_partition_the_matrix():
+    cases = expand_matrix([page(f"P{i}") for i in range(10)], ['chrome', 'firefox'], ['headless', 'debug'])
+    shards = [select_shard(cases, index, 3) for index in range(3)]
+    assert sorted(case['id'] for shard in shards for case in shard) == sorted(case['id'] for case in cases)
+
+
+def test_split_for_workers_groups_by_browser_and_profile():
+    cases = expand_matrix([page('A'), page('B')], ['firefox', 'chrome'], ['headless'])
+    chunks = split_for_workers(cases, 2)
+    assert [[case['id'] for case in chunk] for chunk in chunks] == \
+        [['A-chrome-headless', 'B-chrome-headless'], ['A-firefox-headless', 'B-firefox-headless']]
+    assert split_for_workers(cases, 10) == [[case] for case in sorted(cases, key=lambda c: (c['browser'], c['id']))]
+    assert split_for_workers([], 4) == []
+
+
+def test_expand_matrix_rejects_duplicate_cases():
+    with pytest.raises(ValueError):
+        expand_matrix([page('A'), page('A')], ['chrome'])
+    with pytest.raises(ValueError):
+        expand_matrix([page('A')], ['chrome'], ['headless', 'headless'])
+    with pytest.raises(ValueError):
+        expand_matrix([page('A')], ['chrome'], scenario='otro')
+
+
+def test_run_worker_records_any_exception_and_continues(monkeypatch):
+    class FakePool:
+        def __init__(self, browser_types, profile=None, request_filter=None):
+            self.closed = False
+            pools.append(request_filter)
+
+        @contextmanager
+        def lease(self):
+            yield SimpleNamespace(open_browser=opened.append)
+
+        def close(self):
+            self.closed = True
+
+    def run_case(browser, case, seconds):
+        if case['page'].id == 'A':
+            raise KeyError('fallo inesperado')
+        browser.open_browser(case['page'].url)
+        return True
+
+    opened, pools = [], []
+    monkeypatch.setattr(MatrixRunner, 'BrowserPool', FakePool)
+    monkeypatch.setattr(MatrixRunner, 'run_case', run_case)
+    request_filter = object()
+    results = MatrixRunner.run_worker(expand_matrix([page('A'), page('B'), page('C', request_filter=request_filter)],
+                                                    ['chrome']))
+    assert [(result['id'], result['status']) for result in results] == \
+        [('A-chrome-default', 'error'), ('B-chrome-default', 'passed'), ('C-chrome-default', 'passed')]
+    assert results[0]['error'].startswith('KeyError')
+    assert opened == ['https://example.com/B', 'https://example.com/C']
+    assert pools == [None, request_filter]  # Un pool por filtro de peticiones
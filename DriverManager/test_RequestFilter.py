@@ -0,0 +1,37 @@
+import os
+
+from DriverManager.RequestFilter import RequestFilter
+
+
+def test_no_cache_dir_means_no_slot():
+    assert RequestFilter().acquire_cache_slot() is None
+
+
+def test_concurrent_browsers_get_distinct_cache_slots(tmp_path):
+    request_filter = RequestFilter(cache_dir=str(tmp_path / 'cache'))
+    first, second = request_filter.acquire_cache_slot(), request_filter.acquire_cache_slot()
+    assert [os.path.basename(slot.path) for slot in (first, second)] == ['slot-0', 'slot-1']
+    assert os.path.isdir(first.path) and os.path.isdir(second.path)
+
+    # Un arranque posterior reutiliza el primer subdirectorio libre, con la caché que dejó
+    first.release()
+    first.release()
+    third = request_filter.acquire_cache_slot()
+    assert third.path == first.path
+    third.release()
+    second.release()
+
+
+def test_pac_script_only_when_needed():
+    assert RequestFilter(deny=['*.woff2']).pac_script('chrome') is None
+    assert '"*.woff2"' in RequestFilter(deny=['*.woff2']).pac_script('firefox')
+    assert '"example.com"' in RequestFilter(allow=['example.com']).pac_script('chrome')
+
+
+def test_launch_settings_tell_which_filters_can_be_swapped_in_a_running_browser(tmp_path):
+    # En Chrome 'deny' se cambia por CDP; 'allow', la caché y el 'deny' de Firefox solo al arrancar
+    assert RequestFilter(deny=['*.woff2']).launch_settings('chrome') == (None, None)
+    assert RequestFilter(deny=['*.woff2']).launch_settings('firefox')[0] is not None
+    assert RequestFilter(allow=['example.com']).launch_settings('chrome')[0] is not None
+    cache_dir = str(tmp_path / 'cache')
+    assert RequestFilter(cache_dir=cache_dir).launch_settings('chrome') == (None, (cache_dir, 512))
@@ -0,0 +1,164 @@
+import hashlib
+import json
+import shutil
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from DriverManager.ResultStore import TABLE_HASHES_SCRIPT, TABLE_ROWS_SCRIPT, ResultStore
+
+URL = 'file:///tabla.html'
+
+
+class FakeDriver:
+    """
+    Emula los scripts de ResultStore sobre una tabla en memoria (lista de filas con el texto de sus celdas).
+    """
+    def __init__(self, rows, row_hash=None):
+        self.rows = rows
+        self.current_url = URL
+        self.row_hash = row_hash or (lambda texts: hashlib.sha256('\x01'.join(texts).encode()).hexdigest()[:16])
+        self.read_positions = []
+        self.cookies = []
+
+    def get_cookies(self):
+        return self.cookies
+
+    def execute_script(self, script, selector, arg):
+        if self.rows is None:
+            return None
+        if script is TABLE_HASHES_SCRIPT:
+            header_rows = min(max(arg, 0), len(self.rows))
+            rows = [[self.row_hash(texts), [len(text) for text in texts]] for texts in self.rows]
+            table = hashlib.sha256(json.dumps([header_rows, rows]).encode()).hexdigest()[:16]
+            return {'table': table, 'header_rows': header_rows, 'rows': rows}
+        assert script is TABLE_ROWS_SCRIPT
+        if any(position >= len(self.rows) for position in arg):
+            return None
+        self.read_positions.append(list(arg))
+        return [list(self.rows[position]) for position in arg]
+
+
+class FakeBrowser:
+    def __init__(self, rows, row_hash=None):
+        self.driver = FakeDriver(rows, row_hash)
+
+
+@pytest.fixture
+def store():
+    with ResultStore(':memory:') as store:
+        yield store
+
+
+def test_refresh_reads_only_changed_rows(store):
+    browser = FakeBrowser([['Elemento', 'Z'], ['Hidrógeno', '1'], ['Helio', '2']])
+    assert store.refresh(browser, 'P') == {'status': 'updated', 'rows': 2, 'read_rows': 2, 'removed_rows': 0}
+    assert store.refresh(browser, 'P')['status'] == 'unchanged'
+
+    browser.driver.rows = [['Elemento', 'Z'], ['Litio', '3'], ['Hidrógeno', '1'], ['Helio', '2']]
+    assert store.refresh(browser, 'P') == {'status': 'updated', 'rows': 3, 'read_rows': 1, 'removed_rows': 0}
+    assert browser.driver.read_positions[-1] == [0, 1]
+    assert store.get_cell('P', URL, 'Helio', 'Z') == '2'
+    assert store.get_table('P', URL)['Elemento'] == ['Litio', 'Hidrógeno', 'Helio']
+
+
+def test_text_moved_between_cells_is_not_reused(store):
+    # Huella que colisiona a propósito cuando el texto concatenado de la fila es el mismo
+    browser = FakeBrowser([['Título', 'Otro'], ['ab', 'c']], row_hash=lambda texts: ''.join(texts))
+    store.refresh(browser, 'P')
+    browser.driver.rows = [['Título', 'Otro'], ['a', 'bc']]
+    assert store.refresh(browser, 'P')['read_rows'] == 1
+    assert store.get_cell('P', URL, 'bc', 1) == 'a'
+
+
+def test_header_rows_beyond_table_and_missing_table(store):
+    browser = FakeBrowser([['Único']])
+    assert store.refresh(browser, 'P', header_rows=3)['status'] == 'updated'
+    assert store.get_table('P', URL) is not None
+    assert store.refresh(FakeBrowser(None), 'P', selector='#otra')['status'] == 'missing'
+    assert store.get_cell('X', URL, 'Único', 1) is None
+
+
+def test_invalidate_forgets_tables(store):
+    browser = FakeBrowser([['A', 'B'], ['1', '2']])
+    store.refresh(browser, 'P')
+    store.invalidate('P')
+    assert store.get_cell('P', URL, '1', 'B') is None
+    assert store.refresh(browser, 'P')['read_rows'] == 1
+
+
+def run_hashes_script(rows, header_rows):
+    node = shutil.which('node')
+    if node is None:
+        pytest.skip('node no está instalado')
+    program = f"""
+        var table = {{rows: {json.dumps(rows)}.map(function (texts) {{
+            return {{cells: texts.map(function (text) {{ return {{textContent: text}}; }})}};
+        }})}};
+        var document = {{querySelector: function () {{ return table; }}}};
+        var result = (function () {{ {TABLE_HASHES_SCRIPT} }}).apply(null, ['table', {header_rows}]);
+        console.log(JSON.stringify(result));
+    """
+    return json.loads(subprocess.run([node, '-e', program], capture_output=True, text=True, check=True).stdout)
+
+
+def test_hashes_script_separates_cells_and_bounds_header_rows():
+    result = run_hashes_script([['ab', 'c'], ['a', 'bc'], ['abc'], [' ab ', 'c']], 10)
+    hashes = [row_hash for row_hash, _ in result['rows']]
+    assert len(set(hashes[:3])) == 3 and hashes[0] == hashes[3]
+    assert all(len(row_hash) == 16 for row_hash in hashes)
+    assert [lengths for _, lengths in result['rows']] == [[2, 1], [1, 2], [3], [2, 1]]
+    assert result['header_rows'] == 4
+
+
+class ProtectedPageHandler(BaseHTTPRequestHandler):
+    """
+    '/tabla' solo responde con la sesión iniciada; sin ella redirige a '/login', que tiene sus propios validadores.
+    """
+    def do_HEAD(self):
+        if self.path == '/tabla' and 'sesion=1' not in self.headers.get('Cookie', ''):
+            self.send_response(302)
+            self.send_header('Location', '/login')
+        elif self.path == '/tabla' and self.headers.get('If-None-Match') == '"tabla-1"':
+            self.send_response(304)
+        else:
+            self.send_response(200)
+            self.send_header('ETag', '"tabla-1"' if self.path == '/tabla' else '"login"')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ProtectedPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_validators_need_the_session_and_the_page_itself(server_url):
+    url = f"{server_url}/tabla"
+    session = [{'name': 'sesion', 'value': '1'}]
+    assert ResultStore._http_validators(url) is None
+    assert ResultStore._http_validators(url, cookies=session) == (200, '"tabla-1"', None)
+    assert ResultStore._http_validators(url, '"tabla-1"', cookies=session) == (304, '"tabla-1"', None)
+
+
+def test_refresh_and_check_http_send_browser_cookies(store, server_url):
+    url = f"{server_url}/tabla"
+    browser = FakeBrowser([['A', 'B'], ['1', '2']])
+    browser.driver.current_url = url
+    store.refresh(browser, 'P')
+    assert store.check_http('P', url) == 'unknown'  # Sin la sesión solo se vio el login: no hay validadores
+
+    store.invalidate('P')
+    browser.driver.cookies = [{'name': 'sesion', 'value': '1'}]
+    store.refresh(browser, 'P')
+    assert store.check_http('P', url, cookies=browser.driver.cookies) == 'unchanged'
+    assert store.check_http('P', url) == 'unknown'
+
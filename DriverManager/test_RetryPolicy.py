@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from DriverManager.RetryPolicy import RetryPolicy
+
+
+def test_default_schedule_keeps_original_behaviour():
+    assert RetryPolicy().schedule("//*[@id='x']") == [20, 20]
+
+
+def test_backoff_is_bounded_by_min_and_max_timeout():
+    policy = RetryPolicy(timeout=0.25, retries=4, backoff=4.0, min_timeout=0.5, max_timeout=5)
+    assert policy.schedule('a') == [0.5, 1.0, 4.0, 5]
+    assert RetryPolicy.fast().schedule('a') == [2, 4, 8]
+
+
+def test_selector_budget_overrides_base_timeout():
+    policy = RetryPolicy(timeout=10, retries=2, backoff=2.0, selector_budgets={'lento': 3})
+    assert policy.schedule('lento') == [3, 6]
+    assert policy.schedule('otro') == [10, 20]
+
+
+def test_session_deadline_uses_wall_time_since_session_start():
+    policy = RetryPolicy(timeout=4, retries=3, session_deadline=10)
+    started = time.monotonic()
+    assert policy.schedule('a', session_started=started) == pytest.approx([4, 4, 2], abs=0.1)
+    assert policy.schedule('a', session_started=started - 7) == pytest.approx([3], abs=0.1)
+    assert policy.schedule('a', session_started=started - 11) == []
+    assert policy.schedule('a') == [4, 4, 4]
+
+
+def test_adaptive_timeout_uses_p95_with_margin():
+    policy = RetryPolicy(timeout=20, retries=2, adaptive=True, adaptive_margin=2.0, adaptive_min_samples=5)
+    for elapsed in [0.1, 0.2, 0.3, 0.4]:
+        policy.record('PAGE', elapsed)
+    assert policy.p95('PAGE') is None
+    assert policy.schedule('a', 'PAGE') == [20, 20]
+
+    policy.record('PAGE', 1.5)
+    assert policy.p95('PAGE') == 1.5
+    assert policy.schedule('a', 'PAGE') == [3.0, 20]
+    assert policy.schedule('a', 'OTRA') == [20, 20]
+
+
+def test_adaptive_timeout_is_clamped_and_window_is_bounded():
+    policy = RetryPolicy(timeout=5, retries=1, min_timeout=0.5, adaptive=True, adaptive_min_samples=1,
+                         adaptive_window=3)
+    policy.record('PAGE', 0.01)
+    assert policy.base_timeout('a', 'PAGE') == 0.5
+    for elapsed in [10, 10, 10]:
+        policy.record('PAGE', elapsed)
+    assert policy.p95('PAGE') == 10
+    assert policy.schedule('a', 'PAGE') == [5]
+
+
+def test_adaptive_timeout_keeps_full_last_attempt():
+    # Los demás elementos de la página aparecen enseguida, pero este tarda unos 2 segundos
+    policy = RetryPolicy(timeout=5, retries=3, backoff=1.0, adaptive=True, adaptive_min_samples=1)
+    policy.record('PAGE', 0.01)
+    assert policy.schedule('a', 'PAGE') == [0.5, 0.5, 5]
+    assert RetryPolicy(timeout=5, retries=2, backoff=2.0, adaptive=True, adaptive_min_samples=1,
+                       selector_budgets={'a': 1}).schedule('a', 'PAGE') == [1, 2]
@@ -0,0 +1,102 @@
+import math
+from array import array
+
+import pytest
+
+from DriverManager.TableData import TextGrid, grid_to_columns, parse_number
+
+
+@pytest.mark.parametrize('text, decimal, expected', [
+    ('42', '.', 42),
+    ('-7', '.', -7),
+    ('−7', '.', -7),
+    ('3.25', '.', 3.25),
+    ('1,234', '.', 1234),
+    ('1,234,567.5', '.', 1234567.5),
+    ('35,45', ',', 35.45),
+    ('1.234,5', ',', 1234.5),
+    ('1\xa0234', ',', 1234),
+    (' 12 ', '.', 12),
+])
+def test_parse_number(text, decimal, expected):
+    assert parse_number(text, decimal) == expected
+    assert type(parse_number(text, decimal)) is type(expected)
+
+
+@pytest.mark.parametrize('text, decimal', [
+    ('1,5', '.'),       # la coma no agrupa tres cifras: no es separador de miles
+    ('1,2345', '.'),
+    ('12.5', ','),
+    ('1.5.3', '.'),
+    ('abc', '.'),
+    ('', '.'),
+    ('1 5', '.'),
+])
+def test_parse_number_rejects_ambiguous_text(text, decimal):
+    assert parse_number(text, decimal) is None
+
+
+def test_parse_number_rejects_unknown_decimal():
+    with pytest.raises(ValueError):
+        parse_number('1', ';')
+
+
+def test_grid_to_columns_types_columns():
+    columns = grid_to_columns([['Elemento', 'Número', 'Masa'],
+                               ['Hidrógeno', '1', '1,008'],
+                               ['Cloro', '17', ''],
+                               ['Sodio', '11', '22,99']], decimal=',')
+    assert columns['Elemento'] == ['Hidrógeno', 'Cloro', 'Sodio']
+    assert columns['Número'] == array('q', [1, 17, 11])
+    assert columns['Masa'].typecode == 'd'
+    assert columns['Masa'][0] == 1.008 and math.isnan(columns['Masa'][1]) and columns['Masa'][2] == 22.99
+
+
+def test_grid_to_columns_keeps_integers_beyond_int64_as_text():
+    columns = grid_to_columns([['id', 'n'], ['12345678901234567890', '1'], ['2', '2']])
+    assert columns['id'] == ['12345678901234567890', '2']
+    assert columns['n'] == array('q', [1, 2])
+
+
+def test_grid_to_columns_keeps_ambiguous_separators_as_text():
+    assert grid_to_columns([['v'], ['1,5'], ['2']])['v'] == ['1,5', '2']
+
+
+def test_grid_to_columns_headers():
+    columns = grid_to_columns([['Grupo', 'Grupo', ''],
+                               ['A', 'B', ''],
+                               ['x', 'y']], header_rows=2)
+    assert list(columns) == ['Grupo / A', 'Grupo / B', 'columna_3']
+    assert columns['columna_3'] == ['']
+
+
+ROWS = [['Elemento', 'Z', 'Masa'], ['Hidrógeno', '1'], [], ['', 'Helio', '4,0026']]
+
+
+def test_text_grid_behaves_like_list_of_rows():
+    grid = TextGrid(ROWS)
+    assert len(grid) == 4
+    assert list(grid) == ROWS
+    assert grid[1] == ['Hidrógeno', '1'] and grid[2] == []
+    assert grid[-1] == ROWS[-1] and grid[-4] == ROWS[0]
+    assert grid[1:] == ROWS[1:] and grid[::-2] == ROWS[::-2] and grid[5:] == []
+
+
+@pytest.mark.parametrize('row', [4, -5])
+def test_text_grid_rejects_rows_out_of_range(row):
+    with pytest.raises(IndexError):
+        TextGrid(ROWS)[row]
+
+
+def test_text_grid_cell_and_row_length():
+    grid = TextGrid(ROWS)
+    assert [grid.row_length(row) for row in range(len(grid))] == [3, 2, 0, 3]
+    assert grid.cell(0, 2) == 'Masa' and grid.cell(3, 0) == '' and grid.cell(3, 2) == '4,0026'
+    for row, column in [(1, 2), (2, 0), (0, -1)]:
+        with pytest.raises(IndexError):
+            grid.cell(row, column)
+
+
+def test_text_grid_empty():
+    grid = TextGrid()
+    assert len(grid) == 0 and list(grid) == [] and grid[:] == []
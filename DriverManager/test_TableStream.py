@@ -0,0 +1,132 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from DriverManager.TableStream import FETCH_ROWS_SCRIPT, ROW_COUNT_SCRIPT, TableStream  # noqa: E402
+
+
+class FakeButton:
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+class FakeDriver:
+    """
+    Emula los scripts de TableStream sobre tablas en memoria, una por página (lista de filas de datos).
+    """
+    def __init__(self, pages):
+        self.pages = [list(page) for page in pages]
+        self.page = 0
+
+    def execute_script(self, script, selector, *args):
+        rows = self.pages[self.page]
+        if script is FETCH_ROWS_SCRIPT:
+            start, count, prune = args
+            end = min(start + count, len(rows))
+            out = [list(row) for row in rows[start:end]]
+            if prune:
+                del rows[start:end]
+            return {'rows': out, 'total': len(rows)}
+        if script is ROW_COUNT_SCRIPT:
+            return len(rows)
+        return None
+
+    def find_elements(self, by, selector):
+        # El botón de "siguiente" nunca se deshabilita, ni siquiera en la última página
+        return [FakeButton()]
+
+
+class FakeWaits:
+    timeout = 10
+    quiet_timeout = 0.5
+
+    def __init__(self):
+        self.timeouts = []
+
+    def wait(self, driver, condition, timeout=None):
+        self.timeouts.append(self.timeout if timeout is None else timeout)
+        return bool(condition(driver))
+
+
+class FakeBrowser:
+    def __init__(self, pages):
+        self.driver = FakeDriver(pages)
+        self.waits = FakeWaits()
+        self.clicks = 0
+
+    def click(self, selector_type, selector, seconds):
+        self.clicks += 1
+        self.driver.page = min(self.driver.page + 1, len(self.driver.pages) - 1)
+
+
+def run_fetch_script(rows, foot_rows, start, count, prune):
+    node = shutil.which('node')
+    if node is None:
+        pytest.skip('node no está instalado')
+    program = f"""
+        var rows = {json.dumps(rows)}.map(function (texts) {{
+            var row = {{cells: texts.map(function (text) {{ return {{textContent: text}}; }})}};
+            row.remove = function () {{ table.rows.splice(table.rows.indexOf(row), 1); }};
+            return row;
+        }});
+        var table = {{rows: rows, querySelectorAll: function () {{ return rows.slice(rows.length - {foot_rows}); }}}};
+        var document = {{querySelector: function () {{ return table; }}}};
+        var result = (function () {{ {FETCH_ROWS_SCRIPT} }}).apply(null, ['table', {start}, {count}, {json.dumps(prune)}]);
+        console.log(JSON.stringify(result));
+    """
+    return json.loads(subprocess.run([node, '-e', program], capture_output=True, text=True, check=True).stdout)
+
+
+def test_fetch_script_skips_footer_rows():
+    rows = [['Elemento', 'Z'], ['H', '1'], ['He', '2'], ['Total', '3']]
+    assert run_fetch_script(rows, 1, 1, 10, False) == {'rows': [['H', '1'], ['He', '2']], 'total': 3}
+    assert run_fetch_script(rows, 1, 1, 1, True) == {'rows': [['H', '1']], 'total': 2}
+
+
+def test_chunks_skip_header_rows():
+    browser = FakeBrowser([[['Elemento', 'Z'], ['H', '1'], ['He', '2'], ['Li', '3']]])
+    stream = TableStream(browser, chunk_size=2)
+    assert list(stream.chunks()) == [[('H', '1'), ('He', '2')], [('Li', '3')]]
+    assert stream.header == ('Elemento', 'Z')
+
+
+def test_pagination_stops_when_last_page_does_not_change():
+    pages = [[['Elemento', 'Z'], ['H', '1']], [['Elemento', 'Z'], ['He', '2']]]
+    browser = FakeBrowser(pages)
+    stream = TableStream(browser, next_selector='.next')
+    assert list(stream) == [('H', '1'), ('He', '2')]
+    assert browser.clicks == 2
+    assert browser.waits.timeouts == [FakeWaits.quiet_timeout] * 2
+
+
+def test_max_pages_and_prune():
+    pages = [[['Elemento', 'Z'], ['H', '1'], ['He', '2']], [['Elemento', 'Z'], ['Li', '3']]]
+    browser = FakeBrowser(pages)
+    stream = TableStream(browser, chunk_size=1, prune=True, next_selector='.next', max_pages=1)
+    assert list(stream) == [('H', '1'), ('He', '2')]
+    assert browser.driver.pages[0] == [['Elemento', 'Z']]
+    assert browser.clicks == 0
+
+
+def test_write_jsonl_keeps_cells_of_ragged_rows(tmp_path):
+    browser = FakeBrowser([[['Elemento', 'Z'], ['H', '1', 'gas'], ['He'], ['Li', '3']]])
+    path = tmp_path / 'tabla.jsonl'
+    assert TableStream(browser).write_jsonl(str(path)) == 3
+    records = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert records == [{'Elemento': 'H', 'Z': '1', 'columna_3': 'gas'},
+                       {'Elemento': 'He', 'Z': ''},
+                       {'Elemento': 'Li', 'Z': '3'}]
+
+
+def test_missing_table(capsys):
+    browser = FakeBrowser([[]])
+    browser.driver.execute_script = lambda *args: None
+    assert list(TableStream(browser)) == []
+    assert 'No se encontró ninguna tabla' in capsys.readouterr().out
@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from DriverManager.WaitStrategy import PageSettled  # noqa: E402
+
+
+class FakeDriver:
+    """
+    Devuelve en cada comprobación el siguiente estado de la lista (el último se repite).
+    """
+    def __init__(self, *states):
+        self.states = list(states)
+
+    def execute_script(self, script):
+        state = self.states.pop(0) if len(self.states) > 1 else self.states[0]
+        return dict({'ready': 'complete', 'pending': 0, 'domIdle': 5, 'leaving': False, 'changed': True}, **state)
+
+
+def test_quiet_page_settles_at_once():
+    assert PageSettled(0.3)(FakeDriver({}))
+
+
+def test_waits_while_loading_leaving_or_busy():
+    for state in ({'ready': 'loading'}, {'leaving': True}, {'pending': 1, 'domIdle': 0}):
+        assert not PageSettled(0.3, quiet_timeout=10)(FakeDriver(state))
+
+
+def test_unchanged_page_waits_min_wait_before_settling():
+    condition = PageSettled(0.3, quiet_timeout=10, min_wait=0.05)
+    driver = FakeDriver({'changed': False})
+    assert not condition(driver)
+    time.sleep(0.06)
+    assert condition(driver)
+
+
+def test_busy_page_settles_after_quiet_timeout():
+    condition = PageSettled(0.3, quiet_timeout=0.05)
+    driver = FakeDriver({'pending': 2, 'domIdle': 0})
+    assert not condition(driver)
+    time.sleep(0.06)
+    assert condition(driver)
@@ -0,0 +1,90 @@
+import json
+import os
+import time
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from DriverManager.WorkerFarm import Checkpoint, WorkerFarm  # noqa: E402
+
+
+class FakeBrowser:
+    """
+    Navegador que no arranca nada. Debe estar a nivel de módulo para enviarse a los procesos de trabajo.
+    """
+    def __init__(self, browser_type, profile=None):
+        self.browser_type = browser_type
+
+    def close_browser(self):
+        pass
+
+
+def fake_task(browser, item):
+    """
+    Tarea de prueba. Cada elemento es (nombre, directorio) y deja en 'directorio/nombre' una marca por intento,
+    así que 'crash' y 'hang' solo fallan en su primer intento; 'error' falla siempre.
+    """
+    name, directory = item
+    marker = os.path.join(directory, name)
+    first = not os.path.exists(marker)
+    with open(marker, 'a', encoding='utf-8') as file:
+        file.write('x')
+    if name == 'crash' and first:
+        os._exit(1)
+    if name == 'hang' and first:
+        time.sleep(60)
+    if name == 'error':
+        raise ValueError('fallo de la tarea')
+    return name.upper()
+
+
+def attempts(directory, name):
+    with open(os.path.join(directory, name), encoding='utf-8') as file:
+        return len(file.read())
+
+
+def make_farm(checkpoint_path=None, **kwargs):
+    return WorkerFarm(fake_task, 'chrome', browser_class=FakeBrowser, checkpoint_path=checkpoint_path,
+                      heartbeat_interval=0.1, heartbeat_timeout=10, item_timeout=5, **kwargs)
+
+
+def test_crashing_and_hanging_items_are_retried_in_a_new_process(tmp_path):
+    directory = str(tmp_path)
+    farm = make_farm(workers=2, max_attempts=2)
+    items = [(name, directory) for name in ['uno', 'crash', 'hang', 'dos', 'error']]
+    results = farm.run(items, key=lambda item: item[0])
+
+    assert results == {'uno': 'UNO', 'crash': 'CRASH', 'hang': 'HANG', 'dos': 'DOS'}
+    assert attempts(directory, 'crash') == 2 and attempts(directory, 'hang') == 2
+    assert attempts(directory, 'error') == 2
+    assert farm.failures == {'error': 'ValueError: fallo de la tarea'}
+    assert farm.restarts == 2
+
+
+def test_resume_skips_items_in_checkpoint(tmp_path):
+    directory = str(tmp_path)
+    checkpoint_path = str(tmp_path / 'trabajo.checkpoint.jsonl')
+    first = make_farm(checkpoint_path, workers=1, max_attempts=1)
+    assert first.run([('uno', directory), ('error', directory)], key=lambda item: item[0]) == {'uno': 'UNO'}
+
+    second = make_farm(checkpoint_path, workers=1, max_attempts=1)
+    results = second.run([('uno', directory), ('dos', directory), ('error', directory)], key=lambda item: item[0])
+    assert results == {'uno': 'UNO', 'dos': 'DOS'}
+    assert attempts(directory, 'uno') == 1
+    assert attempts(directory, 'error') == 2  # Los fallidos se vuelven a intentar al reanudar
+
+    with open(checkpoint_path, encoding='utf-8') as file:
+        statuses = [json.loads(line)['status'] for line in file]
+    assert statuses.count('done') == 2 and statuses.count('failed') == 2
+
+
+def test_checkpoint_ignores_truncated_lines(tmp_path):
+    path = tmp_path / 'trabajo.checkpoint.jsonl'
+    path.write_text('{"key": "a", "status": "done", "result": 1}\n{"key": "b", "sta', encoding='utf-8')
+    assert Checkpoint(str(path)).results == {'a': 1}
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        WorkerFarm(fake_task, 'chrome', workers=0)